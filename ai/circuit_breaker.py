@@ -0,0 +1,139 @@
+"""
+AI Call Guards
+--------------
+Keeps a slow or unavailable Groq endpoint from stalling a run.
+
+- CircuitBreaker → stops calling after N consecutive failures,
+                   lets a single trial call through after a cool-down
+- TimeBudget     → budget for the time one run spends waiting on AI calls
+"""
+
+import threading
+import time
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold=3, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._consecutive_failures = 0
+
+        self.successes = 0
+        self.failures = 0
+        self.rejected = 0
+        self.trips = 0
+
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            self._refresh()
+            return self._state
+
+    def allow(self) -> bool:
+        """
+        True if a call may go out now. Rejections are counted.
+        """
+
+        with self._lock:
+            self._refresh()
+
+            if self._state == self.CLOSED:
+                return True
+
+            if self._state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.successes += 1
+            self._consecutive_failures = 0
+            self._trial_in_flight = False
+            self._state = self.CLOSED
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._consecutive_failures += 1
+            self._trial_in_flight = False
+
+            if (
+                self._state == self.HALF_OPEN
+                or self._consecutive_failures >= self.failure_threshold
+            ):
+                if self._state != self.OPEN:
+                    self.trips += 1
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._refresh()
+            return {
+                "breaker_state": self._state,
+                "consecutive_failures": self._consecutive_failures,
+                "successes": self.successes,
+                "failures": self.failures,
+                "rejected": self.rejected,
+                "trips": self.trips
+            }
+
+    def _refresh(self):
+        if (
+            self._state == self.OPEN
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = False
+
+
+class TimeBudget:
+    """
+    Budget for the time spent in AI calls: each call charges its
+    duration, so validation time in between does not count.
+    seconds=None means unlimited.
+    """
+
+    def __init__(self, seconds=None):
+        self.seconds = seconds
+        self.exhausted_calls = 0
+        self.spent = 0.0
+        self._lock = threading.Lock()
+
+    def charge(self, seconds):
+        with self._lock:
+            self.spent += seconds
+
+    def remaining(self):
+        if self.seconds is None:
+            return None
+        return max(0.0, self.seconds - self.spent)
+
+    def exhausted(self) -> bool:
+        remaining = self.remaining()
+        if remaining is not None and remaining <= 0:
+            with self._lock:
+                self.exhausted_calls += 1
+            return True
+        return False
+
+    def stats(self) -> dict:
+        remaining = self.remaining()
+        return {
+            "budget_seconds": self.seconds,
+            "budget_remaining": round(remaining, 3) if remaining is not None else None,
+            "budget_rejected": self.exhausted_calls
+        }
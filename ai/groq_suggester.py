@@ -7,20 +7,74 @@ Supports multiple output modes:
 - json      → structured JSON response
 - csv       → single CSV row
 - txt       → clean readable text
+
+Simple syntax errors are repaired by ai.local_fixer first;
+the Groq API is only called when no local repair is found.
+Successful API responses are cached (ai.suggestion_cache).
+
+HTTP calls share one pooled keep-alive session, retry 429/5xx with
+jittered backoff, and can run concurrently via get_ai_suggestions().
+Set GROQ_API_URL to point the client at another (e.g. stub) endpoint.
+
+A circuit breaker and a per-run time budget (ai.circuit_breaker) make
+the suggester degrade to local results when the endpoint misbehaves;
+see configure_ai_run() and get_ai_stats().
+
+get_ai_suggestions_batched() packs many failing queries into one
+JSON-mode request under a token budget.
 """
 
+import json
 import os
+import random
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
+from ai.local_fixer import get_local_fix, format_suggestion
+from ai.suggestion_cache import get_default_cache
+from ai.circuit_breaker import CircuitBreaker, TimeBudget
+from ai.prompt_context import build_query_context, estimate_tokens
+
 load_dotenv()
 
-GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
+GROQ_API_URL = os.getenv("GROQ_API_URL", "https://api.groq.com/openai/v1/chat/completions")
 MODEL_NAME = "llama-3.3-70b-versatile"
 
+REQUEST_TIMEOUT = 20
+POOL_SIZE = 8
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 8.0
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+BATCH_TOKEN_BUDGET = 6000
+
+FAILURE_THRESHOLD = 3
+BREAKER_RESET_TIMEOUT = 30.0
+
+_session = None
+_session_lock = threading.Lock()
+
+# Set by configure_ai_run() (called once at import, then per run)
+_breaker = None
+_budget = None
+
+_FROM_ENV = object()
+
 
 def get_ai_suggestion(query: str, validation_result: dict, mode="cli") -> dict:
 
+    # Trivial mistakes (typos, missing comma / semicolon) are repaired
+    # locally; the network is only used when that fails.
+    local_result = get_local_fix(query, validation_result, mode)
+    if local_result:
+        return local_result
+
     api_key = os.getenv("GROQ_API_KEY")
 
     if not api_key:
@@ -29,14 +83,67 @@ def get_ai_suggestion(query: str, validation_result: dict, mode="cli") -> dict:
             "ai_message": "No AI suggestions available."
         }
 
-    try:
-        prompt = build_prompt(query, validation_result, mode)
+    cache = get_default_cache()
+    cache_key = cache.make_key(query, validation_result, mode, MODEL_NAME)
 
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
+    cached = cache.get(cache_key)
+    if cached:
+        return cached
+
+    # Degrade immediately instead of waiting on a failing endpoint
+    blocked = _call_blocked()
+    if blocked:
+        return _skipped(blocked)
+
+    suggestion = _complete(build_prompt(query, validation_result, mode), api_key)
+
+    if suggestion is None:
+        return {
+            "ai_status": "error",
+            "ai_message": "No AI suggestions available."
         }
 
+    ai_result = {
+        "ai_status": "success",
+        "ai_message": suggestion.strip()
+    }
+    cache.set(cache_key, ai_result)
+
+    return ai_result
+
+
+def _skipped(reason: str) -> dict:
+    return {
+        "ai_status": "skipped",
+        "ai_message": f"No AI suggestions available ({reason})."
+    }
+
+
+def _call_blocked():
+    """
+    Returns the reason an API call may not go out now, or None.
+    """
+
+    if _budget.exhausted():
+        return "AI time budget exhausted"
+
+    if not _breaker.allow():
+        return "AI service circuit open"
+
+    return None
+
+
+def _complete(prompt: str, api_key: str, json_mode=False):
+    """
+    Run one chat completion and feed the outcome to the circuit breaker.
+    Its duration (retries and backoff included) is charged to the budget.
+
+    Returns:
+        str | None: message content, or None on failure
+    """
+
+    started = time.monotonic()
+    try:
         payload = {
             "model": MODEL_NAME,
             "messages": [
@@ -44,33 +151,347 @@ def get_ai_suggestion(query: str, validation_result: dict, mode="cli") -> dict:
             ],
             "temperature": 0.2
         }
+        if json_mode:
+            payload["response_format"] = {"type": "json_object"}
+
+        response = _post_chat_completion(payload, api_key)
+
+        if response is None or response.status_code != 200:
+            _breaker.record_failure()
+            return None
+
+        data = response.json()
+        content = data["choices"][0]["message"]["content"]
+        _breaker.record_success()
+
+        return content
+
+    except Exception:
+        _breaker.record_failure()
+        return None
+
+    finally:
+        _budget.charge(time.monotonic() - started)
+
+
+def configure_ai_run(
+    budget_seconds=_FROM_ENV,
+    failure_threshold=FAILURE_THRESHOLD,
+    reset_timeout=BREAKER_RESET_TIMEOUT
+):
+    """
+    Reset breaker and budget at the start of a run.
+    budget_seconds=None means no time limit; by default it is read from
+    SQLIDATOR_AI_BUDGET (unset or invalid: no limit).
+    """
+
+    global _breaker, _budget
+
+    if budget_seconds is _FROM_ENV:
+        budget_seconds = _env_budget()
+
+    _breaker = CircuitBreaker(failure_threshold, reset_timeout)
+    _budget = TimeBudget(budget_seconds)
+
+
+def _env_budget():
+    value = os.getenv("SQLIDATOR_AI_BUDGET")
+    if not value:
+        return None
+
+    try:
+        return float(value)
+    except ValueError:
+        warnings.warn(f"Ignoring invalid SQLIDATOR_AI_BUDGET={value!r} (expected seconds)", RuntimeWarning)
+        return None
+
+
+def get_ai_stats() -> dict:
+    """
+    Breaker state, call counts and budget usage for reports.
+    """
+
+    stats = _breaker.stats()
+    stats.update(_budget.stats())
+    return stats
+
+
+def get_ai_suggestions(items, mode="cli", max_workers=POOL_SIZE) -> list:
+    """
+    Fetch suggestions for many (query, validation_result) pairs concurrently.
+
+    Results are returned in input order. Concurrency is bounded by
+    max_workers, which should not exceed the connection pool size.
+    """
+
+    items = list(items)
+
+    if len(items) <= 1 or max_workers <= 1:
+        return [get_ai_suggestion(q, r, mode) for q, r in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(lambda item: get_ai_suggestion(item[0], item[1], mode), items))
+
+
+# ======================================================
+# BATCHED MODE
+# ======================================================
+
+def get_ai_suggestions_batched(
+    items,
+    mode="cli",
+    token_budget=BATCH_TOKEN_BUDGET,
+    max_workers=POOL_SIZE
+) -> list:
+    """
+    Fetch suggestions for many (query, validation_result) pairs using
+    as few requests as possible.
+
+    Failing queries are packed into JSON-mode prompts that stay under
+    token_budget (prompt plus expected answer). The structured answer is
+    split back per query; any item missing or malformed in the answer
+    falls back to a single-query request.
+
+    Results are returned in input order.
+    """
+
+    items = list(items)
+    results = [None] * len(items)
+    pending = []
+
+    api_key = os.getenv("GROQ_API_KEY")
+    cache = get_default_cache()
 
-        response = requests.post(
-            GROQ_API_URL,
-            headers=headers,
-            json=payload,
-            timeout=20
-        )
+    for index, (query, validation_result) in enumerate(items):
+        local_result = get_local_fix(query, validation_result, mode)
+        if local_result:
+            results[index] = local_result
+            continue
 
-        if response.status_code != 200:
-            return {
-                "ai_status": "error",
+        if not api_key:
+            results[index] = {
+                "ai_status": "disabled",
                 "ai_message": "No AI suggestions available."
             }
+            continue
 
-        data = response.json()
-        suggestion = data["choices"][0]["message"]["content"]
+        cached = cache.get(cache.make_key(query, validation_result, mode, MODEL_NAME))
+        if cached:
+            results[index] = cached
+            continue
 
-        return {
-            "ai_status": "success",
-            "ai_message": suggestion.strip()
-        }
+        pending.append(index)
+
+    batches, singles = _pack_batches(items, pending, token_budget)
+
+    def run_batch(batch):
+        for index, ai_result in _run_batch(items, batch, mode, api_key, cache):
+            results[index] = ai_result
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        list(executor.map(run_batch, batches))
+
+    # Over-sized queries and per-item fallbacks use the single-query path
+    fallback = singles + [i for i in pending if results[i] is None]
+    for index, ai_result in zip(
+        fallback,
+        get_ai_suggestions([items[i] for i in fallback], mode, max_workers)
+    ):
+        results[index] = ai_result
+
+    return results
+
+
+def build_batch_prompt(entries: list) -> str:
+    """
+    entries: [{"id": int, "query": str, "error": str}, ...]
+    """
+
+    return f"""
+You are a SQL expert. Fix each failing SQL query below.
+
+Return strictly valid JSON in this exact shape:
+{{"results": [{{"id": <id>, "corrected_query": "<corrected query>", "explanation": "<short 1-2 sentence reason>"}}]}}
+
+Return exactly one result per input id. No markdown.
+
+Queries:
+{json.dumps(entries, ensure_ascii=False)}
+"""
+
+
+def _batch_entry(index, query, validation_result):
+    return {
+        "id": index,
+        "query": build_query_context(query, validation_result.get("position")),
+        "error": validation_result.get("message")
+    }
+
+
+def _pack_batches(items, pending, token_budget):
+    """
+    Greedy packing in input order.
+
+    Returns:
+        tuple: ([batch, ...], [index too large for any batch, ...])
+    """
+
+    overhead = estimate_tokens(build_batch_prompt([]))
+    batches = []
+    singles = []
+    current = []
+    used = overhead
+
+    for index in pending:
+        query, validation_result = items[index]
+        entry_tokens = estimate_tokens(json.dumps(_batch_entry(index, query, validation_result)))
+        # The answer repeats the (corrected) query plus a short explanation
+        cost = entry_tokens * 2 + 40
+
+        if overhead + cost > token_budget:
+            singles.append(index)
+            continue
+
+        if current and used + cost > token_budget:
+            batches.append(current)
+            current = []
+            used = overhead
+
+        current.append(index)
+        used += cost
+
+    if current:
+        batches.append(current)
+
+    return batches, singles
+
+
+def _run_batch(items, batch, mode, api_key, cache):
+    """
+    Yields (index, ai_result) for every item the batch answered correctly.
+    """
+
+    if len(batch) == 1:
+        return
+
+    blocked = _call_blocked()
+    if blocked:
+        for index in batch:
+            yield index, _skipped(blocked)
+        return
 
+    entries = [_batch_entry(i, *items[i]) for i in batch]
+    content = _complete(build_batch_prompt(entries), api_key, json_mode=True)
+
+    answers = {}
+    try:
+        for answer in json.loads(content)["results"]:
+            if isinstance(answer, dict):
+                answers[answer.get("id")] = answer
     except Exception:
-        return {
-            "ai_status": "error",
-            "ai_message": "No AI suggestions available."
+        return
+
+    for index in batch:
+        answer = answers.get(index)
+        if not answer or not isinstance(answer.get("corrected_query"), str):
+            continue
+
+        query, validation_result = items[index]
+        ai_result = {
+            "ai_status": "success",
+            "ai_message": format_suggestion(
+                query,
+                answer["corrected_query"].strip(),
+                str(answer.get("explanation") or "").strip(),
+                mode
+            )
         }
+        cache.set(cache.make_key(query, validation_result, mode, MODEL_NAME), ai_result)
+
+        yield index, ai_result
+
+
+# ======================================================
+# HTTP
+# ======================================================
+
+def get_session() -> requests.Session:
+    """
+    Shared keep-alive session, so repeated calls reuse TCP/TLS connections.
+    """
+
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+
+    return _session
+
+
+def _post_chat_completion(payload: dict, api_key: str, timeout=REQUEST_TIMEOUT):
+    """
+    POST to the chat-completions endpoint, retrying 429/5xx and
+    connection errors with jittered exponential backoff.
+
+    Returns:
+        requests.Response | None: last response (None if every attempt failed to connect)
+    """
+
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json"
+    }
+
+    response = None
+
+    for attempt in range(MAX_RETRIES + 1):
+        # Never let a single attempt outlive the run's AI budget
+        remaining = _budget.remaining()
+        if remaining is not None and remaining <= 0:
+            break
+        attempt_timeout = timeout if remaining is None else min(timeout, remaining)
+
+        try:
+            response = get_session().post(
+                GROQ_API_URL,
+                headers=headers,
+                json=payload,
+                timeout=attempt_timeout
+            )
+        except requests.RequestException:
+            response = None
+
+        if response is not None and response.status_code not in RETRY_STATUS_CODES:
+            return response
+
+        if attempt < MAX_RETRIES:
+            delay = _backoff_delay(attempt, response)
+            remaining = _budget.remaining()
+            if remaining is not None:
+                delay = min(delay, remaining)
+            time.sleep(delay)
+
+    return response
+
+
+def _backoff_delay(attempt, response=None):
+    # Honour an explicit Retry-After from the server
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(float(retry_after), BACKOFF_MAX)
+            except ValueError:
+                pass
+
+    # Full jitter: spread retries of concurrent workers apart
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
 
 
 def build_prompt(query: str, validation_result: dict, mode="cli"):
@@ -78,6 +499,9 @@ def build_prompt(query: str, validation_result: dict, mode="cli"):
     status = validation_result.get("status")
     message = validation_result.get("message")
 
+    # Huge queries are cut down to the region around the error
+    query = build_query_context(query, validation_result.get("position"))
+
     # -------------------------------------
     # CLI MODE (Very Short + Strict Format)
     # -------------------------------------
@@ -95,7 +519,7 @@ Message: {message}
 Respond in STRICT plain text using this exact format:
 
 Your Query:
-{query}
+<the SQL query above, verbatim>
 
 Corrected Version:
 <corrected query>
@@ -183,3 +607,6 @@ Explanation:
 Improvements:
 <bullet style text>
 """
+
+
+configure_ai_run()
@@ -0,0 +1,236 @@
+"""
+Local Rule-Based Fixer
+----------------------
+Repairs trivial syntax errors without calling the Groq API.
+
+Driven by the parser's error state (offending token, expected-token
+set and keyword suggestion). For each error it tries:
+- substituting a misspelled keyword with its suggestion
+- inserting an expected token (",", ";", ")", keywords ...)
+- deleting the offending token
+
+Every candidate is re-validated with the dialect's lexer and parser;
+the first one that parses cleanly wins. Candidates that push the error
+further right are kept, so a query with a few independent mistakes can
+still be repaired.
+
+Returns results in the same shape as ai.groq_suggester.get_ai_suggestion.
+"""
+
+import csv
+import io
+import json
+
+from engine.lexer import Lexer
+from engine.parser import Parser
+from engine.errors import SQLSyntaxError
+from engine.tokens import TokenType, KEYWORDS, UNRESERVED_WORDS
+
+
+MAX_EDITS = 4
+
+# Every candidate is a full lex + parse; longer statements go to the AI
+MAX_QUERY_CHARS = 10_000
+
+# Insertion order for punctuation; keywords follow alphabetically.
+INSERTABLE_SYMBOLS = (";", ",", ")", "(", "=")
+
+# Raw width of tokens whose value excludes their delimiters.
+_QUOTED_TYPES = (TokenType.STRING, TokenType.QUOTED_IDENTIFIER)
+
+
+def get_local_fix(query: str, validation_result: dict, mode="cli") -> dict | None:
+    """
+    Try to repair a failing query locally.
+
+    Returns:
+        dict | None: suggestion result, or None if no local repair was found
+    """
+
+    if validation_result.get("status") != "error":
+        return None
+
+    if validation_result.get("type") != "SyntaxError":
+        return None
+
+    dialect = validation_result.get("dialect") or "postgres"
+
+    repair = repair_query(query, dialect)
+    if repair is None:
+        return None
+
+    corrected, notes = repair
+
+    return {
+        "ai_status": "success",
+        "ai_source": "local",
+        "ai_message": format_suggestion(query, corrected, " ".join(notes), mode)
+    }
+
+
+def repair_query(query: str, dialect: str = "postgres", max_edits: int = MAX_EDITS):
+    """
+    Returns:
+        tuple | None: (corrected_query, [explanation, ...]) or None
+    """
+
+    if len(query) > MAX_QUERY_CHARS:
+        return None
+
+    current = query
+    notes = []
+
+    error = _first_error(current, dialect)
+    if error is None:
+        return None
+
+    for _ in range(max_edits):
+        best = None
+
+        for candidate, note in _candidates(current, error):
+            candidate_error = _first_error(candidate, dialect)
+
+            if candidate_error is None:
+                return candidate, notes + [note]
+
+            if candidate_error.position is None or error.position is None:
+                continue
+
+            # Measure progress in the coordinates of the current query.
+            progress = candidate_error.position - (len(candidate) - len(current))
+
+            if progress > error.position and (best is None or progress > best[0]):
+                best = (progress, candidate, note, candidate_error)
+
+        if best is None:
+            return None
+
+        _, current, note, error = best
+        notes.append(note)
+
+    return None
+
+
+# ======================================================
+# CANDIDATES
+# ======================================================
+
+def _candidates(query, error):
+    position = error.position
+    if position is None:
+        return
+
+    token = error.token
+    value = token.value
+    width = _token_width(token)
+    near = "end of input" if token.type == TokenType.EOF else f'"{value}"'
+
+    # 1. Substitute a misspelled keyword
+    if error.suggestion:
+        yield (
+            query[:position] + error.suggestion + query[position + width:],
+            f'Replaced "{value}" with "{error.suggestion}".'
+        )
+
+    # 2. Insert an expected token
+    if _unterminated(error):
+        quote = "'" if "string" in error.message else '"'
+        body = query.rstrip()
+        if body.endswith(";"):
+            body = body[:-1].rstrip() + quote + ";"
+        else:
+            body += quote
+        yield body, f"Closed the unterminated literal with {quote}."
+
+    for symbol in _insertable(error.expected):
+        if symbol in KEYWORDS or symbol in UNRESERVED_WORDS:
+            yield (
+                query[:position] + symbol + " " + query[position:],
+                f'Inserted "{symbol}" before {near}.'
+            )
+        else:
+            # Attach punctuation to the preceding token: "id INT," not "id INT ,"
+            anchor = len(query[:position].rstrip())
+            yield (
+                query[:anchor] + symbol + query[anchor:],
+                f'Inserted "{symbol}" before {near}.'
+            )
+
+    # 3. Delete the offending token
+    if token.type != TokenType.EOF and width:
+        end = position + width
+        while end < len(query) and query[end] in " \t":
+            end += 1
+        yield query[:position] + query[end:], f"Removed unexpected {near}."
+
+
+def _insertable(expected):
+    if not expected:
+        return []
+
+    symbols = [s for s in INSERTABLE_SYMBOLS if s in expected]
+    keywords = sorted(s for s in expected if s in KEYWORDS)
+    return symbols + keywords
+
+
+def _token_width(token):
+    if token.type == TokenType.EOF or token.value is None:
+        return 0
+    if token.type in _QUOTED_TYPES:
+        return len(token.value) + 2
+    return len(str(token.value))
+
+
+def _unterminated(error):
+    return error.message.startswith("Unterminated") and "comment" not in error.message
+
+
+def _first_error(query, dialect):
+    try:
+        tokens = Lexer(query, dialect).tokenize()
+        Parser(tokens, query, dialect).parse()
+        return None
+    except SQLSyntaxError as e:
+        return e
+
+
+# ======================================================
+# OUTPUT FORMATTING
+# ======================================================
+
+def format_suggestion(query: str, corrected: str, explanation: str, mode="cli") -> str:
+    """
+    Render a correction using the same layout the AI prompts ask for.
+    """
+
+    if mode == "json":
+        return json.dumps({
+            "original_query": query,
+            "corrected_query": corrected,
+            "explanation": explanation,
+            "improvements": []
+        }, indent=4)
+
+    if mode == "csv":
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(["original_query", "corrected_query", "short_explanation"])
+        writer.writerow([query, corrected, explanation])
+        return output.getvalue().strip()
+
+    if mode == "markdown":
+        return (
+            f"**Explanation**\n\n{explanation}\n\n"
+            f"**Corrected Version**\n\n```sql\n{corrected}\n```"
+        )
+
+    text = (
+        f"Your Query:\n{query}\n\n"
+        f"Corrected Version:\n{corrected}\n\n"
+        f"Explanation:\n{explanation}"
+    )
+
+    if mode == "cli":
+        return text
+
+    return text + "\n\nImprovements:\n- None"
@@ -0,0 +1,209 @@
+"""
+AI Enrichment Pipeline
+----------------------
+Decouples validation from AI suggestions.
+
+    validation loop ──submit()──▶ bounded queue ──▶ worker threads
+          ▲                                              │
+          └──────── ready() / drain() ◀── results ◀──────┘
+
+- Validation keeps running while workers wait on the network.
+- Only results that need a suggestion (syntax failures, by default) are
+  queued; the rest complete immediately. Unreadable files (FileError,
+  empty query) never reach the AI.
+- Completed items are handed back in submission order, so output and
+  reports stay deterministic.
+- submit() blocks once `max_pending` items are in flight, keeping
+  memory bounded on huge inputs.
+
+Total wall time approaches max(validation, AI) instead of their sum.
+"""
+
+import queue
+import threading
+
+
+_STOP = object()
+
+
+def needs_suggestion(query: str, result: dict) -> bool:
+    """
+    Default selection: failed statements, not unreadable files.
+    """
+
+    return bool(query.strip()) and _needs_suggestion(result)
+
+
+def _needs_suggestion(result: dict) -> bool:
+    return result.get("status") == "error" and result.get("type") != "FileError"
+
+
+class SuggestionPipeline:
+    def __init__(
+        self,
+        fetch,
+        mode="cli",
+        workers=4,
+        max_pending=64,
+        fetch_batch=None,
+        batch_size=1,
+        needs_ai=_needs_suggestion
+    ):
+        """
+        Parameters:
+            fetch (callable): fetch(query, result, mode) -> ai_result
+            mode (str): prompt / output mode passed to fetch
+            workers (int): number of worker threads
+            max_pending (int): max submitted-but-not-yet-delivered items
+            fetch_batch (callable | None): fetch_batch([(query, result), ...], mode) -> [ai_result, ...]
+            batch_size (int): items a worker hands to fetch_batch at once
+            needs_ai (callable): predicate selecting results that get a suggestion
+        """
+
+        self.fetch = fetch
+        self.mode = mode
+        self.max_pending = max(1, max_pending)
+        self.fetch_batch = fetch_batch
+        self.batch_size = max(1, batch_size)
+        self.needs_ai = needs_ai
+
+        self._work = queue.Queue(maxsize=self.max_pending)
+        self._slots = {}          # seq -> [query, result, ai_result, done]
+        self._next_seq = 0        # next sequence number to hand out
+        self._next_emit = 0       # next sequence number to deliver
+        self._cond = threading.Condition()
+        self._closed = False
+
+        self._threads = [
+            threading.Thread(target=self._worker, daemon=True)
+            for _ in range(max(1, workers))
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    # ======================================================
+    # PRODUCER SIDE
+    # ======================================================
+
+    def submit(self, query: str, result: dict) -> int:
+        """
+        Queue a validated query. Returns its sequence number.
+        """
+
+        with self._cond:
+            # Back-pressure: wait while too much is in flight, unless the
+            # oldest item is already done and the caller can drain it.
+            while (
+                self._next_seq - self._next_emit >= self.max_pending
+                and not self._head_done()
+            ):
+                self._cond.wait()
+
+            seq = self._next_seq
+            self._next_seq += 1
+            needs_ai = bool(query.strip()) and self.needs_ai(result)
+            self._slots[seq] = [query, result, None, not needs_ai]
+
+        if needs_ai:
+            self._work.put(seq)
+
+        return seq
+
+    # ======================================================
+    # CONSUMER SIDE
+    # ======================================================
+
+    def ready(self):
+        """
+        Yield (seq, query, result, ai_result) for every item that is
+        complete, in order, without blocking.
+        """
+
+        while True:
+            with self._cond:
+                if not self._head_done():
+                    return
+                item = self._pop_head()
+            yield item
+
+    def drain(self):
+        """
+        Block until everything submitted has completed; yield the rest in order.
+        """
+
+        while True:
+            with self._cond:
+                if self._next_emit >= self._next_seq:
+                    break
+                while not self._head_done():
+                    self._cond.wait()
+                item = self._pop_head()
+            yield item
+
+        self.close()
+
+    def close(self):
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+
+        for _ in self._threads:
+            self._work.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+
+    # ======================================================
+    # INTERNALS
+    # ======================================================
+
+    def _head_done(self):
+        slot = self._slots.get(self._next_emit)
+        return slot is not None and slot[3]
+
+    def _pop_head(self):
+        seq = self._next_emit
+        query, result, ai_result, _ = self._slots.pop(seq)
+        self._next_emit += 1
+        self._cond.notify_all()
+        return seq, query, result, ai_result
+
+    def _worker(self):
+        while True:
+            seq = self._work.get()
+            if seq is _STOP:
+                return
+
+            batch = [seq]
+            if self.fetch_batch is not None:
+                while len(batch) < self.batch_size:
+                    try:
+                        extra = self._work.get_nowait()
+                    except queue.Empty:
+                        break
+                    if extra is _STOP:
+                        # Put the sentinel back for this worker's next loop
+                        self._work.put(_STOP)
+                        break
+                    batch.append(extra)
+
+            with self._cond:
+                items = [(self._slots[s][0], self._slots[s][1]) for s in batch]
+
+            try:
+                if len(batch) > 1:
+                    ai_results = self.fetch_batch(items, self.mode)
+                else:
+                    ai_results = [self.fetch(items[0][0], items[0][1], self.mode)]
+            except Exception:
+                ai_results = []
+
+            ai_results = list(ai_results)[:len(batch)]
+            ai_results += [None] * (len(batch) - len(ai_results))
+
+            with self._cond:
+                for s, ai_result in zip(batch, ai_results):
+                    slot = self._slots[s]
+                    slot[2] = ai_result
+                    slot[3] = True
+                self._cond.notify_all()
@@ -0,0 +1,198 @@
+"""
+Prompt Context Builder
+----------------------
+Keeps huge queries from being pasted into AI prompts verbatim.
+
+When a query is over the token budget:
+1. bulk VALUES lists are summarized (first/last rows plus the row
+   containing the error are kept, the rest become a comment)
+2. the text is cut to a window around the error offset
+
+Results are memoized, so the CLI print pass, report pass and batched
+prompts share one context window per query. The memo is keyed on a
+digest of the query, not the query itself, so multi-megabyte statements
+are not kept alive by the cache.
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+
+
+PROMPT_QUERY_TOKENS = 1500
+
+KEEP_HEAD_ROWS = 3
+KEEP_TAIL_ROWS = 1
+
+CONTEXT_CACHE_SIZE = 256
+
+_context_cache = OrderedDict()     # (digest, position, max_tokens) -> window
+_context_lock = threading.Lock()   # pipeline / batch workers build prompts concurrently
+
+_VALUES = re.compile(r"\bVALUES\b", re.IGNORECASE)
+_ROW = re.compile(r"\s*(\((?:[^()']|'(?:[^']|'')*')*\))\s*(,)?")
+
+
+def estimate_tokens(text: str) -> int:
+    # ~4 characters per token for English / SQL text
+    return len(text) // 4 + 1
+
+
+def build_query_context(query: str, position=None, max_tokens=PROMPT_QUERY_TOKENS) -> str:
+    """
+    Return the query, or a shortened view of it that fits max_tokens.
+
+    Parameters:
+        query (str): full SQL text
+        position (int | None): error offset (SQLSyntaxError.position)
+        max_tokens (int): token budget for the query text
+    """
+
+    if estimate_tokens(query) <= max_tokens:
+        return query
+
+    key = (hashlib.sha1(query.encode("utf-8")).digest(), position, max_tokens)
+    with _context_lock:
+        context = _context_cache.get(key)
+        if context is not None:
+            _context_cache.move_to_end(key)
+            return context
+
+    # Built outside the lock; two threads may race to store the same window
+    context = _build_query_context(query, position, max_tokens)
+
+    with _context_lock:
+        _context_cache[key] = context
+        if len(_context_cache) > CONTEXT_CACHE_SIZE:
+            _context_cache.popitem(last=False)
+
+    return context
+
+
+def _build_query_context(query, position, max_tokens):
+    text, position = summarize_values(query, position)
+
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    return _window(text, position, max_tokens * 4)
+
+
+# ======================================================
+# VALUES SUMMARY
+# ======================================================
+
+def summarize_values(query: str, position=None):
+    """
+    Collapse long `VALUES (...), (...), ...` lists.
+
+    Returns:
+        tuple: (summarized_query, error position in the summarized text)
+    """
+
+    pieces = []         # kept text, in order
+    new_position = None
+    cursor = 0
+
+    for match in _VALUES.finditer(query):
+        if match.start() < cursor:
+            continue
+
+        rows = _scan_rows(query, match.end())
+        if len(rows) <= KEEP_HEAD_ROWS + KEEP_TAIL_ROWS + 1:
+            continue
+
+        keep = set(range(KEEP_HEAD_ROWS)) | set(range(len(rows) - KEEP_TAIL_ROWS, len(rows)))
+        if position is not None:
+            for i, (start, end) in enumerate(rows):
+                if start <= position < end:
+                    keep.add(i)
+
+        pieces.append((cursor, rows[0][0]))
+        cursor = rows[0][0]
+
+        skipped = 0
+        for i, (start, end) in enumerate(rows):
+            if i in keep:
+                if skipped:
+                    pieces.append(f"\n  /* ... {skipped:,} more rows ... */\n  ")
+                    skipped = 0
+                pieces.append((start, end))
+            else:
+                skipped += 1
+
+        cursor = rows[-1][1]
+
+    if not pieces:
+        return query, position
+
+    pieces.append((cursor, len(query)))
+
+    parts = []
+    length = 0
+    for piece in pieces:
+        if isinstance(piece, str):
+            parts.append(piece)
+            length += len(piece)
+            continue
+
+        start, end = piece
+        if position is not None and new_position is None and start <= position < end:
+            new_position = length + (position - start)
+        parts.append(query[start:end])
+        length += end - start
+
+    if new_position is None and position is not None:
+        new_position = min(position, length)
+
+    return "".join(parts), new_position
+
+
+def _scan_rows(query, offset):
+    """
+    Returns [(start, end), ...] spans of consecutive value tuples,
+    each span including its trailing comma.
+    """
+
+    rows = []
+
+    while True:
+        match = _ROW.match(query, offset)
+        if not match:
+            break
+
+        rows.append((match.start(1), match.end()))
+        offset = match.end()
+
+        if not match.group(2):
+            break
+
+    return rows
+
+
+# ======================================================
+# ERROR WINDOW
+# ======================================================
+
+def _window(text, position, max_chars):
+    if position is None:
+        position = 0
+
+    # Two thirds of the budget before the error, one third after
+    start = max(0, position - (max_chars * 2) // 3)
+    end = min(len(text), start + max_chars)
+    start = max(0, end - max_chars)
+
+    # Prefer cutting on line boundaries
+    line_start = text.rfind("\n", start, position)
+    if line_start != -1 and line_start - start < max_chars // 4:
+        start = line_start + 1
+    line_end = text.find("\n", max(position, end - max_chars // 4), end)
+    if line_end != -1:
+        end = line_end
+
+    head = f"/* ... {start:,} characters omitted ... */\n" if start > 0 else ""
+    tail = f"\n/* ... {len(text) - end:,} characters omitted ... */" if end < len(text) else ""
+
+    return head + text[start:end] + tail
@@ -0,0 +1,212 @@
+"""
+AI Suggestion Cache
+-------------------
+Two-level cache for Groq suggestions:
+- in-memory LRU (per process)
+- on-disk JSON entries (shared across runs)
+
+Entries are keyed by (exact query text, validation message, mode, model)
+and expire after a TTL. Expired disk entries are deleted when a cache is
+opened, at most once per PRUNE_INTERVAL.
+
+Environment:
+- SQLIDATOR_CACHE_DIR        → cache directory (default ~/.cache/sqlidator)
+- SQLIDATOR_AI_CACHE_TTL     → TTL in seconds (default 7 days, 0 disables caching)
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import warnings
+from collections import OrderedDict
+
+
+DEFAULT_TTL = 7 * 24 * 60 * 60
+DEFAULT_MAX_ENTRIES = 1024
+PRUNE_INTERVAL = 24 * 60 * 60
+
+
+class SuggestionCache:
+    def __init__(self, directory=None, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+        if directory and ttl:
+            self._prune_disk()
+
+    # ======================================================
+    # KEYS
+    # ======================================================
+
+    @staticmethod
+    def make_key(query: str, validation_result: dict, mode: str, model: str) -> str:
+        # The exact text: the suggestion echoes the query back verbatim,
+        # so even a whitespace or case change needs its own answer
+        parts = [
+            query,
+            str(validation_result.get("message")),
+            mode,
+            model
+        ]
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+    # ======================================================
+    # LOOKUP
+    # ======================================================
+
+    def get(self, key: str):
+        if not self.ttl:
+            return None
+
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created, value = entry
+                if now - created <= self.ttl:
+                    self._memory.move_to_end(key)
+                    return value
+                del self._memory[key]
+
+        entry = self._read_disk(key)
+        if entry is None:
+            return None
+
+        created, value = entry
+        if now - created > self.ttl:
+            self._remove_disk(key)
+            return None
+
+        self._remember(key, created, value)
+        return value
+
+    def set(self, key: str, value: dict):
+        if not self.ttl:
+            return
+
+        created = time.time()
+        self._remember(key, created, value)
+        self._write_disk(key, created, value)
+
+    # ======================================================
+    # MEMORY
+    # ======================================================
+
+    def _remember(self, key, created, value):
+        with self._lock:
+            self._memory[key] = (created, value)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    # ======================================================
+    # DISK
+    # ======================================================
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def _read_disk(self, key):
+        if not self.directory:
+            return None
+
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data["created"], data["value"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_disk(self, key, created, value):
+        if not self.directory:
+            return
+
+        path = self._path(key)
+
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        except OSError:
+            # The cache is an optimization; never fail the caller over it
+            return
+
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"created": created, "value": value}, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def _remove_disk(self, key):
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def _prune_disk(self):
+        # Entries are written once, so a file's mtime is its creation time.
+        # The marker's mtime records the last pass.
+        marker = os.path.join(self.directory, ".pruned")
+        now = time.time()
+
+        try:
+            if now - os.path.getmtime(marker) < PRUNE_INTERVAL:
+                return
+        except OSError:
+            pass
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(marker, "w", encoding="utf-8"):
+                pass
+        except OSError:
+            return
+
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                # Temp files left by interrupted writes expire the same way
+                if not name.endswith((".json", ".tmp")):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    if now - os.path.getmtime(path) > self.ttl:
+                        os.remove(path)
+                except OSError:
+                    pass
+
+
+_default_cache = None
+
+
+def get_default_cache() -> SuggestionCache:
+    global _default_cache
+
+    if _default_cache is None:
+        directory = os.getenv("SQLIDATOR_CACHE_DIR") or os.path.join(
+            os.path.expanduser("~"), ".cache", "sqlidator"
+        )
+        _default_cache = SuggestionCache(os.path.join(directory, "ai"), ttl=_env_ttl())
+
+    return _default_cache
+
+
+def _env_ttl():
+    value = os.getenv("SQLIDATOR_AI_CACHE_TTL")
+    if not value:
+        return DEFAULT_TTL
+
+    try:
+        return int(value)
+    except ValueError:
+        warnings.warn(f"Ignoring invalid SQLIDATOR_AI_CACHE_TTL={value!r} (expected seconds)", RuntimeWarning)
+        return DEFAULT_TTL
@@ -0,0 +1,64 @@
+"""
+CLI Output Benchmark
+--------------------
+End-to-end statements/sec of `ui/cli.py --file` for each stdout format.
+
+Usage:
+    python benchmarks/bench_cli_output.py [statements]
+
+Each run is a fresh interpreter with stdout sent to /dev/null, so the
+numbers include startup, splitting, validation and output formatting.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+CLI = os.path.join(ROOT, "ui", "cli.py")
+
+QUERIES = [
+    "SELECT id, name FROM users WHERE id = {n} AND active = 1 ORDER BY name;",
+    "INSERT INTO logs (id, msg) VALUES ({n}, 'entry {n}');",
+    "UPDATE accounts SET balance = {n} WHERE id = {n};",
+    "SELEC name FROM users WHERE id = {n};",
+    "CREATE TABLE t{n} (id INT PRIMARY KEY, name VARCHAR(40));"
+]
+
+RUNS = [
+    ("text", []),
+    ("jsonl", ["--format", "jsonl"]),
+    ("jsonl + ast", ["--format", "jsonl", "--show-ast"]),
+    ("quiet", ["--format", "quiet"]),
+    ("summary", ["--format", "summary"])
+]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.sql")
+        with open(path, "w", encoding="utf-8") as f:
+            for n in range(count):
+                f.write(QUERIES[n % len(QUERIES)].format(n=n) + "\n")
+
+        print(f"statements: {count:,}")
+
+        for name, extra in RUNS:
+            start = time.perf_counter()
+            subprocess.run(
+                [sys.executable, CLI, "--file", path] + extra,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=True
+            )
+            seconds = time.perf_counter() - start
+            print(f"{name:<12}: {count / seconds:>10,.0f} stmts/s ({seconds:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
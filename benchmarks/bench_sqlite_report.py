@@ -0,0 +1,65 @@
+"""
+SQLite Report Sink Benchmark
+----------------------------
+Compares validator throughput with SQLite sink insert throughput.
+
+Usage:
+    python benchmarks/bench_sqlite_report.py [statements]
+
+The sink "keeps up" when its rows/s exceeds the validator's
+statements/s, i.e. writing the report never becomes the bottleneck.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from engine.validator import validate_query
+from reports.records import build_record
+from reports.sqlite_report import SqliteReportWriter
+
+
+QUERIES = [
+    "SELECT id, name FROM users WHERE id = {n};",
+    "INSERT INTO logs (id, msg) VALUES ({n}, 'entry {n}');",
+    "UPDATE accounts SET balance = {n} WHERE id = {n};",
+    "SELEC name FROM users WHERE id = {n};",
+    "DELETE FROM sessions WHERE id = {n};"
+]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    queries = [QUERIES[n % len(QUERIES)].format(n=n) for n in range(count)]
+
+    start = time.perf_counter()
+    records = [
+        build_record(idx, query, validate_query(query, "postgres"))
+        for idx, query in enumerate(queries, 1)
+    ]
+    validate_seconds = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.db")
+
+        start = time.perf_counter()
+        writer = SqliteReportWriter(path)
+        for record in records:
+            writer.write(record)
+        writer.close()
+        sink_seconds = time.perf_counter() - start
+
+        size = os.path.getsize(path)
+
+    print(f"statements        : {count:,}")
+    print(f"validator         : {count / validate_seconds:,.0f} stmts/s ({validate_seconds:.2f}s)")
+    print(f"sqlite sink       : {count / sink_seconds:,.0f} rows/s ({sink_seconds:.2f}s)")
+    print(f"database size     : {size / 1024 / 1024:.1f} MB")
+    print(f"sink / validator  : {validate_seconds / sink_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+CLI Startup Benchmark
+---------------------
+Checks that a cold `--query` run stays within its startup budget.
+
+Usage:
+    python benchmarks/bench_startup.py [runs]
+
+Reports:
+- project import time, from `python -X importtime` (engine / reports /
+  ai / dialects modules only, interpreter startup excluded)
+- heavy modules that were imported although --query does not need them
+- median wall time of the whole run, minus a bare `python -c pass`
+
+Exits with status 1 when a budget is exceeded.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+CLI = os.path.join(ROOT, "ui", "cli.py")
+COMMAND = [CLI, "--query", "SELECT id, name FROM users WHERE id = 1;", "--format", "quiet"]
+
+IMPORT_BUDGET_MS = 15
+OVERHEAD_BUDGET_MS = 50
+
+PROJECT_PACKAGES = ("engine", "reports", "ai", "dialects")
+UNWANTED = ("requests", "dotenv", "ai", "sqlite3", "concurrent", "multiprocessing", "dialects")
+
+
+def project_imports():
+    """
+    Returns:
+        tuple: (project import time in ms, top-level modules imported)
+    """
+
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime"] + COMMAND,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    total_us = 0
+    modules = set()
+
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        try:
+            _, cumulative, name = line.split("|")
+            cumulative = int(cumulative)
+        except ValueError:
+            continue
+
+        # Only outermost imports, so nested ones are not counted twice
+        if name.startswith("  "):
+            name = name.strip()
+            modules.add(name.split(".")[0])
+            continue
+
+        name = name.strip()
+        modules.add(name.split(".")[0])
+        if name.split(".")[0] in PROJECT_PACKAGES:
+            total_us += cumulative
+
+    return total_us / 1000, modules
+
+
+def wall_time(args, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    import_ms, modules = project_imports()
+    unwanted = sorted(m for m in UNWANTED if m in modules)
+
+    baseline = wall_time(["-c", "pass"], runs)
+    total = wall_time(COMMAND, runs)
+    overhead = total - baseline
+
+    print(f"project imports  : {import_ms:6.1f} ms (budget {IMPORT_BUDGET_MS} ms)")
+    print(f"python -c pass   : {baseline:6.1f} ms")
+    print(f"cli --query      : {total:6.1f} ms (overhead {overhead:.1f} ms, budget {OVERHEAD_BUDGET_MS} ms)")
+    print(f"unwanted imports : {', '.join(unwanted) or 'none'}")
+
+    ok = import_ms <= IMPORT_BUDGET_MS and overhead <= OVERHEAD_BUDGET_MS and not unwanted
+    print("OK" if ok else "OVER BUDGET")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -135,3 +135,21 @@ class DropViewNode:
 
     def __repr__(self):
         return f"DropViewNode(name={self.name})"
+
+
+class CopyNode:
+    def __init__(self, table, columns, direction, target, rows=None):
+        self.type = "COPY"
+        self.table = table
+        self.columns = columns
+        self.direction = direction  # "FROM" or "TO"
+        self.target = target        # "STDIN", "STDOUT" or a file name
+        self.rows = rows            # number of data rows after FROM STDIN
+
+    def __repr__(self):
+        return (
+            f"CopyNode(table={self.table}, "
+            f"columns={self.columns}, "
+            f"{self.direction.lower()}={self.target}, "
+            f"rows={self.rows})"
+        )
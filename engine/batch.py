@@ -0,0 +1,379 @@
+"""
+Batch Validation
+----------------
+Validates many .sql files, optionally in a process pool.
+
+- Inputs may be files, directories (searched recursively for *.sql)
+  or glob patterns ("schema/**/*.sql")
+- Files are expanded in sorted order and results are yielded in that
+  order whatever the pool finishes first, so output is deterministic
+- At most `jobs * PREFETCH_PER_JOB` files are in flight, keeping memory
+  bounded on large trees
+- A single file (or jobs=1) is validated in-process and streamed
+  statement by statement
+- Statements read from files carry the byte offset just past them, so
+  an interrupted run can resume mid-file (see engine.checkpoint)
+- .sql.gz / .sql.bz2 / .sql.xz files are decompressed on the fly by the
+  stdlib streams, chunk by chunk, without a temporary copy on disk
+"""
+
+import codecs
+import glob
+import os
+import re
+from bisect import bisect_left
+from collections import deque
+from importlib import import_module
+
+from engine.copy_data import COPY_TERMINATOR
+from engine.fingerprint import statement_hash
+from engine.splitter import iter_statements
+from engine.validator import validate_query
+
+
+SQL_EXTENSIONS = (".sql", ".sql.gz", ".sql.bz2", ".sql.xz")
+
+# suffix -> stdlib module whose open() streams the decompressed bytes
+DECOMPRESSORS = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "lzma"
+}
+READ_CHUNK_SIZE = 1024 * 1024
+PREFETCH_PER_JOB = 4
+
+STREAM_CHUNK_SIZE = 64 * 1024
+MAX_STREAM_STATEMENT = 4 * 1024 * 1024
+
+_GLOB_CHARS = ("*", "?", "[")
+_CRLF = re.compile("\r\n")
+
+
+# ======================================================
+# INPUT EXPANSION
+# ======================================================
+
+def expand_inputs(paths) -> list:
+    """
+    Returns:
+        list: sorted, de-duplicated file paths
+
+    Raises:
+        FileNotFoundError: for a plain path that does not exist or a
+            pattern that matches nothing
+    """
+
+    files = set()
+
+    for path in paths:
+        if any(char in path for char in _GLOB_CHARS):
+            matches = [m for m in glob.glob(path, recursive=True) if os.path.isfile(m)]
+            if not matches:
+                raise FileNotFoundError(path)
+            files.update(matches)
+
+        elif os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs[:] = [d for d in dirs if not d.startswith(".")]
+                files.update(
+                    os.path.join(root, name)
+                    for name in names
+                    if name.lower().endswith(SQL_EXTENSIONS)
+                )
+
+        elif os.path.isfile(path):
+            files.add(path)
+
+        else:
+            raise FileNotFoundError(path)
+
+    return sorted(files)
+
+
+# ======================================================
+# VALIDATION
+# ======================================================
+
+def is_compressed(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() in DECOMPRESSORS
+
+
+def open_sql_file(path: str):
+    """
+    Open a SQL file for binary reading, decompressing .gz / .bz2 / .xz.
+    The decompressor module is only imported for its own files.
+    """
+
+    module = DECOMPRESSORS.get(os.path.splitext(path)[1].lower())
+    if module is None:
+        return open(path, "rb")
+    return import_module(module).open(path, "rb")
+
+
+def iter_file_statements(path, start=None):
+    """
+    Yield statements from a .sql file, reading it in chunks.
+
+    The file is read as bytes and decoded here (UTF-8, universal
+    newlines, like open() in text mode) so every statement can carry
+    byte_end, its end as a byte offset (of the decompressed stream for
+    compressed files).
+
+    start (tuple | None): (byte_offset, char_offset, line) to resume at,
+        taken from a statement of a previous run
+    """
+
+    byte_offset, char_offset, line = start or (0, 0, 1)
+    positions = _BytePositions(byte_offset, char_offset)
+
+    with open_sql_file(path) as f:
+        if byte_offset:
+            f.seek(byte_offset)
+
+        for statement in iter_statements(_read_text(f, positions), offset=char_offset, line=line):
+            statement.byte_end = positions.byte_offset(statement.end)
+            # A final statement without ';' is still terminated by EOF
+            if not statement.text.endswith((";", COPY_TERMINATOR)):
+                statement.text += ";"
+            yield statement
+
+
+def _read_text(f, positions):
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    carry = ""
+
+    while True:
+        try:
+            block = f.read(READ_CHUNK_SIZE)
+        except OSError:
+            raise
+        except Exception as e:
+            # Truncated or corrupt compressed input (EOFError, zlib.error,
+            # lzma.LZMAError): report it like any unreadable file
+            raise OSError(f"corrupt compressed data: {e}") from e
+
+        text = carry + decoder.decode(block, final=not block)
+        carry = ""
+
+        # A trailing '\r' may be the first half of '\r\n'
+        if block and text.endswith("\r"):
+            text, carry = text[:-1], "\r"
+
+        if text:
+            yield positions.add(text)
+        if not block:
+            break
+
+
+class _BytePositions:
+    """
+    Maps character offsets of the decoded text back to file byte offsets.
+
+    Chunks are kept until every statement in them has been mapped, so
+    in practice only the current one or two are held. ASCII chunks
+    without '\r' (the common case) map with plain arithmetic.
+    """
+
+    def __init__(self, byte_offset=0, char_offset=0):
+        self._chunks = deque()      # (char_start, byte_start, text, byte_length, ascii, crlf)
+        self._read_chars = char_offset
+        self._read_bytes = byte_offset
+        self._char = char_offset    # last mapped position...
+        self._byte = byte_offset    # ...and its byte offset
+
+    def add(self, raw: str) -> str:
+        """
+        Register a decoded chunk; returns it with newlines translated.
+        """
+
+        ascii_only = raw.isascii()
+        byte_length = len(raw) if ascii_only else len(raw.encode("utf-8"))
+
+        crlf = None
+        text = raw
+        if "\r" in raw:
+            # Translated index of every '\n' that was '\r\n' (2 bytes, 1 char)
+            crlf = [m.start() - i for i, m in enumerate(_CRLF.finditer(raw))]
+            text = raw.replace("\r\n", "\n").replace("\r", "\n")
+
+        self._chunks.append((self._read_chars, self._read_bytes, text, byte_length, ascii_only, crlf))
+        self._read_chars += len(text)
+        self._read_bytes += byte_length
+        return text
+
+    def byte_offset(self, char_offset: int) -> int:
+        """
+        Offsets must be asked for in increasing order.
+        """
+
+        while self._chunks:
+            char_start, byte_start, text, byte_length, ascii_only, crlf = self._chunks[0]
+            char_end = char_start + len(text)
+
+            if char_offset >= char_end:
+                self._char, self._byte = char_end, byte_start + byte_length
+                if char_offset == char_end or len(self._chunks) == 1:
+                    return self._byte
+                self._chunks.popleft()
+                continue
+
+            low, high = self._char - char_start, char_offset - char_start
+            delta = high - low if ascii_only else len(text[low:high].encode("utf-8"))
+            if crlf:
+                delta += bisect_left(crlf, high) - bisect_left(crlf, low)
+
+            self._char, self._byte = char_offset, self._byte + delta
+            return self._byte
+
+        return self._byte
+
+
+def iter_validated_file(path, dialect="postgres", collect_timings=False, known=None, start=None):
+    """
+    Yield (path, statement, result, timings) for each statement in a file.
+    Unreadable files yield one "FileError" result with statement None.
+
+    known (dict | None): statement_hash -> result to reuse instead of
+        re-validating (see engine.manifest)
+    start (tuple | None): resume position, see iter_file_statements
+    """
+
+    try:
+        for statement in iter_file_statements(path, start):
+            if known:
+                result = known.get(statement_hash(statement.text))
+                if result is not None:
+                    yield path, statement, dict(result), None
+                    continue
+
+            timings = {} if collect_timings else None
+            result = validate_query(statement.text, dialect, timings)
+            yield path, statement, result, timings
+    except (OSError, UnicodeDecodeError) as e:
+        yield path, None, file_error_result(path, e, dialect), None
+
+
+def validate_file(path, dialect="postgres", collect_timings=False, known=None, start=None) -> list:
+    """
+    Process-pool worker: validate a whole file, return its results as a list.
+    """
+
+    return list(iter_validated_file(path, dialect, collect_timings, known, start))
+
+
+def iter_validated_files(
+    files,
+    dialect="postgres",
+    jobs=1,
+    collect_timings=False,
+    on_file_done=None,
+    known=None,
+    start=None
+):
+    """
+    Yield (path, statement, result, timings) for every statement of every
+    file, in file order.
+
+    Parameters:
+        files (list): paths from expand_inputs
+        jobs (int): worker processes (1 = validate in this process)
+        on_file_done (callable | None): on_file_done(path, statement_count)
+        known (dict | None): path -> {statement_hash: result} reusable results
+        start (dict | None): path -> resume position (see iter_file_statements)
+    """
+
+    known = known or {}
+    start = start or {}
+
+    if jobs <= 1 or len(files) <= 1:
+        for path in files:
+            count = 0
+            for item in iter_validated_file(path, dialect, collect_timings, known.get(path), start.get(path)):
+                count += 1
+                yield item
+            if on_file_done is not None:
+                on_file_done(path, count)
+        return
+
+    # Imported here: multiprocessing adds noticeably to CLI startup
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = deque()
+        remaining = iter(files)
+
+        def submit_next():
+            path = next(remaining, None)
+            if path is not None:
+                future = pool.submit(
+                    validate_file, path, dialect, collect_timings, known.get(path), start.get(path)
+                )
+                pending.append((path, future))
+
+        for _ in range(jobs * PREFETCH_PER_JOB):
+            submit_next()
+
+        while pending:
+            path, future = pending.popleft()
+            items = future.result()
+            submit_next()
+
+            yield from items
+            if on_file_done is not None:
+                on_file_done(path, len(items))
+
+
+# ======================================================
+# STREAMS (stdin, pipes)
+# ======================================================
+
+def iter_fd_chunks(fd, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Yield decoded text as soon as it is readable from a file descriptor.
+
+    os.read returns whatever is available (no waiting for a full block
+    or a newline), so `tail -f log | sqlidator --stdin` sees each
+    statement as soon as its ';' is written.
+    """
+
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    while True:
+        data = os.read(fd, chunk_size)
+        if not data:
+            break
+        text = decoder.decode(data)
+        if text:
+            yield text
+
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def iter_validated_stream(
+    chunks,
+    dialect="postgres",
+    source="<stdin>",
+    collect_timings=False,
+    max_statement=MAX_STREAM_STATEMENT
+):
+    """
+    Yield (source, statement, result, timings) for each statement as soon
+    as it is complete in the chunk stream. Memory is bounded by
+    max_statement characters of pending text.
+    """
+
+    for statement in iter_statements(chunks, max_pending=max_statement):
+        timings = {} if collect_timings else None
+        result = validate_query(statement.text, dialect, timings)
+        yield source, statement, result, timings
+
+
+def file_error_result(path, error, dialect):
+    return {
+        "status": "error",
+        "dialect": dialect,
+        "type": "FileError",
+        "message": f"Cannot read {path}: {error}"
+    }
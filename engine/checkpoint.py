@@ -0,0 +1,194 @@
+"""
+Run Checkpoints
+---------------
+Lets an interrupted --file run continue where it stopped (--resume).
+
+While a run progresses the checkpoint remembers the last statement
+whose result was written:
+
+    file / byte_offset / char_offset / line → where reading resumes
+    index                                   → its statement number
+    counts, reports                         → partial aggregates and report
+                                              writer state (see reports.writers)
+
+It is saved every CHECKPOINT_INTERVAL seconds, on Ctrl-C and on errors,
+and deleted when the run completes. A resumed run seeks straight to the
+byte offset instead of re-reading the input.
+
+A checkpoint only matches the run that wrote it: same input files (the
+file being read must be unchanged), dialect and output options.
+
+The file is JSON, rewritten atomically (temp file + os.replace).
+"""
+
+import json
+import os
+import tempfile
+import time
+
+
+CHECKPOINT_VERSION = 1
+DEFAULT_CHECKPOINT = ".sqlidator-checkpoint.json"
+CHECKPOINT_INTERVAL = 10.0
+
+
+class CheckpointError(Exception):
+    pass
+
+
+class Checkpoint:
+    def __init__(self, path: str, files: list, options: dict, interval: float = CHECKPOINT_INTERVAL):
+        """
+        files (list): input files, in run order (engine.batch.expand_inputs)
+        options (dict): JSON-serializable settings the results depend on
+            (dialect, report format, output name, ...)
+        """
+
+        self.path = path
+        self.files = files
+        self.options = options
+        self.interval = interval
+
+        # Position after the last written statement
+        self.file = 0
+        self.byte_offset = 0
+        self.char_offset = 0
+        self.line = 1
+        self.index = 0
+        self.counts = {}
+        self.reports = {}
+
+        self._file_index = {path: i for i, path in enumerate(files)}
+        self._saved = time.monotonic()
+
+    # ======================================================
+    # PERSISTENCE
+    # ======================================================
+
+    def load(self):
+        """
+        Restore the position saved by an earlier run of the same command.
+
+        Raises:
+            CheckpointError: no checkpoint, or it belongs to another run
+        """
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            raise CheckpointError(f"No checkpoint found at {self.path}")
+        except (OSError, ValueError) as e:
+            raise CheckpointError(f"Cannot read checkpoint {self.path}: {e}")
+
+        if data.get("version") != CHECKPOINT_VERSION:
+            raise CheckpointError(f"{self.path} was written by another SQLidator version")
+        if data.get("options") != self.options:
+            raise CheckpointError(f"{self.path} was written with different options: {data.get('options')}")
+        if data.get("files") != self.files:
+            raise CheckpointError(f"{self.path} was written for a different set of input files")
+
+        self.file = data["file"]
+        self.byte_offset = data["byte_offset"]
+        self.char_offset = data["char_offset"]
+        self.line = data["line"]
+        self.index = data["index"]
+        self.counts = data.get("counts", {})
+        self.reports = data.get("reports", {})
+
+        if self.file < len(self.files) and data.get("stat") != _file_stat(self.files[self.file]):
+            raise CheckpointError(f"{self.files[self.file]} changed since the checkpoint was written")
+
+    def save(self, reports: dict | None = None):
+        """
+        reports: writer states to restore on resume; writers must have
+            flushed everything up to the current position.
+        """
+
+        if reports is not None:
+            self.reports = reports
+
+        data = {
+            "version": CHECKPOINT_VERSION,
+            "options": self.options,
+            "files": self.files,
+            "file": self.file,
+            "stat": _file_stat(self.files[self.file]) if self.file < len(self.files) else None,
+            "byte_offset": self.byte_offset,
+            "char_offset": self.char_offset,
+            "line": self.line,
+            "index": self.index,
+            "counts": self.counts,
+            "reports": self.reports
+        }
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        self._saved = time.monotonic()
+
+    def remove(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    # ======================================================
+    # PROGRESS
+    # ======================================================
+
+    def advance(self, source, statement, index: int, counts: dict):
+        """
+        Record that the result of `statement` (from file `source`) was
+        written. statement None (unreadable file) completes the file.
+        """
+
+        file = self._file_index[source]
+
+        if statement is None or statement.byte_end is None:
+            self.file, self.byte_offset, self.char_offset, self.line = file + 1, 0, 0, 1
+        else:
+            self.file = file
+            self.byte_offset = statement.byte_end
+            self.char_offset = statement.end
+            self.line = statement.end_line
+
+        self.index = index
+        # A copy: the caller's counts already include the next statement
+        # by the time a failed write saves the checkpoint
+        self.counts = dict(counts)
+
+    def due(self) -> bool:
+        return time.monotonic() - self._saved >= self.interval
+
+    def remaining(self):
+        """
+        Returns:
+            tuple: (files still to validate, {path: resume position})
+        """
+
+        files = self.files[self.file:]
+        start = {}
+        if files and self.byte_offset:
+            start[files[0]] = (self.byte_offset, self.char_offset, self.line)
+        return files, start
+
+
+def _file_stat(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
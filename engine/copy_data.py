@@ -0,0 +1,171 @@
+"""
+COPY Data Blocks
+----------------
+pg_dump writes table contents as
+
+    COPY public.users (id, name) FROM stdin;
+    1	alice
+    2	\\N
+    \\.
+
+The rows after the command are data, not SQL. The splitter keeps them
+with their COPY statement and the lexer turns them into one COPY_DATA
+token. Both find the terminating "\\." line with str.find, so a block
+costs a handful of Python operations however many rows it holds.
+
+Data starts on the line after the command's ';' and ends before a line
+that is exactly "\\.".
+
+A block too large to buffer (--stdin) is checked row by row as it
+streams past and replaced by a row-count note, plus the first bad row
+if there is one:
+
+    COPY public.users (id, name) FROM stdin;
+    -- (1,250,000 COPY data rows, showing row 70,001)
+    70001\talice\textra
+    \\.
+"""
+
+import re
+from itertools import repeat
+
+
+COPY_TERMINATOR = "\\."
+
+# COPY ... FROM STDIN, possibly preceded by comments (pg_dump adds a header)
+COPY_FROM_STDIN = re.compile(
+    r"(?:\s|--[^\n]*\n|/\*.*?\*/)*COPY\s[^;]*?\bFROM\s+STDIN\b",
+    re.IGNORECASE | re.DOTALL
+)
+
+# Column list of the command: COPY t (a, b) FROM stdin
+COPY_COLUMNS = re.compile(r"\(([^()]*)\)\s*FROM\s+STDIN\b", re.IGNORECASE)
+
+_ROWS_NOTE = re.compile(r"-- \(([\d,]+) COPY data rows(?:, showing row [\d,]+)?\)\r?")
+
+_TERMINATOR_LINE = "\n" + COPY_TERMINATOR
+
+
+def find_data_end(text: str, start: int, final: bool = True):
+    """
+    Search text[start:] (start = just past the COPY command's ';') for
+    the terminator line.
+
+    Returns:
+        tuple: (end, resume) — end is the index just past "\\.", or None
+            if the block is not complete yet; resume is where to search
+            again once more text has been appended
+    """
+
+    k = start
+    while True:
+        k = text.find(_TERMINATOR_LINE, k)
+        if k == -1:
+            return None, max(start, len(text) - len(_TERMINATOR_LINE) + 1)
+
+        after = k + len(_TERMINATOR_LINE)
+        if after == len(text):
+            return (after, after) if final else (None, k)
+        if text[after] in "\r\n":
+            return after, after
+
+        # "\.something" is data, not the terminator
+        k += 1
+
+
+def data_bounds(text: str, start: int):
+    """
+    Returns:
+        tuple: (data_start, data_end, end) for the block after the ';' at
+            start - 1, or None if the terminator is missing. text[data_start:data_end]
+            is the rows, each ending in "\\n".
+    """
+
+    newline = text.find("\n", start)
+    if newline == -1:
+        return None
+
+    end, _ = find_data_end(text, newline)
+    if end is None:
+        return None
+
+    return newline + 1, max(newline + 1, end - len(COPY_TERMINATOR)), end
+
+
+def rows_note(rows: int, shown: int | None = None) -> str:
+    """
+    The line standing in for the rows of a streamed block (shown is the
+    1-based number of the sample row that follows it, if any).
+    """
+
+    if shown is None:
+        return f"-- ({rows:,} COPY data rows)"
+    return f"-- ({rows:,} COPY data rows, showing row {shown:,})"
+
+
+def streamed_rows(row: str):
+    """
+    Returns:
+        int | None: the row count if `row` is a rows_note line
+    """
+
+    match = _ROWS_NOTE.fullmatch(row)
+    if match is None:
+        return None
+    return int(match.group(1).replace(",", ""))
+
+
+def copy_columns(command: str):
+    """
+    Returns:
+        int | None: length of the command's column list, if it has one
+    """
+
+    match = COPY_COLUMNS.search(command)
+    if match is None:
+        return None
+    return match.group(1).count(",") + 1
+
+
+def split_command(text: str) -> str:
+    """
+    The COPY command of a statement with a data block followed by a
+    rows_note (the whole text for any other statement), e.g. for reports.
+    """
+
+    match = COPY_FROM_STDIN.match(text)
+    if match is None or not text.endswith(COPY_TERMINATOR):
+        return text
+
+    semicolon = text.find(";", match.end())
+    newline = -1 if semicolon == -1 else text.find("\n", semicolon)
+    if newline == -1:
+        return text
+
+    data_start = newline + 1
+    first_end = text.find("\n", data_start)
+    rows = None
+    if first_end != -1:
+        rows = streamed_rows(text[data_start:first_end])
+    if rows is None:
+        rows = text.count("\n", data_start)
+
+    return f"{text[:newline].rstrip()}\n{rows_note(rows)}"
+
+
+def column_mismatch(rows: list, columns: int):
+    """
+    Returns:
+        tuple | None: (row index, column count) of the first row whose
+            tab-separated field count differs from `columns`
+    """
+
+    tabs = columns - 1
+    counts = list(map(str.count, rows, repeat("\t")))
+
+    if counts.count(tabs) == len(counts):
+        return None
+
+    for index, count in enumerate(counts):
+        if count != tabs:
+            return index, count + 1
@@ -5,17 +5,50 @@ Generates SQL-style syntax errors.
 Supports PostgreSQL-style and MySQL-style formatting.
 """
 
+# Longer source lines are cut around the error, like PostgreSQL does
+MAX_ERROR_LINE = 100
+
+
 class SQLSyntaxError(Exception):
-    def __init__(self, message, token=None, query=None, dialect="postgres"):
+    def __init__(
+        self,
+        message,
+        token=None,
+        query=None,
+        dialect="postgres",
+        expected=None,
+        suggestion=None
+    ):
         self.message = message
         self.token = token
         self.query = query
         self.dialect = dialect
+        self.expected = expected      # expected-token set of the failing parser state
+        self.suggestion = suggestion  # closest keyword, if the token looks misspelled
         super().__init__(self.format_error())
 
+    @property
+    def position(self):
+        """
+        Character offset of the offending token within the query,
+        or None when the error carries no location.
+        """
+
+        if not self.token or self.query is None:
+            return None
+
+        offset = 0
+        for _ in range(self.token.line - 1):
+            newline = self.query.find("\n", offset)
+            if newline == -1:
+                break
+            offset = newline + 1
+
+        return min(offset + self.token.column - 1, len(self.query))
+
     def format_error(self):
         if not self.token or not self.query:
-            return f"ERROR: {self.message}"
+            return f"ERROR: {self.message}" + self._hint()
 
         if self.dialect.lower() == "mysql":
             return self._mysql_format()
@@ -28,13 +61,25 @@ class SQLSyntaxError(Exception):
         lines = self.query.split("\n")
 
         error_line = lines[line - 1] if line <= len(lines) else ""
+
+        if len(error_line) > MAX_ERROR_LINE:
+            start = max(0, min(column - 1 - MAX_ERROR_LINE // 2, len(error_line) - MAX_ERROR_LINE))
+            end = start + MAX_ERROR_LINE
+            column -= start
+            error_line = error_line[start:end]
+            if start > 0:
+                error_line = "..." + error_line
+                column += 3
+            if end < len(lines[line - 1]):
+                error_line += "..."
+
         pointer = " " * (column - 1) + "^"
 
         return (
             f"ERROR:  {self.message}\n"
             f"LINE {line}: {error_line}\n"
             f"{' ' * (6 + len(str(line)))}{pointer}"
-        )
+        ) + self._hint()
 
     def _mysql_format(self):
         line = self.token.line
@@ -43,3 +88,8 @@ class SQLSyntaxError(Exception):
             f"ERROR 1064 (42000): You have an error in your SQL syntax;\n"
             f"near '{self.token.value}' at line {line}"
         )
+
+    def _hint(self):
+        if not self.suggestion:
+            return ""
+        return f'\nHINT:  Perhaps you meant "{self.suggestion}".'
@@ -12,6 +12,7 @@ from engine.expression_nodes import (
     IdentifierNode
 )
 from engine.errors import SQLSyntaxError
+from engine import grammar
 
 
 class ExpressionParser:
@@ -93,9 +94,9 @@ class ExpressionParser:
             expr = self.parse_expression()
 
             if self.parser.current_token.type != TokenType.PAREN_CLOSE:
-                self.parser.raise_error()
+                self.parser.raise_error(grammar.EXPRESSION_GROUP_END)
 
             self.parser.advance()
             return expr
 
-        self.parser.raise_error()
+        self.parser.raise_error(grammar.EXPRESSION_PRIMARY)
@@ -0,0 +1,84 @@
+"""
+Query Fingerprinting
+--------------------
+Normalizes a query to a stable token stream and hashes it.
+
+- whitespace and comments are ignored
+- keywords are upper-cased
+- literals are replaced by "?" (unless keep_literals=True)
+
+Two queries that differ only in formatting (or literal values)
+share a fingerprint, which makes it usable as a cache / grouping key.
+"""
+
+import hashlib
+
+from engine.lexer import Lexer
+from engine.tokens import TokenType
+from engine.errors import SQLSyntaxError
+
+
+# COPY data rows are values too; hashing them would also cost O(data)
+_LITERAL_TYPES = (TokenType.STRING, TokenType.NUMBER, TokenType.COPY_DATA)
+
+
+def normalize_query(query: str, keep_literals: bool = False) -> str:
+    try:
+        tokens = Lexer(query).tokenize()
+    except SQLSyntaxError:
+        # Not tokenizable: fall back to whitespace-insensitive text
+        return " ".join(query.split())
+
+    return normalize_tokens(tokens, keep_literals)
+
+
+def normalize_tokens(tokens: list, keep_literals: bool = False) -> str:
+    parts = []
+    for token in tokens:
+        if token.type == TokenType.EOF:
+            break
+        if token.type in _LITERAL_TYPES and not keep_literals:
+            parts.append("?")
+        elif token.type == TokenType.STRING:
+            parts.append(f"'{token.value}'")
+        elif token.type == TokenType.QUOTED_IDENTIFIER:
+            parts.append(f'"{token.value}"')
+        else:
+            parts.append(str(token.value))
+
+    return " ".join(parts)
+
+
+def fingerprint_query(query: str, keep_literals: bool = False) -> str:
+    """
+    Returns:
+        str: 16-hex-digit fingerprint of the normalized query
+    """
+
+    return _digest(normalize_query(query, keep_literals))
+
+
+def fingerprint_tokens(tokens: list, keep_literals: bool = False) -> str:
+    """
+    Same as fingerprint_query, from an already lexed token list (lets
+    the validator fingerprint a statement without lexing it twice).
+    """
+
+    return _digest(normalize_tokens(tokens, keep_literals))
+
+
+def _digest(normalized):
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:16]
+
+
+def statement_hash(query: str) -> int:
+    """
+    Cheap identity hash for joining result sets: exact statement text
+    up to whitespace, no lexing (literals still count).
+
+    Returns:
+        int: 64-bit hash
+    """
+
+    normalized = " ".join(query.split())
+    return int.from_bytes(hashlib.sha1(normalized.encode("utf-8")).digest()[:8], "big")
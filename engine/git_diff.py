@@ -0,0 +1,137 @@
+"""
+Git-Aware Validation
+--------------------
+Validates only the statements touched since a git revision.
+
+1. `git diff -U0 --no-renames REV -- <paths>` gives the changed line
+   ranges of every modified .sql file (working tree vs REV, so
+   uncommitted edits count); untracked .sql files count as fully changed
+2. each changed file is split with the statement splitter
+3. only statements whose line span overlaps a changed range are validated
+
+Work is proportional to the diff, not to the size of the repository.
+"""
+
+import os
+import re
+import subprocess
+
+from engine.batch import SQL_EXTENSIONS, file_error_result, iter_file_statements
+from engine.validator import validate_query
+
+
+_HUNK = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+WHOLE_FILE = [(1, float("inf"))]
+
+
+class GitDiffError(Exception):
+    pass
+
+
+def _git(args, cwd=None):
+    try:
+        completed = subprocess.run(
+            ["git"] + args,
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace"
+        )
+    except OSError as e:
+        raise GitDiffError(f"git is not available: {e}")
+
+    if completed.returncode != 0:
+        raise GitDiffError(completed.stderr.strip() or f"git {' '.join(args)} failed")
+
+    return completed.stdout
+
+
+def changed_line_ranges(rev: str, paths=None, cwd=None) -> dict:
+    """
+    Returns:
+        dict: file path -> [(first_line, last_line), ...] on the new side
+
+    Raises:
+        GitDiffError: not a git repository, unknown revision, ...
+    """
+
+    top = _git(["rev-parse", "--show-toplevel"], cwd=cwd).strip()
+    pathspec = ["--"] + list(paths or [])
+
+    diff = _git(["diff", "-U0", "--no-color", "--no-renames", "--no-ext-diff", rev] + pathspec, cwd=cwd)
+    ranges = parse_diff(diff)
+
+    untracked = _git(["ls-files", "--others", "--exclude-standard", "--full-name"] + pathspec, cwd=cwd)
+    for name in untracked.splitlines():
+        ranges[name] = WHOLE_FILE
+
+    base = cwd or os.getcwd()
+    return {
+        os.path.relpath(os.path.join(top, name), base): spans
+        for name, spans in sorted(ranges.items())
+        if name.lower().endswith(SQL_EXTENSIONS)
+    }
+
+
+def parse_diff(diff: str) -> dict:
+    """
+    Parse `git diff -U0` output into {repo-relative path: [(first, last), ...]}.
+    """
+
+    ranges = {}
+    current = None
+
+    for line in diff.splitlines():
+        if line.startswith("+++ "):
+            target = line[4:]
+            # Deleted files have nothing left to validate
+            current = None if target == "/dev/null" else target[2:] if target.startswith("b/") else target
+            if current is not None:
+                ranges.setdefault(current, [])
+            continue
+
+        if current is None or not line.startswith("@@"):
+            continue
+
+        match = _HUNK.match(line)
+        if not match:
+            continue
+
+        start = int(match.group(1))
+        count = int(match.group(2)) if match.group(2) is not None else 1
+
+        if count == 0:
+            # Pure deletion after line `start`: the statements around it changed
+            ranges[current].append((max(start, 1), start + 1))
+        else:
+            ranges[current].append((start, start + count - 1))
+
+    return ranges
+
+
+def statement_touched(statement, spans) -> bool:
+    first, last = statement.line, statement.end_line
+    return any(start <= last and end >= first for start, end in spans)
+
+
+def iter_validated_changes(ranges: dict, dialect="postgres", collect_timings=False):
+    """
+    Yield (path, statement, result, timings) for statements overlapping
+    the changed ranges, in path order.
+    """
+
+    for path, spans in ranges.items():
+        if not spans:
+            continue
+
+        try:
+            for statement in iter_file_statements(path):
+                if not statement_touched(statement, spans):
+                    continue
+                timings = {} if collect_timings else None
+                result = validate_query(statement.text, dialect, timings)
+                yield path, statement, result, timings
+        except (OSError, UnicodeDecodeError) as e:
+            yield path, None, file_error_result(path, e, dialect), None
@@ -0,0 +1,104 @@
+"""
+Grammar Tables
+--------------
+Precomputed FIRST / expected-token sets for each parser state.
+
+Entries are plain strings:
+- keywords      → their upper-case spelling ("TABLE")
+- punctuation   → the literal symbol (",", ";", "(", ")")
+- token classes → lower-case names ("identifier", "number", "string")
+
+The parser only consults these tables when it raises an error,
+so the successful parse path pays nothing for them.
+"""
+
+from engine.tokens import TokenType
+
+
+# ==========================================
+# TOKEN CLASS SYMBOLS
+# ==========================================
+
+TOKEN_SYMBOLS = {
+    TokenType.IDENTIFIER: "identifier",
+    TokenType.QUOTED_IDENTIFIER: "identifier",
+    TokenType.STRING: "string",
+    TokenType.NUMBER: "number",
+    TokenType.OPERATOR: "operator",
+    TokenType.COMMA: ",",
+    TokenType.SEMICOLON: ";",
+    TokenType.PAREN_OPEN: "(",
+    TokenType.PAREN_CLOSE: ")",
+    TokenType.DOT: ".",
+    TokenType.ASTERISK: "*",
+    TokenType.COPY_DATA: "COPY data",
+    TokenType.EOF: "end of input",
+}
+
+
+# ==========================================
+# FIRST SETS
+# ==========================================
+
+STATEMENT = frozenset({
+    "SELECT", "INSERT", "UPDATE", "DELETE", "CREATE", "ALTER", "DROP"
+})
+
+POSTGRES_STATEMENT = STATEMENT | {"COPY"}
+
+CREATE_OBJECT = frozenset({"TABLE", "VIEW"})
+
+DROP_OBJECT = frozenset({"TABLE", "VIEW"})
+
+ALTER_ACTION = frozenset({"ADD", "DROP", "RENAME"})
+
+RENAME_TARGET = frozenset({"COLUMN", "TO"})
+
+VIEW_QUERY = frozenset({"SELECT"})
+
+IDENTIFIER = frozenset({"identifier"})
+
+DATATYPE = frozenset({"identifier"})
+
+SELECT_ITEM = frozenset({"*", "identifier"})
+
+TABLE_SOURCE = frozenset({"(", "identifier"})
+
+EXPRESSION_PRIMARY = frozenset({"(", "identifier", "number", "string"})
+
+ASSIGNMENT_OPERATOR = frozenset({"="})
+
+LIMIT_VALUE = frozenset({"number"})
+
+COPY_DIRECTION = frozenset({"(", ".", "FROM", "TO"})
+
+COPY_SOURCE = frozenset({"STDIN", "string"})
+
+COPY_TARGET = frozenset({"STDOUT", "string"})
+
+
+# ==========================================
+# FOLLOW SETS (what may legally come next)
+# ==========================================
+
+SELECT_LIST_END = frozenset({",", "FROM"})
+
+COLUMN_DEFINITION_END = frozenset({",", ")", "PRIMARY", "NOT", "UNIQUE"})
+
+EXPRESSION_GROUP_END = frozenset({")", "AND", "OR", "operator"})
+
+# Keyed by AST node type; used when a statement is not followed by ";".
+STATEMENT_END = {
+    "SELECT": frozenset({";", "WHERE", "GROUP", "HAVING", "ORDER", "LIMIT", "AND", "OR"}),
+    "INSERT": frozenset({";", ","}),
+    "UPDATE": frozenset({";", ",", "WHERE", "AND", "OR"}),
+    "DELETE": frozenset({";", "WHERE", "AND", "OR"}),
+    "CREATE_TABLE": frozenset({";"}),
+    "ALTER_TABLE": frozenset({";"}),
+    "DROP_TABLE": frozenset({";"}),
+    "CREATE_VIEW": frozenset({";", "WHERE", "GROUP", "HAVING", "ORDER", "LIMIT", "AND", "OR"}),
+    "DROP_VIEW": frozenset({";"}),
+    "COPY": frozenset({";"}),
+}
+
+DEFAULT_STATEMENT_END = frozenset({";"})
@@ -0,0 +1,141 @@
+"""
+Keyword Index
+-------------
+BK-tree over engine.tokens.KEYWORDS and UNRESERVED_WORDS for fast
+edit-distance lookups.
+
+Used to turn `syntax error at or near "TABE"` into a
+`Perhaps you meant "TABLE"` hint without leaving the process.
+"""
+
+from functools import lru_cache
+
+from engine.tokens import KEYWORDS, UNRESERVED_WORDS
+
+
+def levenshtein(a: str, b: str) -> int:
+    """
+    Classic two-row Levenshtein distance.
+    """
+
+    if a == b:
+        return 0
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return len(a)
+
+    previous = list(range(len(b) + 1))
+
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ca != cb)
+            ))
+        previous = current
+
+    return previous[-1]
+
+
+class BKTree:
+    def __init__(self, words=()):
+        self.root = None
+        for word in words:
+            self.add(word)
+
+    def add(self, word):
+        if self.root is None:
+            self.root = (word, {})
+            return
+
+        node = self.root
+        while True:
+            distance = levenshtein(word, node[0])
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = (word, {})
+                return
+            node = child
+
+    def search(self, word, max_distance):
+        """
+        Return [(distance, word), ...] within max_distance, closest first.
+        """
+
+        if self.root is None:
+            return []
+
+        matches = []
+        stack = [self.root]
+
+        while stack:
+            candidate, children = stack.pop()
+            distance = levenshtein(word, candidate)
+
+            if distance <= max_distance:
+                matches.append((distance, candidate))
+
+            low = distance - max_distance
+            high = distance + max_distance
+            for edge, child in children.items():
+                if low <= edge <= high:
+                    stack.append(child)
+
+        matches.sort()
+        return matches
+
+
+_WORDS = KEYWORDS | UNRESERVED_WORDS
+
+KEYWORD_INDEX = BKTree(sorted(_WORDS))
+
+
+def suggest_keyword(word, expected=None, max_distance=None):
+    """
+    Suggest the closest keyword for a misspelled token.
+
+    Parameters:
+        word (str): offending token text
+        expected (iterable | None): expected-token set of the parser state;
+            when given, only keywords from that set are suggested
+        max_distance (int | None): edit-distance limit (scaled to word length by default)
+
+    Returns:
+        str | None: suggested keyword
+    """
+
+    if not word:
+        return None
+
+    # Log-derived inputs repeat the same typo many times: memoize
+    return _suggest_keyword(
+        str(word).upper(),
+        frozenset(expected) if expected is not None else None,
+        max_distance
+    )
+
+
+@lru_cache(maxsize=4096)
+def _suggest_keyword(word, expected, max_distance):
+
+    if max_distance is None:
+        max_distance = 1 if len(word) <= 3 else 2
+
+    allowed = None
+    if expected is not None:
+        allowed = {e for e in expected if e in _WORDS}
+        if not allowed or word in allowed:
+            return None
+
+    for distance, candidate in KEYWORD_INDEX.search(word, max_distance):
+        if distance == 0:
+            continue
+        if allowed is None or candidate in allowed:
+            return candidate
+
+    return None
@@ -2,10 +2,26 @@
 SQL Lexer (Tokenizer)
 ---------------------
 Converts raw SQL query into list of tokens.
+
+PostgreSQL extras:
+- `COPY ... FROM stdin;` is followed by its data rows; they become a
+  single COPY_DATA token (see engine.copy_data)
+- Dollar-quoted strings ($$...$$, $tag$...$tag$) become STRING tokens;
+  the closing tag is located with one str.find per body
 """
 
+import re
+
 from engine.tokens import TokenType, Token, KEYWORDS
 from engine.errors import SQLSyntaxError
+from engine.copy_data import data_bounds
+
+
+DOLLAR_TAG = re.compile(r"\$(?:[A-Za-z_][A-Za-z0-9_]*)?\$")
+
+
+def _is_word(token, word):
+    return token.type == TokenType.IDENTIFIER and token.value.upper() == word
 
 
 class Lexer:
@@ -16,6 +32,7 @@ class Lexer:
         self.line = 1
         self.column = 1
         self.tokens = []
+        self.statement_start = 0   # index in tokens of the current statement
 
     def tokenize(self):
         while self.position < len(self.query):
@@ -34,6 +51,9 @@ class Lexer:
             elif char == ";":
                 self.add_token(TokenType.SEMICOLON, ";")
                 self.advance()
+                if self.dialect == "postgres" and self.is_copy_from_stdin():
+                    self.tokenize_copy_data()
+                self.statement_start = len(self.tokens)
 
             elif char == "(":
                 self.add_token(TokenType.PAREN_OPEN, "(")
@@ -63,6 +83,9 @@ class Lexer:
             elif char == '"':
                 self.tokenize_quoted_identifier()
 
+            elif char == "$" and self.dialect == "postgres" and self.is_dollar_quote():
+                self.tokenize_dollar_string()
+
             elif char.isalpha() or char == "_":
                 self.tokenize_identifier()
 
@@ -144,6 +167,33 @@ class Lexer:
 
         self.raise_error("Unterminated quoted identifier")
 
+    def is_dollar_quote(self):
+        # "$" inside an identifier (a$b$) does not open a string
+        previous = self.query[self.position - 1] if self.position else ""
+        if previous.isalnum() or previous in "_$":
+            return False
+        return DOLLAR_TAG.match(self.query, self.position) is not None
+
+    def tokenize_dollar_string(self):
+        start_column = self.column
+        tag = DOLLAR_TAG.match(self.query, self.position).group()
+        body_start = self.position + len(tag)
+
+        close = self.query.find(tag, body_start)
+        if close == -1:
+            self.raise_error("Unterminated dollar-quoted string")
+
+        self.tokens.append(Token(TokenType.STRING, self.query[body_start:close], self.line, start_column))
+
+        end = close + len(tag)
+        newlines = self.query.count("\n", self.position, end)
+        if newlines:
+            self.line += newlines
+            self.column = end - self.query.rfind("\n", 0, end)
+        else:
+            self.column += end - self.position
+        self.position = end
+
     def tokenize_operator(self):
         start_column = self.column
         char = self.current_char()
@@ -159,6 +209,37 @@ class Lexer:
 
         self.tokens.append(Token(TokenType.OPERATOR, op, self.line, start_column))
 
+    def is_copy_from_stdin(self):
+        # COPY and STDIN are unreserved words, so they arrive as identifiers
+        tokens = self.tokens[self.statement_start:]
+        if not tokens or not _is_word(tokens[0], "COPY"):
+            return False
+
+        return any(
+            first.type == TokenType.KEYWORD and first.value == "FROM" and _is_word(second, "STDIN")
+            for first, second in zip(tokens, tokens[1:])
+        )
+
+    def tokenize_copy_data(self):
+        """
+        Consume the data block after `COPY ... FROM stdin;` up to and
+        including its "\\." line, as one token holding the rows.
+        """
+
+        bounds = data_bounds(self.query, self.position)
+        if bounds is None:
+            if not self.query[self.position:].strip():
+                return  # the command alone, without data
+            self.raise_error("COPY data is missing its terminating \\. line")
+
+        data_start, data_end, end = bounds
+        data_line = self.line + self.query.count("\n", self.position, data_start)
+        self.tokens.append(Token(TokenType.COPY_DATA, self.query[data_start:data_end], data_line, 1))
+
+        self.line = data_line + self.query.count("\n", data_start, end)
+        self.column = end - self.query.rfind("\n", 0, end)
+        self.position = end
+
     # ======================================================
     # COMMENTS
     # ======================================================
@@ -0,0 +1,327 @@
+"""
+Validation Manifest
+-------------------
+Remembers per-file results between CLI runs so unchanged files are
+not re-validated.
+
+For every input file the manifest stores its size, mtime, SHA-256 and
+a compact result per statement:
+
+    unchanged size + mtime  → reuse without reading the file
+    changed mtime, same hash → reuse, refresh the stored mtime
+    changed content          → re-validate; statements whose hash is
+                               already known keep their stored result
+
+Only failing statements keep their text (needed to report them again),
+so the manifest stays small on large, mostly-valid trees. When passing
+statements must be reported too (report writers), an unchanged file is
+re-split, which is cheap next to validating it. Cached results carry
+"cached": True and no AST.
+
+Stored results are only trusted when the manifest was written by the
+same validator: its `validator` field is a digest of the engine
+sources, so any grammar or validation change re-validates everything.
+
+The file is JSON, rewritten atomically (temp file + os.replace).
+"""
+
+import glob
+import hashlib
+import json
+import os
+import tempfile
+from functools import lru_cache
+
+from engine.batch import iter_file_statements, iter_validated_files
+from engine.fingerprint import statement_hash
+from engine.splitter import Statement
+
+
+MANIFEST_VERSION = 1
+DEFAULT_MANIFEST = ".sqlidator-manifest.json"
+HASH_BLOCK_SIZE = 1024 * 1024
+
+_RESULT_FIELDS = ("type", "message", "expected", "position", "suggestion")
+
+
+class Manifest:
+    def __init__(self, path: str | None, dialect: str = "postgres"):
+        """
+        path None keeps the manifest in memory only (e.g. --watch).
+        """
+
+        self.path = path
+        self.dialect = dialect
+        self.files = {}
+        self.reused_files = 0
+        self.reused_statements = 0
+        self.skipped_passing = 0    # reused passing statements not yielded
+        self.validated_files = 0
+        self._dirty = False
+
+        self.load()
+
+    def load(self):
+        if self.path is None:
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        # Results depend on the dialect, the validator and the manifest layout
+        if (
+            data.get("version") == MANIFEST_VERSION
+            and data.get("dialect") == self.dialect
+            and data.get("validator") == validator_version()
+        ):
+            self.files = data.get("files", {})
+
+    def save(self):
+        if not self._dirty or self.path is None:
+            return
+
+        # Forget files that no longer exist
+        self.files = {path: entry for path, entry in self.files.items() if os.path.exists(path)}
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({
+                    "version": MANIFEST_VERSION,
+                    "dialect": self.dialect,
+                    "validator": validator_version(),
+                    "files": self.files
+                }, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        self._dirty = False
+
+    # ======================================================
+    # LOOKUP / UPDATE
+    # ======================================================
+
+    def lookup(self, path: str):
+        """
+        Returns:
+            tuple: (entry or None if the file must be validated, (size, mtime_ns, sha256))
+        """
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None, None
+
+        entry = self.files.get(path)
+
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry, (stat.st_size, stat.st_mtime_ns, entry["sha256"])
+
+        try:
+            digest = file_sha256(path)
+        except OSError:
+            return None, None
+
+        meta = (stat.st_size, stat.st_mtime_ns, digest)
+
+        if entry and entry["sha256"] == digest:
+            # Touched but not modified
+            entry["size"], entry["mtime_ns"] = stat.st_size, stat.st_mtime_ns
+            self._dirty = True
+            return entry, meta
+
+        return None, meta
+
+    def known_results(self, path: str) -> dict:
+        """
+        statement_hash -> cached result for the file's previous version.
+        """
+
+        entry = self.files.get(path)
+        if not entry:
+            return {}
+        return {
+            stored["hash"]: expand_result(stored, self.dialect)
+            for stored in entry["statements"]
+        }
+
+    def remove(self, path: str):
+        if self.files.pop(path, None) is not None:
+            self._dirty = True
+
+    def update(self, path: str, meta, statements: list):
+        size, mtime_ns, digest = meta
+        self.files[path] = {
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "sha256": digest,
+            "statements": statements
+        }
+        self._dirty = True
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def validator_version() -> str:
+    """
+    Digest of the engine package sources (lexer, parser, grammar,
+    splitter, ...): changes whenever the validator can change a result.
+    """
+
+    digest = hashlib.sha256()
+    for path in sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), "*.py"))):
+        digest.update(os.path.basename(path).encode("utf-8"))
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+# ======================================================
+# COMPACT RESULTS
+# ======================================================
+
+def compact_result(statement, result: dict) -> dict:
+    stored = {
+        "line": statement.line,
+        "offset": statement.offset,
+        "end": statement.end,
+        "hash": statement_hash(statement.text),
+        "status": result.get("status")
+    }
+
+    statement_type = result.get("statement_type")
+    if statement_type is None and result.get("ast") is not None:
+        ast = result["ast"] if isinstance(result["ast"], list) else [result["ast"]]
+        statement_type = "+".join(getattr(node, "type", "UNKNOWN") for node in ast)
+    if statement_type:
+        stored["statement_type"] = statement_type
+
+    if stored["status"] == "error":
+        stored["query"] = statement.text
+        for field in _RESULT_FIELDS:
+            if result.get(field) is not None:
+                stored[field] = result[field]
+
+    return stored
+
+
+def expand_result(stored: dict, dialect: str) -> dict:
+    result = {
+        "status": stored["status"],
+        "dialect": dialect,
+        "type": stored.get("type"),
+        "message": stored.get("message", "Query parsed successfully."),
+        "cached": True
+    }
+    if stored.get("statement_type"):
+        result["statement_type"] = stored["statement_type"]
+    for field in _RESULT_FIELDS[2:]:
+        if field in stored:
+            result[field] = stored[field]
+    return result
+
+
+# ======================================================
+# INCREMENTAL VALIDATION
+# ======================================================
+
+def iter_incremental(
+    files,
+    manifest: Manifest,
+    jobs=1,
+    collect_timings=False,
+    on_file_done=None,
+    replay_passing=False
+):
+    """
+    Like engine.batch.iter_validated_files, but unchanged files are not
+    re-validated: their stored results are replayed. Updates the manifest
+    as files finish; the caller saves it.
+
+    replay_passing (bool): also yield the passing statements of unchanged
+        files (with their text, for report records); otherwise they are
+        only counted in manifest.skipped_passing
+    """
+
+    plan = []
+    changed = []
+    known = {}
+
+    for path in files:
+        entry, meta = manifest.lookup(path)
+        plan.append((path, entry, meta))
+        if entry is None:
+            changed.append(path)
+            known[path] = manifest.known_results(path)
+
+    validated = iter_validated_files(
+        changed,
+        manifest.dialect,
+        jobs=jobs,
+        collect_timings=collect_timings,
+        known=known
+    )
+    lookahead = next(validated, None)
+
+    for path, entry, meta in plan:
+        if entry is not None:
+            manifest.reused_files += 1
+            manifest.reused_statements += len(entry["statements"])
+            yield from _replay(path, entry["statements"], manifest, replay_passing)
+            if on_file_done is not None:
+                on_file_done(path, len(entry["statements"]))
+            continue
+
+        manifest.validated_files += 1
+        statements = []
+        readable = True
+
+        while lookahead is not None and lookahead[0] == path:
+            _, statement, result, _ = lookahead
+            if statement is None:
+                readable = False
+            else:
+                statements.append(compact_result(statement, result))
+            yield lookahead
+            lookahead = next(validated, None)
+
+        if readable and meta is not None:
+            manifest.update(path, meta, statements)
+        if on_file_done is not None:
+            on_file_done(path, len(statements))
+
+
+def _replay(path, stored_statements, manifest, replay_passing):
+    texts = None
+    if replay_passing:
+        try:
+            texts = [statement.text for statement in iter_file_statements(path)]
+        except OSError:
+            texts = None
+        if texts is not None and len(texts) != len(stored_statements):
+            texts = None
+
+    for i, stored in enumerate(stored_statements):
+        if stored["status"] != "error" and texts is None:
+            manifest.skipped_passing += 1
+            continue
+
+        text = texts[i] if texts is not None else stored.get("query", "")
+        statement = Statement(text, stored["offset"], stored["line"], stored["end"])
+        yield path, statement, expand_result(stored, manifest.dialect), None
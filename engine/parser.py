@@ -16,6 +16,10 @@ DDL:
 - CREATE VIEW
 - DROP VIEW
 
+PostgreSQL:
+- COPY ... FROM STDIN (data rows checked for a consistent column count)
+- COPY ... TO STDOUT / COPY ... FROM | TO 'file'
+
 Features:
 - Nested SELECT
 - Expression parser integration
@@ -23,7 +27,7 @@ Features:
 - Strict SQL-style errors
 """
 
-from engine.tokens import TokenType
+from engine.tokens import TokenType, Token
 from engine.ast_nodes import (
     SelectNode,
     InsertNode,
@@ -33,10 +37,14 @@ from engine.ast_nodes import (
     AlterTableNode,
     DropTableNode,
     CreateViewNode,
-    DropViewNode
+    DropViewNode,
+    CopyNode
 )
 from engine.expression_parser import ExpressionParser
 from engine.errors import SQLSyntaxError
+from engine.keyword_index import suggest_keyword
+from engine.copy_data import column_mismatch, streamed_rows
+from engine import grammar
 
 
 class Parser:
@@ -60,10 +68,19 @@ class Parser:
             statements.append(stmt)
 
             if self.current_token.type != TokenType.SEMICOLON:
-                self.raise_error()
+                self.raise_error(
+                    grammar.STATEMENT_END.get(
+                        getattr(stmt, "type", None),
+                        grammar.DEFAULT_STATEMENT_END
+                    )
+                )
 
             self.advance()
 
+            if self.current_token.type == TokenType.COPY_DATA:
+                self.parse_copy_data(stmt)
+                self.advance()
+
         return statements
 
     # ======================================================
@@ -93,7 +110,12 @@ class Parser:
         if self.match_keyword("DROP"):
             return self.parse_drop()
 
-        self.raise_error()
+        if self.dialect == "postgres":
+            if self.match_word("COPY"):
+                return self.parse_copy()
+            self.raise_error(grammar.POSTGRES_STATEMENT)
+
+        self.raise_error(grammar.STATEMENT)
 
     # ======================================================
     # SELECT
@@ -104,7 +126,9 @@ class Parser:
 
         columns = self.parse_select_list()
 
-        self.expect_keyword("FROM")
+        if not self.match_keyword("FROM"):
+            self.raise_error(grammar.SELECT_LIST_END)
+        self.advance()
 
         from_table = self.parse_table_source()
 
@@ -138,7 +162,7 @@ class Parser:
             self.advance()
 
             if self.current_token.type != TokenType.NUMBER:
-                self.raise_error()
+                self.raise_error(grammar.LIMIT_VALUE)
 
             limit = self.current_token.value
             self.advance()
@@ -183,6 +207,9 @@ class Parser:
             group = []
 
             while self.current_token.type != TokenType.PAREN_CLOSE:
+                if self.current_token.type in (TokenType.EOF, TokenType.SEMICOLON):
+                    self.raise_error((",", ")"))
+
                 group.append(self.current_token.value)
                 self.advance()
 
@@ -225,7 +252,7 @@ class Parser:
             column = self.expect_identifier()
 
             if self.current_token.type != TokenType.OPERATOR or self.current_token.value != "=":
-                self.raise_error()
+                self.raise_error(grammar.ASSIGNMENT_OPERATOR)
 
             self.advance()
 
@@ -274,14 +301,14 @@ class Parser:
             self.advance()
             return self.parse_create_view()
 
-        self.raise_error()
+        self.raise_error(grammar.CREATE_OBJECT)
 
     def parse_create_view(self):
         view_name = self.expect_identifier()
         self.expect_keyword("AS")
 
         if not self.match_keyword("SELECT"):
-            self.raise_error()
+            self.raise_error(grammar.VIEW_QUERY)
 
         select_node = self.parse_select()
 
@@ -293,7 +320,9 @@ class Parser:
 
         columns = self.parse_column_definitions()
 
-        self.expect(TokenType.PAREN_CLOSE)
+        if self.current_token.type != TokenType.PAREN_CLOSE:
+            self.raise_error(grammar.COLUMN_DEFINITION_END)
+        self.advance()
 
         return CreateTableNode(table_name, columns)
 
@@ -307,7 +336,7 @@ class Parser:
                 TokenType.IDENTIFIER,
                 TokenType.KEYWORD
             ):
-                self.raise_error()
+                self.raise_error(grammar.DATATYPE)
 
             datatype = self.current_token.value
             self.advance()
@@ -318,6 +347,9 @@ class Parser:
                 self.advance()
 
                 while self.current_token.type != TokenType.PAREN_CLOSE:
+                    if self.current_token.type in (TokenType.EOF, TokenType.SEMICOLON):
+                        self.raise_error((",", ")"))
+
                     datatype += str(self.current_token.value)
                     self.advance()
 
@@ -426,7 +458,9 @@ class Parser:
 
                 return AlterTableNode(table_name, action)
 
-        self.raise_error()
+            self.raise_error(grammar.RENAME_TARGET)
+
+        self.raise_error(grammar.ALTER_ACTION)
 
     # ======================================================
     # DROP
@@ -443,7 +477,72 @@ class Parser:
             self.advance()
             return DropViewNode(self.expect_identifier())
 
-        self.raise_error()
+        self.raise_error(grammar.DROP_OBJECT)
+
+    # ======================================================
+    # COPY
+    # ======================================================
+
+    def parse_copy(self):
+        self.advance()  # COPY
+
+        table = self.parse_qualified_name()
+
+        columns = None
+        if self.current_token.type == TokenType.PAREN_OPEN:
+            self.advance()
+            columns = self.parse_identifier_list()
+            self.expect(TokenType.PAREN_CLOSE)
+
+        if self.match_keyword("FROM"):
+            direction, stream, expected = "FROM", "STDIN", grammar.COPY_SOURCE
+        elif self.match_keyword("TO"):
+            direction, stream, expected = "TO", "STDOUT", grammar.COPY_TARGET
+        else:
+            self.raise_error(grammar.COPY_DIRECTION)
+        self.advance()
+
+        if self.match_word(stream):
+            target = stream
+        elif self.current_token.type == TokenType.STRING:
+            target = self.current_token.value
+        else:
+            self.raise_error(expected)
+        self.advance()
+
+        return CopyNode(table, columns, direction, target)
+
+    def parse_copy_data(self, stmt):
+        """
+        Check the rows of the COPY_DATA token following `stmt`: every row
+        must have as many tab-separated fields as the column list (or,
+        without one, as the first row).
+
+        A streamed block starts with a rows_note and only carries the rows
+        needed to reproduce its first column mismatch.
+        """
+
+        token = self.current_token
+        rows = token.value.split("\n")
+        rows.pop()  # every row ends in "\n"
+
+        total = streamed_rows(rows[0]) if rows else None
+        skip = 0 if total is None else 1
+        sample = rows[skip:] if skip else rows
+
+        if sample:
+            columns = len(stmt.columns) if stmt.columns else sample[0].count("\t") + 1
+            mismatch = column_mismatch(sample, columns)
+            if mismatch is not None:
+                index, found = mismatch
+                raise SQLSyntaxError(
+                    f"COPY data row has {found} columns, expected {columns}",
+                    token=Token(TokenType.COPY_DATA, sample[index], token.line + skip + index, 1),
+                    query=self.query,
+                    dialect=self.dialect
+                )
+
+        stmt.rows = len(rows) if total is None else total
 
     # ======================================================
     # HELPERS
@@ -484,6 +583,15 @@ class Parser:
 
         return self.expect_identifier()
 
+    def parse_qualified_name(self):
+        name = self.expect_identifier()
+
+        while self.current_token.type == TokenType.DOT:
+            self.advance()
+            name += "." + self.expect_identifier()
+
+        return name
+
     def parse_identifier_list(self):
         identifiers = []
         while True:
@@ -500,7 +608,7 @@ class Parser:
             TokenType.IDENTIFIER,
             TokenType.QUOTED_IDENTIFIER
         ):
-            self.raise_error()
+            self.raise_error(grammar.IDENTIFIER)
 
         value = self.current_token.value
         self.advance()
@@ -508,12 +616,12 @@ class Parser:
 
     def expect_keyword(self, word):
         if not self.match_keyword(word):
-            self.raise_error()
+            self.raise_error((word,))
         self.advance()
 
     def expect(self, token_type):
         if self.current_token.type != token_type:
-            self.raise_error()
+            self.raise_error((grammar.TOKEN_SYMBOLS[token_type],))
         self.advance()
 
     def match_keyword(self, word):
@@ -522,6 +630,13 @@ class Parser:
             and self.current_token.value == word
         )
 
+    def match_word(self, word):
+        # Unreserved words (COPY, STDIN, STDOUT) are lexed as identifiers
+        return (
+            self.current_token.type == TokenType.IDENTIFIER
+            and self.current_token.value.upper() == word
+        )
+
     def advance(self):
         self.position += 1
         if self.position < len(self.tokens):
@@ -531,20 +646,40 @@ class Parser:
     # ERROR
     # ======================================================
 
-    def raise_error(self):
+    def raise_error(self, expected=None):
+        """
+        Raise a syntax error at the current token.
+
+        `expected` is the expected-token set of the failing parser state
+        (see engine.grammar); it is attached to the error together with
+        a fuzzy keyword suggestion for misspelled tokens.
+        """
+
+        expected = frozenset(expected) if expected else None
+
         if self.current_token.type == TokenType.EOF:
             raise SQLSyntaxError(
                 "syntax error at end of input",
                 token=self.current_token,
                 query=self.query,
-                dialect=self.dialect
+                dialect=self.dialect,
+                expected=expected
             )
 
         token_value = self.current_token.value
 
+        suggestion = None
+        if expected and self.current_token.type in (
+            TokenType.IDENTIFIER,
+            TokenType.KEYWORD
+        ):
+            suggestion = suggest_keyword(token_value, expected)
+
         raise SQLSyntaxError(
             f'syntax error at or near "{token_value}"',
             token=self.current_token,
             query=self.query,
-            dialect=self.dialect
+            dialect=self.dialect,
+            expected=expected,
+            suggestion=suggestion
         )
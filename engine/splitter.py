@@ -0,0 +1,517 @@
+"""
+Statement Splitter
+------------------
+Splits SQL text into statements on top-level semicolons.
+
+- Quote- and comment-aware (';' inside '...', "...", $tag$...$tag$,
+  -- and /* */ is ignored)
+- Incremental: feed() accepts arbitrary chunks (file blocks, stdin lines)
+  and returns statements as soon as their ';' arrives
+- Tracks the absolute character offset and starting line of each statement
+- Scans with str.find / regex jumps instead of per-character loops
+- Keeps the data rows after `COPY ... FROM stdin;` (up to the "\\."
+  line) in the COPY statement, see engine.copy_data
+
+With max_pending, a fragment that outgrows it is emitted as-is. If the
+cut falls inside a literal or comment, the rest of it is skipped before
+splitting resumes. A COPY data block is never cut: its rows are checked
+as they stream past and replaced by a row-count note.
+
+Comment-only fragments are dropped.
+"""
+
+import re
+
+from engine.copy_data import (
+    COPY_FROM_STDIN,
+    COPY_TERMINATOR,
+    column_mismatch,
+    copy_columns,
+    find_data_end,
+    rows_note
+)
+
+
+_SPECIAL = re.compile(r"[;'\"]|--|/\*|(?<![\w$])\$(?:[A-Za-z_][A-Za-z0-9_]*)?\$")
+
+# A chunk may end inside a dollar-quote tag ("$fn" + "$ ...")
+_PARTIAL_TAG = re.compile(r"\$[A-Za-z0-9_]*")
+
+# A terminator split across chunks: "\n\\." waiting for its line end
+_COPY_TAIL = "\n\\."
+
+
+class Statement:
+    __slots__ = ("text", "offset", "line", "end", "byte_end")
+
+    def __init__(self, text, offset, line, end, byte_end=None):
+        self.text = text        # statement text, stripped, including ';'
+        self.offset = offset    # character offset of text[0] in the input
+        self.line = line        # 1-based line of text[0]
+        self.end = end          # character offset just past the statement
+        self.byte_end = byte_end    # file byte offset just past it (file input only)
+
+    @property
+    def end_line(self):
+        return self.line + self.text.count("\n")
+
+    def __repr__(self):
+        return f"Statement(line={self.line}, offset={self.offset}, text={self.text[:40]!r})"
+
+
+class _CopyStream:
+    """
+    Rows of a COPY data block that is too large to buffer.
+    """
+
+    __slots__ = ("head", "columns", "first", "rows", "bad")
+
+    def __init__(self, head):
+        self.head = head                        # Statement of the COPY command
+        self.columns = copy_columns(head.text)  # expected fields per row
+        self.first = None   # first row, when it sets the column count
+        self.rows = 0
+        self.bad = None     # (row index, row) of the first mismatch
+
+    def add(self, rows):
+        if self.bad is None:
+            if self.columns is None:
+                self.first = rows[0]
+                self.columns = rows[0].count("\t") + 1
+
+            mismatch = column_mismatch(rows, self.columns)
+            if mismatch is not None:
+                self.bad = (self.rows + mismatch[0], rows[mismatch[0]])
+
+        self.rows += len(rows)
+
+    def text(self, terminated):
+        if not terminated:
+            return f"{self.head.text}\n{rows_note(self.rows)}"
+        if self.bad is None:
+            return f"{self.head.text}\n{rows_note(self.rows)}\n{COPY_TERMINATOR}"
+
+        index, row = self.bad
+        sample = [row] if self.first is None else [self.first, row]
+        return "\n".join([self.head.text, rows_note(self.rows, index + 1), *sample, COPY_TERMINATOR])
+
+
+class StatementSplitter:
+    def __init__(self, max_pending=None, offset=0, line=1):
+        """
+        max_pending (int | None): if an unterminated fragment grows past
+            this many characters it is emitted as-is (bounded memory for
+            endless streams; the validator then reports it)
+        offset / line: position of the first chunk in the input, when
+            splitting resumes mid-file
+        """
+
+        self.max_pending = max_pending
+        self._buffer = ""
+        self._base = offset     # absolute offset of _buffer[0]
+        self._scan = 0          # where scanning resumes inside _buffer
+        self._content = False   # current fragment has non-comment text
+        self._line_pos = 0      # _buffer index whose line number is known...
+        self._line_no = line    # ...and that line number
+
+        # Inside a COPY data block: where the terminator search resumes,
+        # and chunks not yet joined into _buffer (joined once the block
+        # is complete, so a large block is not re-copied per chunk)
+        self._copy = None
+        self._copy_start = 0    # _buffer index just past the command's ';'
+        self._parts = []
+        self._parts_size = 0
+        self._tail = ""
+        self._stream = None     # _CopyStream once a block outgrew max_pending
+
+        # Literal/comment opener whose rest is skipped after a forced cut
+        self._literal = None
+
+    def feed(self, chunk: str) -> list:
+        """
+        Add text; return the statements completed by it.
+        """
+
+        if self._copy is not None and chunk:
+            if not self._copy_chunk(chunk):
+                return self._bound_pending([])
+        elif chunk:
+            self._buffer += chunk
+
+        statements = []
+        if self._stream is not None:
+            statement = self._stream_rows(final=False)
+            if statement is None:
+                return statements
+            statements.append(statement)
+
+        statements.extend(self._split(final=False))
+        return self._bound_pending(statements)
+
+    def flush(self) -> list:
+        """
+        End of input: return the trailing statement (if any) without ';'.
+        """
+
+        self._join_parts()
+
+        statements = []
+        if self._stream is not None:
+            statement = self._stream_rows(final=True)
+            if statement is None:
+                # No terminator: the validator reports the cut-off block
+                statement = self._end_stream(len(self._buffer), terminated=False)
+            statements.append(statement)
+
+        statements.extend(self._split(final=True))
+
+        if self._content and self._buffer.strip():
+            statement = self._make_statement(0, len(self._buffer))
+            if statement:
+                statements.append(statement)
+
+        self._advance(len(self._buffer))
+        self._copy = None
+        return statements
+
+    @property
+    def pending(self) -> bool:
+        """
+        True while a partial statement is buffered.
+        """
+
+        if self._stream is not None or self._parts:
+            return True
+        return self._literal is None and bool(self._buffer.strip())
+
+    @property
+    def consumed(self) -> int:
+        """
+        Absolute offset up to which input has been fully emitted.
+        """
+
+        return self._base
+
+    # ======================================================
+    # SCANNING
+    # ======================================================
+
+    def _split(self, final):
+        statements = []
+
+        if self._literal is not None and not self._skip_literal(final):
+            return statements
+
+        buffer = self._buffer
+        start = 0
+        i = self._scan
+
+        while True:
+            if self._copy is not None:
+                end, resume = find_data_end(buffer, self._copy, final)
+                if end is None:
+                    self._copy = resume
+                    i = len(buffer)
+                    break
+
+                statement = self._make_statement(start, end)
+                if statement:
+                    statements.append(statement)
+                start = i = end
+                self._copy = None
+                self._content = False
+                continue
+
+            match = _SPECIAL.search(buffer, i)
+
+            if match is None:
+                end = len(buffer)
+                # A trailing "-" or "/" may be the first half of a comment marker
+                # (unless a literal / comment just consumed it, e.g. "*/")
+                if not final and buffer.endswith(("-", "/")) and end > i:
+                    end -= 1
+                elif not final:
+                    dollar = buffer.rfind("$", i)
+                    if dollar != -1 and _PARTIAL_TAG.fullmatch(buffer, dollar):
+                        end = dollar
+                if buffer[i:end].strip():
+                    self._content = True
+                i = end
+                break
+
+            j = match.start()
+            if buffer[i:j].strip():
+                self._content = True
+
+            token = match.group()
+
+            if token == ";":
+                self._content = True
+                if COPY_FROM_STDIN.match(buffer, start, j):
+                    # The statement continues with its data block
+                    self._copy = self._copy_start = j + 1
+                    continue
+
+                statement = self._make_statement(start, j + 1)
+                if statement:
+                    statements.append(statement)
+                start = j + 1
+                i = j + 1
+                self._content = False
+                continue
+
+            end = self._skip(buffer, token, j)
+            if end is None:
+                # Needs more input: resume at this token next time
+                i = j
+                if final:
+                    # Unterminated literal/comment: leave it to the lexer
+                    self._content = self._content or token[0] in "'\"$"
+                    i = len(buffer)
+                break
+
+            if token[0] in "'\"$":
+                self._content = True
+            i = end
+
+        # Drop emitted text so the buffer only holds the open fragment
+        self._advance(start)
+        self._scan = i - start
+        if self._copy is not None:
+            self._copy -= start
+            self._copy_start -= start
+            self._tail = self._buffer[-len(_COPY_TAIL):]
+        return statements
+
+    # ======================================================
+    # COPY DATA
+    # ======================================================
+
+    def _copy_chunk(self, chunk):
+        """
+        Queue a chunk of a COPY data block; returns True once the
+        terminator may be in it (the block is then joined and split).
+        """
+
+        self._parts.append(chunk)
+        self._parts_size += len(chunk)
+
+        window = self._tail + chunk
+        self._tail = window[-len(_COPY_TAIL):]
+        end, _ = find_data_end(window, 0, final=False)
+        if end is None and not window.endswith(_COPY_TAIL):
+            return False
+
+        self._join_parts()
+        return True
+
+    def _join_parts(self):
+        if not self._parts:
+            return
+        # Only the text since the last search can hold the terminator
+        self._copy = max(self._copy, len(self._buffer) - len(_COPY_TAIL))
+        self._buffer += "".join(self._parts)
+        self._parts = []
+        self._parts_size = 0
+
+    def _bound_pending(self, statements):
+        if self.max_pending is None or len(self._buffer) + self._parts_size <= self.max_pending:
+            return statements
+
+        self._join_parts()
+
+        if self._copy is not None:
+            self._start_stream()
+            return statements
+
+        # An unterminated literal/comment starts at the scan position
+        opener = _SPECIAL.match(self._buffer, self._scan) if self._literal is None else None
+
+        statement = self._make_statement(0, len(self._buffer))
+        if statement:
+            statements.append(statement)
+
+        if opener is None:
+            self._advance(len(self._buffer))
+        else:
+            self._literal = opener.group()
+            self._trim_literal(opener.start())
+
+        self._scan = 0
+        self._content = False
+        return statements
+
+    def _start_stream(self):
+        """
+        Stop buffering an oversized COPY data block: its rows are checked
+        and counted from here on, then dropped.
+        """
+
+        newline = self._buffer.find("\n", self._copy_start)
+        if newline == -1:
+            return  # still on the command's line
+
+        self._stream = _CopyStream(self._make_statement(0, self._copy_start))
+        self._copy = None
+        self._advance(newline)
+        self._scan = 0
+
+    def _stream_rows(self, final):
+        """
+        Check the complete rows in _buffer (which starts with the newline
+        ending the previous row); return the COPY statement once the
+        terminator has arrived.
+        """
+
+        buffer = self._buffer
+        end, _ = find_data_end(buffer, 0, final)
+
+        cut = buffer.rfind("\n") if end is None else end - len(_COPY_TAIL)
+        if cut > 0:
+            self._stream.add(buffer[1:cut].split("\n"))
+            self._advance(cut)
+
+        if end is None:
+            return None
+        return self._end_stream(len(_COPY_TAIL), terminated=True)
+
+    def _end_stream(self, end, terminated):
+        stream = self._stream
+        statement = Statement(stream.text(terminated), stream.head.offset, stream.head.line, self._base + end)
+
+        self._stream = None
+        self._advance(end)
+        self._scan = 0
+        self._content = False
+        return statement
+
+    # ======================================================
+    # FORCED CUTS
+    # ======================================================
+
+    def _skip_literal(self, final):
+        """
+        Drop the rest of a literal/comment cut by max_pending; returns
+        True once it is closed and normal splitting can resume.
+        """
+
+        end = self._skip(self._buffer, self._literal, 0)
+        if end is None:
+            if final:
+                self._literal = None
+                self._advance(len(self._buffer))
+            else:
+                self._trim_literal(0)
+            return False
+
+        self._literal = None
+        self._advance(end)
+        self._scan = 0
+        return True
+
+    def _trim_literal(self, j):
+        """
+        Keep only the opener of the literal starting at j plus the few
+        characters a closing delimiter could begin with.
+        """
+
+        token = self._literal
+        buffer = self._buffer
+        body = j + len(token)
+
+        if token == "--":
+            keep = len(buffer)
+        elif token in ("'", '"'):
+            # A run of quotes at the end may hold an escaped pair: keep it whole
+            keep = len(buffer)
+            while keep > body and buffer[keep - 1] == token:
+                keep -= 1
+            keep = max(body, keep - 1)
+        else:
+            keep = max(body, len(buffer) - (len(token) - 1))
+
+        self._advance(keep)
+        self._buffer = token + self._buffer
+        self._base -= len(token)
+
+    def _skip(self, buffer, token, j):
+        """
+        Return the index just past the literal/comment starting at j,
+        or None if it is not complete yet.
+        """
+
+        if token == "--":
+            newline = buffer.find("\n", j + 2)
+            return None if newline == -1 else newline + 1
+
+        if token == "/*":
+            close = buffer.find("*/", j + 2)
+            return None if close == -1 else close + 2
+
+        if token[0] == "$":
+            close = buffer.find(token, j + len(token))
+            return None if close == -1 else close + len(token)
+
+        # '...' and "..." with doubled-quote escapes
+        k = j + 1
+        while True:
+            close = buffer.find(token, k)
+            if close == -1:
+                return None
+            if close + 1 < len(buffer) and buffer[close + 1] == token:
+                k = close + 2
+                continue
+            if close + 1 == len(buffer):
+                # Might be the first half of an escaped pair
+                return None
+            return close + 1
+
+    # ======================================================
+    # HELPERS
+    # ======================================================
+
+    def _make_statement(self, start, end):
+        raw = self._buffer[start:end]
+        text = raw.strip()
+        if not text or text == ";":
+            return None
+
+        lead = len(raw) - len(raw.lstrip())
+        offset = self._base + start + lead
+
+        # Count newlines incrementally; statements arrive in buffer order
+        position = start + lead
+        self._line_no += self._buffer.count("\n", self._line_pos, position)
+        self._line_pos = position
+        line = self._line_no
+
+        return Statement(text, offset, line, self._base + end)
+
+    def _advance(self, count):
+        if count <= 0:
+            return
+        # Statements are only cut before `count`, so _line_pos <= count
+        self._line_no += self._buffer.count("\n", self._line_pos, count)
+        self._line_pos = 0
+        self._base += count
+        self._buffer = self._buffer[count:]
+
+
+def split_statements(text: str) -> list:
+    splitter = StatementSplitter()
+    statements = splitter.feed(text)
+    statements.extend(splitter.flush())
+    return statements
+
+
+def iter_statements(chunks, max_pending=None, offset=0, line=1):
+    """
+    Lazily split an iterable of text chunks (e.g. a file read in blocks).
+    """
+
+    splitter = StatementSplitter(max_pending, offset, line)
+
+    for chunk in chunks:
+        yield from splitter.feed(chunk)
+
+    yield from splitter.flush()
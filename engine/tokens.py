@@ -24,6 +24,7 @@ class TokenType(Enum):
     PAREN_CLOSE = "PAREN_CLOSE"
     DOT = "DOT"
     ASTERISK = "ASTERISK"
+    COPY_DATA = "COPY_DATA"
     EOF = "EOF"
 
 
@@ -99,6 +100,14 @@ KEYWORDS = {
     "VIEW"
 }
 
+# Words with a grammar role that stay usable as names: they are lexed as
+# identifiers and matched by text where they matter (COPY is PostgreSQL)
+UNRESERVED_WORDS = {
+    "COPY",
+    "STDIN",
+    "STDOUT"
+}
+
 
 
 # ==========================================
@@ -14,23 +14,31 @@ Responsibilities:
 - Prevent crashes
 """
 
+from time import perf_counter
+
+from engine.fingerprint import fingerprint_tokens
 from engine.lexer import Lexer
 from engine.parser import Parser
 from engine.errors import SQLSyntaxError
 
 
-def validate_query(query: str, dialect: str = "postgres") -> dict:
+def validate_query(query: str, dialect: str = "postgres", timings: dict | None = None) -> dict:
     """
     Main validation entry point.
 
     Parameters:
         query (str): SQL query input
         dialect (str): postgres | mysql | plsql
+        timings (dict | None): if given, filled with "lex" / "parse"
+            durations in seconds (phases that did not run are absent)
 
     Returns:
-        dict: structured validation result
+        dict: structured validation result ("fingerprint" is the
+        engine.fingerprint value when the query could be lexed)
     """
 
+    tokens = None
+
     try:
         # -----------------------------
         # Basic Input Validation
@@ -44,21 +52,32 @@ def validate_query(query: str, dialect: str = "postgres") -> dict:
         # -----------------------------
         # Lexical Analysis
         # -----------------------------
-        lexer = Lexer(query)
-        tokens = lexer.tokenize()
+        started = perf_counter()
+        lexer = Lexer(query, dialect)
+        try:
+            tokens = lexer.tokenize()
+        finally:
+            if timings is not None:
+                timings["lex"] = perf_counter() - started
 
         # -----------------------------
         # Parsing
         # -----------------------------
+        started = perf_counter()
         parser = Parser(tokens, query, dialect)
-        ast = parser.parse()
+        try:
+            ast = parser.parse()
+        finally:
+            if timings is not None:
+                timings["parse"] = perf_counter() - started
 
         return {
             "status": "success",
             "dialect": dialect,
             "type": None,
             "message": "Query parsed successfully.",
-            "ast": ast
+            "ast": ast,
+            "fingerprint": fingerprint_tokens(tokens)
         }
 
     except SQLSyntaxError as e:
@@ -66,7 +85,11 @@ def validate_query(query: str, dialect: str = "postgres") -> dict:
             "status": "error",
             "dialect": dialect,
             "type": "SyntaxError",
-            "message": str(e)
+            "message": str(e),
+            "position": e.position,
+            "expected": sorted(e.expected) if e.expected else None,
+            "suggestion": e.suggestion,
+            "fingerprint": fingerprint_tokens(tokens) if tokens is not None else None
         }
 
     except Exception as e:
@@ -0,0 +1,135 @@
+"""
+Watch Mode
+----------
+Keeps a warm process that re-validates .sql files as they change.
+
+Each poll:
+1. expands the watched paths (new and deleted files are noticed)
+2. asks the Manifest which files changed: an os.stat per file, and a
+   content hash only when size or mtime moved
+3. re-validates changed files; statements whose hash is unchanged
+   reuse their previous result
+4. reports per-file diffs of failing statements (new failures / fixed)
+"""
+
+import time
+
+from engine.batch import expand_inputs, iter_validated_files
+from engine.manifest import compact_result
+
+
+POLL_INTERVAL = 1.0
+
+
+class FileChange:
+    __slots__ = ("path", "old", "new")
+
+    def __init__(self, path, old, new):
+        self.path = path
+        self.old = old          # compact statements before (None: new file)
+        self.new = new          # compact statements now (None: file deleted)
+
+    def failures(self):
+        """
+        Returns:
+            tuple: (new failures, fixed failures) as compact statements
+        """
+
+        before = _failing(self.old)
+        after = _failing(self.new)
+
+        added = [s for h, s in after.items() if h not in before]
+        fixed = [s for h, s in before.items() if h not in after]
+        return added, fixed
+
+    @property
+    def failing(self):
+        return len(_failing(self.new))
+
+
+class Watcher:
+    def __init__(self, paths, manifest, jobs=1):
+        self.paths = paths
+        self.manifest = manifest
+        self.jobs = jobs
+        self._watched = set()
+        self._scanned = False
+
+    def scan(self) -> list:
+        """
+        Returns:
+            list: FileChange for every file added, modified or deleted
+                since the previous scan (all files on the first scan)
+        """
+
+        try:
+            files = expand_inputs(self.paths)
+        except FileNotFoundError:
+            files = []
+
+        changes = []
+
+        for path in sorted(self._watched - set(files)):
+            old = self.manifest.files.get(path, {}).get("statements")
+            self.manifest.remove(path)
+            changes.append(FileChange(path, old, None))
+        self._watched = set(files)
+
+        changed = []
+        metas = {}
+        known = {}
+        for path in files:
+            entry, meta = self.manifest.lookup(path)
+            if entry is None and meta is not None:
+                changed.append(path)
+                metas[path] = meta
+                known[path] = self.manifest.known_results(path)
+            elif entry is not None and not self._scanned:
+                # First scan with a persisted manifest: report current state
+                changes.append(FileChange(path, None, entry["statements"]))
+        self._scanned = True
+
+        if not changed:
+            return changes
+
+        results = {path: [] for path in changed}
+        unreadable = set()
+
+        for path, statement, result, _ in iter_validated_files(
+            changed,
+            self.manifest.dialect,
+            jobs=self.jobs,
+            known=known
+        ):
+            if statement is None:
+                unreadable.add(path)
+            else:
+                results[path].append(compact_result(statement, result))
+
+        for path in changed:
+            if path in unreadable:
+                # Probably mid-save; try again on the next poll
+                continue
+            old = self.manifest.files.get(path, {}).get("statements")
+            self.manifest.update(path, metas[path], results[path])
+            changes.append(FileChange(path, old, results[path]))
+
+        return changes
+
+    def run(self, on_changes, interval=POLL_INTERVAL, should_stop=None):
+        """
+        Poll until should_stop() returns True (or forever / Ctrl-C).
+        """
+
+        while should_stop is None or not should_stop():
+            changes = self.scan()
+            if changes:
+                on_changes(changes)
+                self.manifest.save()
+            time.sleep(interval)
+
+
+def _failing(statements):
+    if not statements:
+        return {}
+    return {s["hash"]: s for s in statements if s["status"] == "error"}
@@ -0,0 +1,188 @@
+"""
+Streaming Aggregates
+--------------------
+Fixed-memory building blocks for one-pass report summaries.
+
+- LogHistogram: log-bucketed latency histogram (percentiles within a
+  few percent, constant size no matter how many samples)
+- TopK: Space-Saving heavy hitters (the k most frequent keys with
+  bounded memory and per-key over-count bounds)
+"""
+
+import heapq
+import math
+
+
+# ======================================================
+# LOG HISTOGRAM
+# ======================================================
+
+class LogHistogram:
+    """
+    Buckets grow geometrically by `growth`; a reported percentile is the
+    geometric midpoint of its bucket, so the relative error is at most
+    about (sqrt(growth) - 1).
+    """
+
+    def __init__(self, min_value=1e-7, max_value=100.0, growth=1.1):
+        self.min_value = min_value
+        self.growth = growth
+        self._log_growth = math.log(growth)
+
+        size = int(math.ceil(math.log(max_value / min_value) / self._log_growth)) + 1
+        # counts[0] holds values below min_value, counts[-1] values above max_value
+        self.counts = [0] * (size + 2)
+
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value: float):
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+        if value < self.min_value:
+            self.counts[0] += 1
+            return
+
+        bucket = int(math.log(value / self.min_value) / self._log_growth) + 1
+        self.counts[min(bucket, len(self.counts) - 1)] += 1
+
+    def percentile(self, p: float):
+        """
+        Value at percentile p (0-100), or None if empty.
+        """
+
+        if not self.count:
+            return None
+
+        rank = max(1, math.ceil(self.count * p / 100.0))
+        seen = 0
+
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self._bucket_value(bucket)
+
+        return self.max
+
+    def _bucket_value(self, bucket):
+        if bucket == 0:
+            return self.min
+        if bucket == len(self.counts) - 1:
+            return self.max
+
+        low = self.min_value * self.growth ** (bucket - 1)
+        value = low * math.sqrt(self.growth)
+        # Never report outside the observed range
+        return min(max(value, self.min), self.max)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    def state(self) -> dict:
+        return {
+            "counts": self.counts,
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max
+        }
+
+    def restore(self, state: dict):
+        # Bucket layout comes from the constructor arguments
+        if len(state["counts"]) != len(self.counts):
+            raise ValueError("histogram layout does not match")
+        self.counts = list(state["counts"])
+        self.count = state["count"]
+        self.total = state["total"]
+        self.min = state["min"]
+        self.max = state["max"]
+
+
+# ======================================================
+# TOP-K (SPACE-SAVING)
+# ======================================================
+
+class TopK:
+    """
+    Tracks at most `capacity` keys. When full, a new key replaces the
+    least frequent one and inherits its count; `error` is the maximum
+    over-count of that entry.
+
+    The least frequent key is found through a min-heap holding one
+    (count, seq, key) item per key. Counts only grow, so a heap count is
+    a lower bound, refreshed lazily on eviction: O(log capacity) per
+    insert instead of a scan.
+    """
+
+    def __init__(self, capacity=50):
+        self.capacity = max(1, capacity)
+        self.entries = {}       # key -> [count, error, payload]
+        self.total = 0
+        self._heap = []
+        self._seq = 0           # insertion order breaks count ties
+
+    def add(self, key, payload=None, count=1):
+        """
+        Count key; payload is stored the first time the key is tracked.
+        Returns the entry list [count, error, payload].
+        """
+
+        self.total += count
+        entry = self.entries.get(key)
+
+        if entry is not None:
+            entry[0] += count
+            return entry
+
+        if len(self.entries) < self.capacity:
+            entry = [count, 0, payload]
+        else:
+            floor = self.entries.pop(self._pop_min())[0]
+            entry = [floor + count, floor, payload]
+
+        self.entries[key] = entry
+        self._push(key, entry[0])
+        return entry
+
+    def _push(self, key, count):
+        heapq.heappush(self._heap, (count, self._seq, key))
+        self._seq += 1
+
+    def _pop_min(self):
+        while True:
+            count, _, key = heapq.heappop(self._heap)
+            current = self.entries[key][0]
+            if current == count:
+                # The smallest lower bound is exact: no key counts less
+                return key
+            self._push(key, current)
+
+    def most_common(self, n=None):
+        """
+        Returns [(key, count, error, payload), ...] by descending count.
+        """
+
+        # Ties go to the entry with the smaller over-count bound
+        ranked = sorted(self.entries.items(), key=lambda item: (-item[1][0], item[1][1]))
+        if n is not None:
+            ranked = ranked[:n]
+        return [(key, e[0], e[1], e[2]) for key, e in ranked]
+
+    def state(self) -> dict:
+        return {"total": self.total, "entries": [[key] + entry for key, entry in self.entries.items()]}
+
+    def restore(self, state: dict):
+        self.total = state["total"]
+        self.entries = {key: [count, error, payload] for key, count, error, payload in state["entries"]}
+        self._heap = []
+        self._seq = 0
+        for key, entry in self.entries.items():
+            self._push(key, entry[0])
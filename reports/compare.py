@@ -0,0 +1,280 @@
+"""
+Run Comparison
+--------------
+Diffs two validation result sets (JSON Lines or SQLite report outputs).
+
+Statements are joined on engine.fingerprint.statement_hash, so
+formatting-only edits still match. Each statement in the new run is
+classified as:
+
+    newly_failing  → passed before, fails now
+    newly_passing  → failed before, passes now
+    changed_error  → fails in both runs, with a different error
+    added          → not present in the old run
+    (unchanged statements are only counted)
+
+Statements only present in the old run are counted as `removed`.
+Repeated statements are matched occurrence by occurrence, in run order:
+three copies before and two after make two comparisons and one removal.
+
+The join is a hash join: the old run is loaded into a dict of compact
+tuples and the new run is streamed against it (O(n)). When the old run
+is too large for one dict, both sides are first spilled to temporary
+partition files by hash (Grace hash join), so memory stays bounded for
+tens of millions of rows.
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+from collections import deque
+
+from engine.fingerprint import statement_hash
+
+
+PARTITION_ROWS = 2_000_000
+
+CHANGE_KINDS = ["newly_failing", "newly_passing", "changed_error", "added"]
+
+
+# ======================================================
+# LOADING
+# ======================================================
+
+def read_results(path: str):
+    """
+    Yield (hash, status, error_key, message, location, query) for every
+    statement in a report output.
+
+    Accepts `.jsonl` reports and SQLite reports (`audit.db` for its
+    latest run, `audit.db#RUN_ID` for a specific one).
+    """
+
+    db_path, run_id = _split_run(path)
+
+    if db_path.endswith(".db"):
+        yield from _read_sqlite(db_path, run_id)
+    else:
+        yield from _read_jsonl(path)
+
+
+def estimate_rows(path: str) -> int:
+    db_path, run_id = _split_run(path)
+
+    if db_path.endswith(".db"):
+        conn = sqlite3.connect(db_path)
+        try:
+            run_id = run_id or _latest_run(conn)
+            return conn.execute(
+                "SELECT COUNT(*) FROM results WHERE run_id = ?", (run_id,)
+            ).fetchone()[0]
+        finally:
+            conn.close()
+
+    # JSON Lines records are a few hundred bytes each
+    return os.path.getsize(path) // 300
+
+
+def _split_run(path):
+    base, sep, run = path.rpartition("#")
+    if sep and base.endswith(".db") and run.isdigit():
+        return base, int(run)
+    return path, None
+
+
+def _latest_run(conn):
+    row = conn.execute("SELECT MAX(id) FROM runs").fetchone()
+    return row[0]
+
+
+def _read_jsonl(path):
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if "status" not in record:
+                # Trailer lines (e.g. {"ai_service": ...})
+                continue
+            yield _row(record)
+
+
+def _read_sqlite(path, run_id):
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+
+    try:
+        run_id = run_id or _latest_run(conn)
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(results)")}
+        wanted = [
+            c for c in ("index", "source", "line", "status", "error_type", "message", "expected", "query")
+            if c in columns
+        ]
+        cursor = conn.execute(
+            "SELECT " + ", ".join(f'"{c}"' for c in wanted)
+            + ' FROM results WHERE run_id = ? ORDER BY "index"',
+            (run_id,)
+        )
+        for row in cursor:
+            yield _row(dict(row))
+    finally:
+        conn.close()
+
+
+def _row(record):
+    query = record.get("query") or ""
+    status = record.get("status")
+    message = (record.get("message") or "").split("\n", 1)[0]
+
+    error_key = None
+    if status == "error":
+        error_key = f"{record.get('error_type')}|{message}|{record.get('expected') or ''}"
+
+    if record.get("source"):
+        location = f"{record['source']}:{record.get('line')}"
+    else:
+        location = f"query {record.get('index')}"
+
+    return statement_hash(query), status, error_key, message, location, query
+
+
+# ======================================================
+# COMPARISON
+# ======================================================
+
+def compare_results(old_rows, new_rows, on_change=None, partitions=1) -> dict:
+    """
+    Parameters:
+        old_rows / new_rows: iterables from read_results
+        on_change (callable | None): on_change(kind, old_row, new_row) for
+            every statement in CHANGE_KINDS (old_row is None for "added")
+        partitions (int): > 1 spills both sides to disk first
+
+    Returns:
+        dict: counts per kind, plus "unchanged" and "removed"
+    """
+
+    counts = dict.fromkeys(CHANGE_KINDS + ["unchanged", "removed"], 0)
+
+    if partitions <= 1:
+        _join(old_rows, new_rows, counts, on_change)
+        return counts
+
+    with tempfile.TemporaryDirectory(prefix="sqlidator-compare-") as directory:
+        old_files = _spill(old_rows, directory, "old", partitions)
+        new_files = _spill(new_rows, directory, "new", partitions)
+
+        for old_file, new_file in zip(old_files, new_files):
+            _join(_unspill(old_file), _unspill(new_file), counts, on_change)
+
+    return counts
+
+
+def compare_paths(old_path: str, new_path: str, on_change=None) -> dict:
+    partitions = max(1, -(-estimate_rows(old_path) // PARTITION_ROWS))
+    return compare_results(
+        read_results(old_path),
+        read_results(new_path),
+        on_change=on_change,
+        partitions=partitions
+    )
+
+
+def _join(old_rows, new_rows, counts, on_change):
+    # Build side keeps only what classification and reporting need:
+    # one tuple per hash, or a deque of them for repeated statements
+    old = {}
+    for row in old_rows:
+        entry = (row[1], row[2], row[3], row[4])
+        existing = old.get(row[0])
+        if existing is None:
+            old[row[0]] = entry
+        elif isinstance(existing, deque):
+            existing.append(entry)
+        else:
+            old[row[0]] = deque((existing, entry))
+
+    for row in new_rows:
+        previous = old.get(row[0])
+        if isinstance(previous, deque):
+            entries = previous
+            previous = entries.popleft()
+            if not entries:
+                del old[row[0]]
+        elif previous is not None:
+            del old[row[0]]
+
+        kind = _classify(previous, row)
+        counts[kind] += 1
+
+        if on_change is not None and kind != "unchanged":
+            on_change(kind, previous, row)
+
+    counts["removed"] += sum(
+        len(entry) if isinstance(entry, deque) else 1
+        for entry in old.values()
+    )
+
+
+def _classify(previous, row):
+    if previous is None:
+        return "added"
+
+    old_status, old_error = previous[0], previous[1]
+    status, error_key = row[1], row[2]
+
+    if old_status == status:
+        if status == "error" and old_error != error_key:
+            return "changed_error"
+        return "unchanged"
+
+    return "newly_failing" if status == "error" else "newly_passing"
+
+
+def _spill(rows, directory, side, partitions):
+    paths = [os.path.join(directory, f"{side}-{i}.jsonl") for i in range(partitions)]
+    files = [open(path, "w", encoding="utf-8") for path in paths]
+
+    try:
+        for row in rows:
+            files[row[0] % partitions].write(json.dumps(row) + "\n")
+    finally:
+        for f in files:
+            f.close()
+
+    return paths
+
+
+def _unspill(path):
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            yield tuple(json.loads(line))
+
+
+# ======================================================
+# OUTPUT
+# ======================================================
+
+def change_record(kind, old_row, new_row) -> dict:
+    return {
+        "change": kind,
+        "location": new_row[4],
+        "old_location": old_row[3] if old_row else None,
+        "old_status": old_row[0] if old_row else None,
+        "new_status": new_row[1],
+        "old_message": old_row[2] if old_row else None,
+        "new_message": new_row[3],
+        "query": new_row[5]
+    }
+
+
+def format_compare_counts(counts: dict) -> list:
+    return [
+        f"Newly failing : {counts['newly_failing']:,}",
+        f"Newly passing : {counts['newly_passing']:,}",
+        f"Changed error : {counts['changed_error']:,}",
+        f"Added         : {counts['added']:,}",
+        f"Removed       : {counts['removed']:,}",
+        f"Unchanged     : {counts['unchanged']:,}"
+    ]
@@ -9,8 +9,24 @@ import io
 import json
 from datetime import datetime
 
+from reports.records import RECORD_FIELDS
 
-def generate_csv_report(query: str, result: dict, ai_result: dict | None = None) -> str:
+
+AI_STATS_COLUMNS = [
+    "breaker_state",
+    "successes",
+    "failures",
+    "rejected",
+    "budget_rejected"
+]
+
+
+def generate_csv_report(
+    query: str,
+    result: dict,
+    ai_result: dict | None = None,
+    ai_stats: dict | None = None
+) -> str:
     try:
         output = io.StringIO()
         writer = csv.writer(output)
@@ -18,14 +34,18 @@ def generate_csv_report(query: str, result: dict, ai_result: dict | None = None)
         # -----------------------------
         # Header Row
         # -----------------------------
-        writer.writerow([
+        header = [
             "generated_on",
             "dialect",
             "status",
             "original_query",
             "corrected_query",
             "explanation"
-        ])
+        ]
+        if ai_stats:
+            header += [f"ai_{column}" for column in AI_STATS_COLUMNS]
+
+        writer.writerow(header)
 
         # -----------------------------
         # Default Values
@@ -51,16 +71,58 @@ def generate_csv_report(query: str, result: dict, ai_result: dict | None = None)
         # -----------------------------
         # Write Data Row
         # -----------------------------
-        writer.writerow([
+        row = [
             datetime.now().isoformat(),
             result.get("dialect"),
             result.get("status"),
             query.replace("\n", " "),
             corrected_query.replace("\n", " "),
             explanation.replace("\n", " ")
-        ])
+        ]
+        if ai_stats:
+            row += [ai_stats.get(column) for column in AI_STATS_COLUMNS]
+
+        writer.writerow(row)
 
         return output.getvalue()
 
     except Exception:
         return "Failed to generate CSV report."
+
+
+class CsvReportWriter:
+    """
+    Streaming CSV report: csv.writer directly on the file handle,
+    one row per statement.
+    """
+
+    def __init__(self, fh, close_file=False, fields=None, resume=None):
+        self.fh = fh
+        self.close_file = close_file
+        self.fields = fields or RECORD_FIELDS
+        self.writer = csv.writer(fh)
+        if not resume:
+            self.writer.writerow(self.fields)
+
+    def write(self, record: dict):
+        self.writer.writerow([
+            _one_line(record.get(field)) for field in self.fields
+        ])
+
+    def close(self, ai_stats: dict | None = None):
+        # Rows share one schema; AI service stats go to the TXT / JSON reports
+        self.fh.flush()
+        if self.close_file:
+            self.fh.close()
+
+    def checkpoint(self) -> dict:
+        self.fh.flush()
+        return {"size": self.fh.tell()}
+
+
+def _one_line(value):
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value.replace("\n", " ")
+    return value
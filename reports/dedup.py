@@ -0,0 +1,84 @@
+"""
+Error Deduplication
+-------------------
+Collapses repeated failures into one report record per error signature.
+
+Signature = (query fingerprint, error type, expected-token set), so
+10,000 failures of the same ORM template differing only in literal
+values become a single record with:
+
+    occurrences  → how many statements hit it
+    first_seen   → source:line of the first occurrence
+    last_seen    → source:line of the last occurrence
+
+The sample (query, message, AI suggestion) is the first occurrence.
+Successful statements pass straight through; error groups are written
+when the run closes, in first-seen order.
+"""
+
+from reports.records import record_fingerprint
+
+
+DEDUP_FIELDS = ["occurrences", "first_seen", "last_seen"]
+
+
+def error_signature(record: dict) -> tuple:
+    return (
+        record_fingerprint(record),
+        record.get("error_type"),
+        record.get("expected")
+    )
+
+
+def record_location(record: dict) -> str:
+    if record.get("source"):
+        return f"{record['source']}:{record.get('line')}"
+    return f"query {record.get('index')}"
+
+
+class DedupReportWriter:
+    """
+    Wraps any streaming report writer (reports.writers interface).
+    """
+
+    def __init__(self, writer, resume=None):
+        self.writer = writer
+        self.groups = {}        # signature -> sample record (dicts keep insertion order)
+
+        if resume:
+            for signature, group in resume["groups"]:
+                self.groups[tuple(signature)] = group
+
+    def write(self, record: dict):
+        if record.get("status") != "error":
+            self.writer.write(record)
+            return
+
+        signature = error_signature(record)
+        group = self.groups.get(signature)
+        location = record_location(record)
+
+        if group is None:
+            group = dict(record)
+            group["occurrences"] = 0
+            group["first_seen"] = location
+            self.groups[signature] = group
+        elif group.get("ai_status") != "success" and record.get("ai_status") == "success":
+            # Prefer a sample that carries an AI suggestion
+            for field in ("ai_status", "corrected_query", "explanation"):
+                group[field] = record.get(field)
+
+        group["occurrences"] += 1
+        group["last_seen"] = location
+
+    def close(self, ai_stats: dict | None = None):
+        for group in self.groups.values():
+            self.writer.write(group)
+        self.groups = {}
+        self.writer.close(ai_stats)
+
+    def checkpoint(self) -> dict:
+        return {
+            "groups": [[list(signature), group] for signature, group in self.groups.items()],
+            "writer": self.writer.checkpoint()
+        }
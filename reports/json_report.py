@@ -8,7 +8,12 @@ import json
 from datetime import datetime
 
 
-def generate_json_report(query: str, result: dict, ai_result: dict | None = None) -> str:
+def generate_json_report(
+    query: str,
+    result: dict,
+    ai_result: dict | None = None,
+    ai_stats: dict | None = None
+) -> str:
     try:
         report = {
             "metadata": {
@@ -24,6 +29,9 @@ def generate_json_report(query: str, result: dict, ai_result: dict | None = None
             "ai_suggestions": None
         }
 
+        if ai_stats:
+            report["ai_service"] = ai_stats
+
         # -----------------------------
         # AI Structured Handling
         # -----------------------------
@@ -45,3 +53,31 @@ def generate_json_report(query: str, result: dict, ai_result: dict | None = None
         return json.dumps({
             "error": "Failed to generate JSON report."
         }, indent=4)
+
+
+class JsonLinesReportWriter:
+    """
+    Streaming JSON Lines report: one compact record per statement,
+    written straight to the file handle.
+    """
+
+    def __init__(self, fh, close_file=False, resume=None):
+        # Nothing to restore: records are self-contained lines
+        self.fh = fh
+        self.close_file = close_file
+
+    def write(self, record: dict):
+        self.fh.write(json.dumps(record, ensure_ascii=False, default=str))
+        self.fh.write("\n")
+
+    def close(self, ai_stats: dict | None = None):
+        if ai_stats:
+            self.fh.write(json.dumps({"ai_service": ai_stats}) + "\n")
+        self.fh.flush()
+        if self.close_file:
+            self.fh.close()
+
+    def checkpoint(self) -> dict:
+        self.fh.flush()
+        # stdout may be a pipe
+        return {"size": self.fh.tell() if self.fh.seekable() else None}
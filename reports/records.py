@@ -0,0 +1,123 @@
+"""
+Report Records
+--------------
+Flat, JSON-serializable per-statement records shared by the
+streaming report writers (JSON Lines / CSV / TXT).
+"""
+
+import csv
+import io
+import json
+
+from engine.copy_data import split_command
+from engine.fingerprint import fingerprint_query
+
+
+RECORD_FIELDS = [
+    "index",
+    "source",
+    "line",
+    "dialect",
+    "status",
+    "statement_type",
+    "error_type",
+    "message",
+    "expected",
+    "query",
+    "ai_status",
+    "corrected_query",
+    "explanation"
+]
+
+
+def build_record(
+    index: int,
+    query: str,
+    result: dict,
+    ai_result: dict | None = None,
+    source: str | None = None,
+    line: int | None = None,
+    timings: dict | None = None,
+    byte_end: int | None = None
+) -> dict:
+    status = result.get("status")
+    corrected_query, explanation = parse_ai_result(ai_result)
+
+    record = {
+        "index": index,
+        "source": source,
+        "line": line,
+        "dialect": result.get("dialect"),
+        "status": status,
+        "statement_type": statement_type(result),
+        "error_type": result.get("type") if status == "error" else None,
+        "message": result.get("message"),
+        "expected": ", ".join(result["expected"]) if result.get("expected") else None,
+        "query": split_command(query),  # without COPY data rows
+        "ai_status": ai_result.get("ai_status") if ai_result else None,
+        "corrected_query": corrected_query,
+        "explanation": explanation
+    }
+
+    # Only collected for the summary report; not part of RECORD_FIELDS
+    if timings is not None:
+        record["timings"] = timings
+    if byte_end is not None:
+        record["byte_end"] = byte_end
+
+    # Computed by the validator from its tokens; reused by the dedup,
+    # summary and SQLite writers instead of lexing the query again
+    if result.get("fingerprint"):
+        record["fingerprint"] = result["fingerprint"]
+
+    return record
+
+
+def record_fingerprint(record: dict) -> str:
+    """
+    The record's query fingerprint (engine.fingerprint), computed only
+    for records that don't carry one (e.g. replayed or resumed results).
+    """
+
+    return record.get("fingerprint") or fingerprint_query(record.get("query") or "")
+
+
+def statement_type(result: dict) -> str | None:
+    """
+    "SELECT", "CREATE_TABLE", ... ("+"-joined for multi-statement input).
+    """
+
+    ast = result.get("ast")
+    if not ast:
+        # Results replayed from a manifest carry the type instead of an AST
+        return result.get("statement_type")
+    if not isinstance(ast, list):
+        ast = [ast]
+    return "+".join(getattr(node, "type", "UNKNOWN") for node in ast)
+
+
+def parse_ai_result(ai_result: dict | None):
+    """
+    Returns:
+        tuple: (corrected_query, explanation); JSON- and CSV-mode answers
+        are unpacked, anything else is kept as the explanation text
+    """
+
+    if not ai_result or ai_result.get("ai_status") != "success":
+        return None, None
+
+    message = ai_result.get("ai_message") or ""
+
+    try:
+        parsed = json.loads(message)
+        if isinstance(parsed, dict):
+            return parsed.get("corrected_query"), parsed.get("explanation")
+    except ValueError:
+        pass
+
+    if message.startswith("original_query,corrected_query"):
+        rows = list(csv.reader(io.StringIO(message)))
+        if len(rows) >= 2 and len(rows[1]) >= 3:
+            return rows[1][1], rows[1][2]
+
+    return None, message
@@ -0,0 +1,172 @@
+"""
+SQLite Report Sink
+------------------
+Writes validation records to a local SQLite database so large audit
+runs can be queried afterwards with plain SQL.
+
+- WAL journal, synchronous=NORMAL
+- rows are buffered and inserted with executemany, one transaction
+  per batch
+- indexed on status, error_type, dialect and fingerprint
+- every CLI run gets a row in `runs`; results reference it by run_id
+
+Example:
+    SELECT error_type, COUNT(*) FROM results
+    WHERE status = 'error' GROUP BY error_type;
+"""
+
+import json
+import sqlite3
+from datetime import datetime
+
+from reports.dedup import DEDUP_FIELDS
+from reports.records import RECORD_FIELDS, record_fingerprint
+
+
+INSERT_BATCH_SIZE = 10000
+
+RESULT_COLUMNS = RECORD_FIELDS + DEDUP_FIELDS + ["fingerprint"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id          INTEGER PRIMARY KEY,
+    started_at  TEXT NOT NULL,
+    finished_at TEXT,
+    statements  INTEGER,
+    ai_stats    TEXT
+);
+
+CREATE TABLE IF NOT EXISTS results (
+    run_id          INTEGER NOT NULL REFERENCES runs(id),
+    "index"         INTEGER NOT NULL,
+    source          TEXT,
+    line            INTEGER,
+    dialect         TEXT,
+    status          TEXT,
+    statement_type  TEXT,
+    error_type      TEXT,
+    message         TEXT,
+    expected        TEXT,
+    query           TEXT,
+    ai_status       TEXT,
+    corrected_query TEXT,
+    explanation     TEXT,
+    occurrences     INTEGER,
+    first_seen      TEXT,
+    last_seen       TEXT,
+    fingerprint     TEXT,
+    PRIMARY KEY (run_id, "index")
+);
+
+CREATE INDEX IF NOT EXISTS idx_results_status ON results (status);
+CREATE INDEX IF NOT EXISTS idx_results_error_type ON results (error_type);
+CREATE INDEX IF NOT EXISTS idx_results_dialect ON results (dialect);
+CREATE INDEX IF NOT EXISTS idx_results_fingerprint ON results (fingerprint);
+"""
+
+_INSERT = (
+    "INSERT INTO results (run_id, "
+    + ", ".join(f'"{column}"' for column in RESULT_COLUMNS)
+    + ") VALUES ("
+    + ", ".join("?" for _ in range(len(RESULT_COLUMNS) + 1))
+    + ")"
+)
+
+
+class SqliteReportWriter:
+    """
+    Streaming report writer backed by sqlite3 (same interface as the
+    file writers in reports.writers).
+    """
+
+    def __init__(self, path: str, batch_size: int = INSERT_BATCH_SIZE, resume=None):
+        """
+        resume: state from checkpoint() to continue an interrupted run
+            (same run_id; rows inserted after the checkpoint are dropped)
+        """
+
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self.count = 0          # rows written
+        self.statements = 0     # statements they stand for (dedup groups count every occurrence)
+        self._rows = []
+
+        # Autocommit mode: transactions are opened explicitly per batch
+        self.conn = sqlite3.connect(path, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._add_missing_columns()
+
+        if resume:
+            self.run_id = resume["run_id"]
+            self.count = resume["count"]
+            self.statements = resume.get("statements", self.count)
+            self.conn.execute(
+                "DELETE FROM results WHERE run_id = ? AND rowid > ?",
+                (self.run_id, resume["last_rowid"])
+            )
+            return
+
+        cursor = self.conn.execute(
+            "INSERT INTO runs (started_at) VALUES (?)",
+            (datetime.now().isoformat(timespec="seconds"),)
+        )
+        self.run_id = cursor.lastrowid
+
+    def write(self, record: dict):
+        row = [self.run_id]
+        row.extend(record.get(field) for field in RECORD_FIELDS + DEDUP_FIELDS)
+        row.append(record_fingerprint(record))
+
+        self._rows.append(row)
+        self.count += 1
+        self.statements += record.get("occurrences") or 1
+
+        if len(self._rows) >= self.batch_size:
+            self.flush()
+
+    def _add_missing_columns(self):
+        # Databases written by older versions lack newer record fields
+        existing = {row[1] for row in self.conn.execute("PRAGMA table_info(results)")}
+        for column in RESULT_COLUMNS:
+            if column not in existing:
+                self.conn.execute(f'ALTER TABLE results ADD COLUMN "{column}"')
+
+    def flush(self):
+        if not self._rows:
+            return
+
+        self.conn.execute("BEGIN")
+        try:
+            self.conn.executemany(_INSERT, self._rows)
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+        self._rows = []
+
+    def checkpoint(self) -> dict:
+        self.flush()
+        # Table-wide MAX(rowid) is O(1); resume deletes by run_id anyway
+        last_rowid = self.conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM results").fetchone()[0]
+        return {
+            "run_id": self.run_id,
+            "count": self.count,
+            "statements": self.statements,
+            "last_rowid": last_rowid
+        }
+
+    def close(self, ai_stats: dict | None = None):
+        self.flush()
+
+        self.conn.execute(
+            "UPDATE runs SET finished_at = ?, statements = ?, ai_stats = ? WHERE id = ?",
+            (
+                datetime.now().isoformat(timespec="seconds"),
+                self.statements,
+                json.dumps(ai_stats) if ai_stats else None,
+                self.run_id
+            )
+        )
+        self.conn.close()
@@ -0,0 +1,210 @@
+"""
+Summary Report
+--------------
+Aggregate view of a run, computed in one streaming pass.
+
+- statement counts per type (SELECT, INSERT, CREATE_TABLE, ...)
+- error counts per error type
+- most frequent failing statements, grouped by query fingerprint
+- throughput (statements/s, MB/s of input)
+- lex / parse latency percentiles
+
+Memory stays fixed regardless of input size: statement and error types
+are small closed sets, fingerprints go through a bounded TopK and
+latencies through LogHistograms.
+"""
+
+from collections import Counter
+from datetime import datetime
+from time import perf_counter
+
+from reports.aggregates import LogHistogram, TopK
+from reports.records import record_fingerprint
+from reports.text_report import format_ai_stats
+
+
+TOP_ERROR_GROUPS = 20
+TRACKED_ERROR_GROUPS = 200
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+class SummaryReport:
+    def __init__(self, top_errors=TOP_ERROR_GROUPS, tracked_errors=TRACKED_ERROR_GROUPS):
+        self.top_errors = top_errors
+        self.started = perf_counter()
+        self.elapsed = None
+
+        self.statements = 0
+        self.bytes = 0
+        self._offsets = {}      # source -> byte_end of its last statement
+        self.statuses = Counter()
+        self.statement_types = Counter()
+        self.error_types = Counter()
+        self.error_groups = TopK(tracked_errors)
+        self.latency = {"lex": LogHistogram(), "parse": LogHistogram()}
+
+    def add(self, record: dict, timings: dict | None = None):
+        query = record.get("query") or ""
+        status = record.get("status") or "error"
+
+        self.statements += 1
+        self.bytes += self._size(record, query)
+        self.statuses[status] += 1
+
+        if status == "error":
+            error_type = record.get("error_type") or "UnknownError"
+            self.error_types[error_type] += 1
+
+            message = (record.get("message") or "").split("\n", 1)[0]
+            self.error_groups.add(
+                record_fingerprint(record),
+                payload=(error_type, message, query)
+            )
+        else:
+            for statement_type in (record.get("statement_type") or "UNKNOWN").split("+"):
+                self.statement_types[statement_type] += 1
+
+        for phase, seconds in (timings or {}).items():
+            if phase in self.latency:
+                self.latency[phase].add(seconds)
+
+    def _size(self, record, query):
+        # Input bytes up to the end of the statement, as the CLI progress
+        # line counts them (including comments and whitespace before it)
+        byte_end = record.get("byte_end")
+        if byte_end is None:
+            # No file offsets (--query / --stdin)
+            return len(query.encode("utf-8"))
+
+        source = record.get("source")
+        size = byte_end - self._offsets.get(source, 0)
+        self._offsets[source] = byte_end
+        return size
+
+    def finish(self):
+        if self.elapsed is None:
+            self.elapsed = perf_counter() - self.started
+
+    # ======================================================
+    # CHECKPOINTS (engine.checkpoint)
+    # ======================================================
+
+    def state(self) -> dict:
+        return {
+            "elapsed": perf_counter() - self.started,
+            "statements": self.statements,
+            "bytes": self.bytes,
+            "offsets": self._offsets,
+            "statuses": self.statuses,
+            "statement_types": self.statement_types,
+            "error_types": self.error_types,
+            "error_groups": self.error_groups.state(),
+            "latency": {phase: histogram.state() for phase, histogram in self.latency.items()}
+        }
+
+    def restore(self, state: dict):
+        # Elapsed time keeps counting from where the interrupted run stopped
+        self.started = perf_counter() - state["elapsed"]
+        self.statements = state["statements"]
+        self.bytes = state.get("bytes", state.get("characters", 0))
+        self._offsets = dict(state.get("offsets", {}))
+        self.statuses = Counter(state["statuses"])
+        self.statement_types = Counter(state["statement_types"])
+        self.error_types = Counter(state["error_types"])
+        self.error_groups.restore(state["error_groups"])
+        for phase, histogram in state["latency"].items():
+            self.latency[phase].restore(histogram)
+
+    # ======================================================
+    # RENDERING
+    # ======================================================
+
+    def lines(self, ai_stats: dict | None = None) -> list:
+        self.finish()
+        elapsed = max(self.elapsed, 1e-9)
+
+        lines = [
+            "=" * 70,
+            "                     SQLidator Summary",
+            "=" * 70,
+            f"Generated On : {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Statements   : {self.statements:,} "
+            f"({self.statuses.get('success', 0):,} passed, {self.statuses.get('error', 0):,} failed)",
+            f"Elapsed      : {self.elapsed:.2f}s",
+            f"Throughput   : {self.statements / elapsed:,.0f} statements/s, "
+            f"{self.bytes / elapsed / 1024 / 1024:,.2f} MB/s of SQL",
+            "-" * 70,
+            "STATEMENT TYPES:"
+        ]
+        lines.extend(_counter_lines(self.statement_types))
+
+        lines.append("-" * 70)
+        lines.append("ERROR TYPES:")
+        lines.extend(_counter_lines(self.error_types))
+
+        groups = self.error_groups.most_common(self.top_errors)
+        if groups:
+            lines.append("-" * 70)
+            lines.append(f"TOP FAILING STATEMENTS (by fingerprint, top {len(groups)}):")
+            for fingerprint, count, error, (error_type, message, sample) in groups:
+                approx = f" (±{error:,})" if error else ""
+                lines.append(f"  {count:>10,}{approx}  {fingerprint}  {error_type}: {message}")
+                lines.append(f"  {'':>10}  sample: {_one_line(sample)}")
+
+        lines.append("-" * 70)
+        lines.append("LATENCY (ms):")
+        lines.append(
+            "  phase    " + "".join(f"{'p' + format(p, 'g'):>10}" for p in PERCENTILES) + f"{'max':>10}"
+        )
+        for phase, histogram in self.latency.items():
+            if not histogram.count:
+                lines.append(f"  {phase:<9}  (not measured)")
+                continue
+            values = [histogram.percentile(p) for p in PERCENTILES] + [histogram.max]
+            lines.append(f"  {phase:<9}" + "".join(f"{v * 1000:>10.3f}" for v in values))
+
+        if ai_stats:
+            lines.append("-" * 70)
+            lines.append("AI SERVICE:")
+            lines.extend(format_ai_stats(ai_stats))
+
+        lines.append("=" * 70)
+        return lines
+
+
+class SummaryReportWriter:
+    """
+    Streaming writer wrapper: aggregates records, writes the summary on close.
+    """
+
+    def __init__(self, fh, close_file=False, resume=None):
+        self.fh = fh
+        self.close_file = close_file
+        self.summary = SummaryReport()
+        if resume:
+            self.summary.restore(resume["summary"])
+
+    def write(self, record: dict):
+        self.summary.add(record, record.get("timings"))
+
+    def close(self, ai_stats: dict | None = None):
+        self.fh.write("\n".join(self.summary.lines(ai_stats)))
+        self.fh.write("\n")
+        self.fh.flush()
+        if self.close_file:
+            self.fh.close()
+
+    def checkpoint(self) -> dict:
+        # Nothing is written before close
+        return {"summary": self.summary.state()}
+
+
+def _counter_lines(counter):
+    if not counter:
+        return ["  (none)"]
+    return [f"  {name:<24} {count:>12,}" for name, count in counter.most_common()]
+
+
+def _one_line(text, limit=100):
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[:limit - 3] + "..."
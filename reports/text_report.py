@@ -7,7 +7,12 @@ Generates clean and structured SQL validation report.
 from datetime import datetime
 
 
-def generate_text_report(query: str, result: dict, ai_result: dict | None = None) -> str:
+def generate_text_report(
+    query: str,
+    result: dict,
+    ai_result: dict | None = None,
+    ai_stats: dict | None = None
+) -> str:
     try:
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
@@ -50,9 +55,121 @@ def generate_text_report(query: str, result: dict, ai_result: dict | None = None
         else:
             lines.append("No AI suggestions available.")
 
+        # -----------------------------
+        # AI Service Section
+        # -----------------------------
+        if ai_stats:
+            lines.append("-" * 70)
+            lines.append("AI SERVICE:")
+            lines.extend(format_ai_stats(ai_stats))
+
         lines.append("=" * 70)
 
         return "\n".join(lines)
 
     except Exception:
         return "Failed to generate text report."
+
+
+def format_ai_stats(ai_stats: dict) -> list:
+    budget = ai_stats.get("budget_seconds")
+
+    return [
+        f"Breaker State : {ai_stats.get('breaker_state')}",
+        f"Calls         : {ai_stats.get('successes', 0)} succeeded, "
+        f"{ai_stats.get('failures', 0)} failed",
+        f"Skipped       : {ai_stats.get('rejected', 0)} (breaker), "
+        f"{ai_stats.get('budget_rejected', 0)} (budget)",
+        f"Time Budget   : "
+        + (f"{ai_stats.get('budget_remaining')}s of {budget}s left" if budget is not None else "unlimited")
+    ]
+
+
+class TextReportWriter:
+    """
+    Streaming text report: header up front, one block per statement,
+    totals at the end. Nothing is buffered beyond the file handle.
+
+    resume: state from checkpoint() when appending to an interrupted report
+    """
+
+    def __init__(self, fh, close_file=False, resume=None):
+        self.fh = fh
+        self.close_file = close_file
+        self.counts = {"success": 0, "error": 0}
+
+        if resume:
+            self.counts.update(resume["counts"])
+            return
+
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._lines([
+            "=" * 70,
+            "                     SQLidator Report",
+            "=" * 70,
+            f"Generated On : {timestamp}",
+            "-" * 70
+        ])
+
+    def write(self, record: dict):
+        status = record.get("status") or "error"
+        occurrences = record.get("occurrences") or 1
+        self.counts[status] = self.counts.get(status, 0) + occurrences
+
+        location = ""
+        if record.get("source"):
+            location = f"  ({record['source']}:{record.get('line')})"
+
+        lines = [
+            f"QUERY {record.get('index')}{location}",
+            record.get("query") or "",
+            "",
+            f"Dialect    : {record.get('dialect')}",
+            f"Status     : {status.upper()}"
+        ]
+
+        if status == "error":
+            lines.append(f"Error Type : {record.get('error_type')}")
+        if record.get("occurrences"):
+            lines.append(
+                f"Occurrences: {record['occurrences']} "
+                f"(first {record.get('first_seen')}, last {record.get('last_seen')})"
+            )
+        lines.append(f"Message    : {record.get('message')}")
+
+        if record.get("ai_status") == "success":
+            lines.append("AI SUGGESTIONS:")
+            if record.get("corrected_query"):
+                lines.append(f"Corrected Version:\n{record['corrected_query']}")
+            if record.get("explanation"):
+                lines.append(record["explanation"])
+
+        lines.append("-" * 70)
+        self._lines(lines)
+
+    def close(self, ai_stats: dict | None = None):
+        total = sum(self.counts.values())
+        lines = [
+            f"Statements : {total} "
+            f"({self.counts.get('success', 0)} passed, {self.counts.get('error', 0)} failed)"
+        ]
+
+        if ai_stats:
+            lines.append("-" * 70)
+            lines.append("AI SERVICE:")
+            lines.extend(format_ai_stats(ai_stats))
+
+        lines.append("=" * 70)
+        self._lines(lines)
+
+        self.fh.flush()
+        if self.close_file:
+            self.fh.close()
+
+    def checkpoint(self) -> dict:
+        self.fh.flush()
+        return {"size": self.fh.tell(), "counts": dict(self.counts)}
+
+    def _lines(self, lines):
+        self.fh.write("\n".join(lines))
+        self.fh.write("\n")
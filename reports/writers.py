@@ -0,0 +1,89 @@
+"""
+Report Writer Factory
+---------------------
+Opens a streaming report writer for the CLI.
+
+File formats (txt / json / csv) write to a buffered file handle;
+"sqlite" writes to a database (see reports.sqlite_report) and
+"summary" only aggregates (see reports.summary_report).
+
+All writers share one interface:
+    writer.write(record)        → record from reports.records.build_record
+    writer.close(ai_stats=None) → write totals / trailer and close the file
+    writer.checkpoint()         → flush, return JSON-able state; passed back
+                                  as resume= it continues the same report
+
+Writer modules are imported on first use, so only the requested format
+(and e.g. sqlite3 only for "sqlite") is loaded.
+"""
+
+from importlib import import_module
+
+
+# format -> (module, writer class, file extension)
+REPORT_WRITERS = {
+    "txt": ("reports.text_report", "TextReportWriter", "txt"),
+    "json": ("reports.json_report", "JsonLinesReportWriter", "jsonl"),
+    "csv": ("reports.csv_report", "CsvReportWriter", "csv"),
+    "sqlite": ("reports.sqlite_report", "SqliteReportWriter", "db"),
+    "summary": ("reports.summary_report", "SummaryReportWriter", "summary.txt")
+}
+
+# AI answer format requested for each report (records unpack JSON / CSV)
+REPORT_AI_MODES = {
+    "txt": "txt",
+    "json": "json",
+    "csv": "csv",
+    "sqlite": "json",
+    "summary": "txt"
+}
+
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+def report_filename(report_format: str, basename: str) -> str:
+    return f"{basename}.{REPORT_WRITERS[report_format][2]}"
+
+
+def open_report_writer(report_format: str, path: str, dedup: bool = False, resume: dict | None = None):
+    """
+    dedup=True collapses repeated errors (see reports.dedup); the
+    summary report already groups errors and ignores it.
+
+    resume: writer.checkpoint() state of an interrupted run; the report
+    is truncated to the checkpoint and appended to.
+    """
+
+    module, class_name, _ = REPORT_WRITERS[report_format]
+    writer_class = getattr(import_module(module), class_name)
+    dedup = dedup and report_format != "summary"
+
+    if dedup:
+        from reports.dedup import DEDUP_FIELDS, DedupReportWriter
+
+    dedup_state = resume if dedup else None
+    if dedup_state:
+        resume = dedup_state["writer"]
+
+    if report_format == "sqlite":
+        writer = writer_class(path, resume=resume)
+        return DedupReportWriter(writer, dedup_state) if dedup else writer
+
+    newline = "" if report_format == "csv" else None
+
+    if resume and resume.get("size") is not None:
+        # Drop whatever was written after the checkpoint
+        fh = open(path, "r+", encoding="utf-8", newline=newline, buffering=WRITE_BUFFER_SIZE)
+        fh.truncate(resume["size"])
+        fh.seek(resume["size"])
+    else:
+        fh = open(path, "w", encoding="utf-8", newline=newline, buffering=WRITE_BUFFER_SIZE)
+
+    if report_format == "csv" and dedup:
+        from reports.records import RECORD_FIELDS
+
+        writer = writer_class(fh, close_file=True, fields=RECORD_FIELDS + DEDUP_FIELDS, resume=resume)
+    else:
+        writer = writer_class(fh, close_file=True, resume=resume)
+
+    return DedupReportWriter(writer, dedup_state) if dedup else writer
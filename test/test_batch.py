@@ -0,0 +1,82 @@
+import os
+
+from engine.batch import expand_inputs, iter_file_statements, iter_validated_files
+
+
+def _tree(tmp_path):
+    (tmp_path / "schema" / "tables").mkdir(parents=True)
+    (tmp_path / "schema" / ".git").mkdir()
+
+    files = {
+        "schema/tables/users.sql": "CREATE TABLE users (id INT);\nSELECT id FROM users;",
+        "schema/tables/orders.sql": "SELEC id FROM orders;",
+        "schema/views.sql": "SELECT a FROM v;\n",
+        "schema/notes.txt": "not sql",
+        "schema/.git/ignored.sql": "SELECT 1;"
+    }
+    for name, content in files.items():
+        (tmp_path / name).write_text(content, encoding="utf-8")
+
+    return tmp_path / "schema"
+
+
+def test_expand_inputs_directories_and_globs(tmp_path):
+    schema = _tree(tmp_path)
+
+    from_dir = expand_inputs([str(schema)])
+    from_glob = expand_inputs([str(schema / "**" / "*.sql")])
+
+    assert [os.path.relpath(f, schema) for f in from_dir] == [
+        os.path.join("tables", "orders.sql"),
+        os.path.join("tables", "users.sql"),
+        "views.sql"
+    ]
+    assert from_glob == from_dir
+
+
+def test_process_pool_keeps_input_order(tmp_path):
+    files = expand_inputs([str(_tree(tmp_path))])
+    done = []
+
+    def summarize(items):
+        return [(path, statement.line, result["status"]) for path, statement, result, _ in items]
+
+    serial = summarize(iter_validated_files(files, jobs=1))
+    pooled = summarize(iter_validated_files(files, jobs=2, on_file_done=lambda p, n: done.append((p, n))))
+
+    assert pooled == serial
+    assert [status for _, _, status in serial] == ["error", "success", "success", "success"]
+    assert done == [(files[0], 1), (files[1], 2), (files[2], 1)]
+
+
+def test_compressed_files_stream_like_plain_ones(tmp_path):
+    import bz2
+    import gzip
+    import lzma
+
+    script = "SELECT a FROM t;\r\nSELEC b FROM t;\nINSERT INTO t VALUES ('é');\n" * 50
+    (tmp_path / "plain.sql").write_text(script, encoding="utf-8", newline="")
+    for suffix, module in ((".gz", gzip), (".bz2", bz2), (".xz", lzma)):
+        with module.open(tmp_path / f"dump.sql{suffix}", "wb") as f:
+            f.write(script.encode("utf-8"))
+    (tmp_path / "broken.sql.gz").write_bytes(gzip.compress(script.encode("utf-8"))[:-20])
+
+    files = expand_inputs([str(tmp_path)])
+    assert [os.path.basename(f) for f in files] == [
+        "broken.sql.gz", "dump.sql.bz2", "dump.sql.gz", "dump.sql.xz", "plain.sql"
+    ]
+
+    def summarize(path, start=None):
+        return [(s.text, s.line, s.byte_end) for s in iter_file_statements(path, start)]
+
+    expected = summarize(files[-1])
+    for path in files[1:4]:
+        assert summarize(path) == expected
+
+        # Resuming seeks in the decompressed stream
+        middle = list(iter_file_statements(path))[75]
+        assert summarize(path, (middle.byte_end, middle.end, middle.end_line)) == expected[76:]
+
+    results = [result for _, _, result, _ in iter_validated_files([files[0]])]
+    assert results[-1]["type"] == "FileError"
+    assert "corrupt compressed data" in results[-1]["message"]
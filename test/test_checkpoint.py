@@ -0,0 +1,139 @@
+import json
+import sys
+
+import pytest
+
+from engine import batch
+from engine.batch import iter_file_statements
+from engine.checkpoint import Checkpoint, CheckpointError
+from engine.validator import validate_query
+from reports.records import build_record
+from reports.writers import open_report_writer
+
+
+SCRIPT = (
+    "SELECT a FROM t WHERE b = 'é';\r\n"
+    "-- ü comment; still a comment\r\n"
+    "SELEC x FROM t;\n"
+    "INSERT INTO t VALUES ('x;y');\r\n"
+    "SELECT c FROM u"
+)
+
+
+def test_statements_resume_at_their_byte_offset(tmp_path, monkeypatch):
+    path = tmp_path / "input.sql"
+    path.write_bytes(SCRIPT.encode("utf-8"))
+    monkeypatch.setattr(batch, "READ_CHUNK_SIZE", 5)
+
+    statements = list(iter_file_statements(str(path)))
+    raw = SCRIPT.encode("utf-8")
+
+    assert [s.line for s in statements] == [1, 2, 4, 5]
+    assert raw[:statements[0].byte_end].decode("utf-8") == "SELECT a FROM t WHERE b = 'é';"
+
+    for i, statement in enumerate(statements):
+        resumed = list(iter_file_statements(
+            str(path),
+            (statement.byte_end, statement.end, statement.end_line)
+        ))
+        assert [(s.text, s.line, s.offset, s.byte_end) for s in resumed] == [
+            (s.text, s.line, s.offset, s.byte_end) for s in statements[i + 1:]
+        ]
+
+
+def test_checkpoint_round_trip_and_mismatch(tmp_path):
+    path = tmp_path / "input.sql"
+    path.write_text("SELECT a FROM t;\nSELECT b FROM t;\n", encoding="utf-8")
+    files = [str(path)]
+    options = {"dialect": "postgres", "report": None}
+    checkpoint_path = str(tmp_path / "run.json")
+
+    checkpoint = Checkpoint(checkpoint_path, files, options)
+    first = next(iter_file_statements(str(path)))
+    checkpoint.advance(str(path), first, 1, {"success": 1, "error": 0})
+    checkpoint.save({"report": {"size": 10}})
+
+    resumed = Checkpoint(checkpoint_path, files, options)
+    resumed.load()
+    remaining, start = resumed.remaining()
+
+    assert (resumed.index, resumed.counts, resumed.reports) == (1, {"success": 1, "error": 0}, {"report": {"size": 10}})
+    assert remaining == files
+    assert [s.text for s in iter_file_statements(str(path), start[str(path)])] == ["SELECT b FROM t;"]
+
+    with pytest.raises(CheckpointError):
+        Checkpoint(checkpoint_path, files, dict(options, dialect="mysql")).load()
+
+    path.write_text("SELECT a FROM t;\nSELECT changed FROM t;\n", encoding="utf-8")
+    with pytest.raises(CheckpointError):
+        Checkpoint(checkpoint_path, files, options).load()
+
+    resumed.remove()
+    with pytest.raises(CheckpointError):
+        Checkpoint(checkpoint_path, files, options).load()
+
+
+def _record(index, query):
+    return build_record(index, query, validate_query(query, "postgres"), source="input.sql", line=index)
+
+
+@pytest.mark.parametrize("report_format", ["csv", "json", "txt"])
+def test_resumed_report_drops_records_after_the_checkpoint(tmp_path, report_format):
+    queries = ["SELECT a FROM t;", "SELEC b FROM t;", "SELECT c FROM t;", "SELECT d FROM t;"]
+    full_path = str(tmp_path / "full")
+    part_path = str(tmp_path / "part")
+
+    writer = open_report_writer(report_format, full_path, dedup=True)
+    for index, query in enumerate(queries, 1):
+        writer.write(_record(index, query))
+    writer.close()
+
+    # Interrupted after query 2 was checkpointed and query 3 written
+    writer = open_report_writer(report_format, part_path, dedup=True)
+    writer.write(_record(1, queries[0]))
+    writer.write(_record(2, queries[1]))
+    state = json.loads(json.dumps(writer.checkpoint()))
+    writer.write(_record(3, queries[2]))
+    writer.writer.fh.flush()
+
+    writer = open_report_writer(report_format, part_path, dedup=True, resume=state)
+    for index, query in enumerate(queries[2:], 3):
+        writer.write(_record(index, query))
+    writer.close()
+
+    with open(full_path, encoding="utf-8") as full, open(part_path, encoding="utf-8") as part:
+        expected = [line for line in full if not line.startswith("Generated On")]
+        assert [line for line in part if not line.startswith("Generated On")] == expected
+
+
+def test_checkpoint_is_saved_when_the_run_fails(tmp_path, monkeypatch):
+    import signal
+
+    from reports import records
+    from ui import cli
+
+    path = tmp_path / "input.sql"
+    path.write_text("SELECT a FROM t;\nSELECT b FROM t;\nSELECT c FROM t;\n", encoding="utf-8")
+    checkpoint_path = str(tmp_path / "run.json")
+
+    def failing_record(index, *args, **kwargs):
+        if index == 3:
+            raise OSError("disk full")
+        return build_record(index, *args, **kwargs)
+
+    monkeypatch.setattr(records, "build_record", failing_record)
+    monkeypatch.setattr(sys, "argv", [
+        "sqlidator", "--file", str(path), "--format", "jsonl", "--checkpoint", checkpoint_path
+    ])
+    handlers = signal.getsignal(signal.SIGINT), signal.getsignal(signal.SIGTERM)
+    try:
+        with pytest.raises(OSError):
+            cli.main()
+    finally:
+        signal.signal(signal.SIGINT, handlers[0])
+        signal.signal(signal.SIGTERM, handlers[1])
+
+    with open(checkpoint_path, encoding="utf-8") as f:
+        saved = json.load(f)
+    assert saved["index"] == 2
+    assert saved["counts"] == {"success": 2, "error": 0}
@@ -0,0 +1,90 @@
+import json
+import os
+import subprocess
+import sys
+
+CLI = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "ui", "cli.py"))
+
+
+def _run(*args):
+    return subprocess.run(
+        [sys.executable, CLI] + list(args),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+
+def test_jsonl_format_writes_only_records_to_stdout(tmp_path):
+    path = tmp_path / "input.sql"
+    path.write_text("SELECT a FROM t;\nSELEC b FROM t;\n", encoding="utf-8")
+
+    result = _run("--file", str(path), "--format", "jsonl")
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+
+    assert [r["status"] for r in records] == ["success", "error"]
+    assert [r["line"] for r in records] == [1, 2]
+    assert "ast" not in records[0]
+    assert "Validated 2 statements" not in result.stdout
+
+    with_ast = _run("--file", str(path), "--format", "jsonl", "--show-ast")
+    assert "SelectNode" in json.loads(with_ast.stdout.splitlines()[0])["ast"]
+
+
+def test_quiet_format_lists_failures_only(tmp_path):
+    path = tmp_path / "input.sql"
+    path.write_text("SELECT a FROM t;\nSELEC b FROM t;\n", encoding="utf-8")
+
+    result = _run("--file", str(path), "--format", "quiet")
+
+    assert result.stdout.splitlines() == [
+        f'{path}:2: SyntaxError: ERROR:  syntax error at or near "SELEC"'
+    ]
+    assert "Validated 2 statements: 1 passed, 1 failed" in result.stderr
+
+
+def test_stdin_results_arrive_before_input_ends():
+    process = subprocess.Popen(
+        [sys.executable, CLI, "--stdin", "--format", "jsonl"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True
+    )
+
+    try:
+        # No trailing newline: the ';' alone completes the statement
+        process.stdin.write("SELECT a\nFROM t; SELEC")
+        process.stdin.flush()
+        first = json.loads(process.stdout.readline())
+        assert first["status"] == "success" and first["source"] == "<stdin>"
+
+        process.stdin.write(" b FROM t;\n")
+        process.stdin.close()
+        second = json.loads(process.stdout.readline())
+        assert second["status"] == "error" and second["line"] == 2
+    finally:
+        process.kill()
+        process.wait()
+
+
+def test_report_mode_suggestions_print_in_the_cli_layout():
+    from ui.cli import format_ai_suggestion
+
+    query = "SELEC a FROM t;"
+    answer = {
+        "ai_status": "success",
+        "ai_message": json.dumps({"corrected_query": "SELECT a FROM t;", "explanation": "Typo."})
+    }
+    assert format_ai_suggestion(query, answer) == (
+        "Your Query:\nSELEC a FROM t;\n\nCorrected Version:\nSELECT a FROM t;\n\nExplanation:\nTypo."
+    )
+
+    csv_answer = {
+        "ai_status": "success",
+        "ai_message": "original_query,corrected_query,short_explanation\nSELEC a FROM t;,SELECT a FROM t;,Typo."
+    }
+    assert format_ai_suggestion(query, csv_answer) == format_ai_suggestion(query, answer)
+
+    text_answer = {"ai_status": "success", "ai_message": "Corrected Version:\nSELECT a FROM t;"}
+    assert format_ai_suggestion(query, text_answer) == text_answer["ai_message"]
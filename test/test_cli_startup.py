@@ -0,0 +1,34 @@
+"""Check that a plain --query run does not load heavy optional modules."""
+
+import os
+import subprocess
+import sys
+
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+PROBE = """
+import runpy, sys
+sys.argv = ["cli.py", "--query", "SELECT id FROM users;", "--format", "quiet"]
+try:
+    runpy.run_path("ui/cli.py", run_name="__main__")
+except SystemExit:
+    pass
+unwanted = ["requests", "dotenv", "ai.groq_suggester", "reports.sqlite_report",
+            "sqlite3", "concurrent.futures.process", "dialects"]
+print("loaded:" + ",".join(name for name in unwanted if name in sys.modules))
+"""
+
+
+def test_query_run_skips_optional_imports():
+    completed = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    loaded = completed.stdout.strip().splitlines()[-1]
+
+    assert loaded == "loaded:"
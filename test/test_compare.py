@@ -0,0 +1,110 @@
+import json
+
+from reports.compare import compare_paths, compare_results, read_results
+from reports.sqlite_report import SqliteReportWriter
+
+
+def _record(index, query, status, message="Query parsed successfully.", error_type=None):
+    return {
+        "index": index,
+        "source": "audit.sql",
+        "line": index,
+        "status": status,
+        "error_type": error_type,
+        "message": message,
+        "query": query
+    }
+
+
+OLD = [
+    _record(1, "SELECT a FROM t;", "success"),
+    _record(2, "SELECT b FROM t;", "error", "ERROR:  boom", "SyntaxError"),
+    _record(3, "SELECT c FROM t;", "error", "ERROR:  old error", "SyntaxError"),
+    _record(4, "SELECT d FROM t;", "success"),
+    _record(5, "SELECT gone FROM t;", "success")
+]
+
+NEW = [
+    _record(1, "SELECT  a\nFROM t;", "error", "ERROR:  regression", "SyntaxError"),
+    _record(2, "SELECT b FROM t;", "success"),
+    _record(3, "SELECT c FROM t;", "error", "ERROR:  new error", "SyntaxError"),
+    _record(4, "SELECT d FROM t;", "success"),
+    _record(5, "SELECT e FROM t;", "success")
+]
+
+
+def _write_jsonl(path, records):
+    with open(path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+        f.write(json.dumps({"ai_service": {}}) + "\n")
+
+
+def _write_sqlite(path, records):
+    writer = SqliteReportWriter(path)
+    for record in records:
+        writer.write(record)
+    writer.close()
+
+
+def test_compare_jsonl_against_sqlite(tmp_path):
+    old_path = str(tmp_path / "old.jsonl")
+    new_path = str(tmp_path / "new.db")
+    _write_jsonl(old_path, OLD)
+    _write_sqlite(new_path, NEW)
+
+    changes = []
+    counts = compare_paths(old_path, new_path, on_change=lambda kind, old, new: changes.append((kind, new[5])))
+
+    assert counts == {
+        "newly_failing": 1,
+        "newly_passing": 1,
+        "changed_error": 1,
+        "added": 1,
+        "unchanged": 1,
+        "removed": 1
+    }
+    assert ("newly_failing", "SELECT  a\nFROM t;") in changes
+
+
+def test_partitioned_join_matches_in_memory_join(tmp_path):
+    old_path = str(tmp_path / "old.jsonl")
+    new_path = str(tmp_path / "new.jsonl")
+    _write_jsonl(old_path, OLD)
+    _write_jsonl(new_path, NEW)
+
+    in_memory = compare_results(read_results(old_path), read_results(new_path))
+    partitioned = compare_results(read_results(old_path), read_results(new_path), partitions=3)
+
+    assert in_memory == partitioned
+
+
+def test_repeated_statements_match_occurrence_by_occurrence(tmp_path):
+    old_path = str(tmp_path / "old.jsonl")
+    new_path = str(tmp_path / "new.jsonl")
+    _write_jsonl(old_path, [
+        _record(1, "SELECT a FROM t;", "success"),
+        _record(2, "SELECT a FROM t;", "success"),
+        _record(3, "SELECT a FROM t;", "success"),
+        _record(4, "SELEC b FROM t;", "error", "ERROR:  boom", "SyntaxError")
+    ])
+    _write_jsonl(new_path, [
+        _record(1, "SELECT a FROM t;", "success"),
+        _record(2, "SELECT a FROM t;", "success"),
+        _record(3, "SELEC b FROM t;", "error", "ERROR:  boom", "SyntaxError"),
+        _record(4, "SELEC b FROM t;", "error", "ERROR:  boom", "SyntaxError")
+    ])
+
+    for partitions in (1, 3):
+        assert compare_results(read_results(old_path), read_results(old_path), partitions=partitions) == dict(
+            dict.fromkeys(["newly_failing", "newly_passing", "changed_error", "added", "removed"], 0),
+            unchanged=4
+        )
+        assert compare_results(read_results(old_path), read_results(new_path), partitions=partitions) == {
+            "newly_failing": 0,
+            "newly_passing": 0,
+            "changed_error": 0,
+            "added": 1,
+            "unchanged": 3,
+            "removed": 1
+        }
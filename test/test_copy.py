@@ -0,0 +1,95 @@
+import random
+
+from engine.batch import iter_file_statements
+from engine.splitter import StatementSplitter, iter_statements, split_statements
+from engine.validator import validate_query
+from reports.records import build_record
+
+
+DUMP = (
+    "--\n-- Data for Name: users\n--\n\n"
+    "COPY public.users (id, name, note) FROM stdin;\n"
+    "1\talice\t\\N\n"
+    "2\tbob; not a statement\t'quoted\n"
+    "3\t\\.hidden\tx\n"
+    "\\.\n"
+    "\n"
+    "SELECT name FROM users;\n"
+)
+
+
+def test_copy_block_stays_with_its_statement_for_any_chunking():
+    expected = [(s.text, s.line, s.offset, s.end) for s in split_statements(DUMP)]
+    assert [line for _, line, _, _ in expected] == [1, 11]
+
+    rng = random.Random(49)
+    for _ in range(300):
+        cuts = sorted(rng.sample(range(1, len(DUMP)), rng.randint(1, 20)))
+        chunks = [DUMP[a:b] for a, b in zip([0] + cuts, cuts + [len(DUMP)])]
+        assert [(s.text, s.line, s.offset, s.end) for s in iter_statements(chunks)] == expected
+
+
+def test_copy_rows_are_checked_and_kept_out_of_reports():
+    copy = split_statements(DUMP)[0].text
+    result = validate_query(copy, "postgres")
+
+    assert result["status"] == "success"
+    assert result["ast"][0].rows == 3
+    assert build_record(1, copy, result)["query"].endswith("FROM stdin;\n-- (3 COPY data rows)")
+
+    bad = copy.replace("2\tbob", "2bob")
+    result = validate_query(bad, "postgres")
+    assert result["status"] == "error"
+    assert "row has 2 columns, expected 3" in result["message"]
+    assert "LINE 7: 2bob" in result["message"]
+
+    assert validate_query("COPY users FROM stdin;\n1\n", "postgres")["status"] == "error"
+    assert validate_query(copy, "mysql")["status"] == "error"
+
+
+def test_large_copy_block_is_not_scanned_per_character(tmp_path):
+    rows = "".join(f"{i}\tname {i}\n" for i in range(200000))
+    path = tmp_path / "dump.sql"
+    path.write_text(f"COPY t (id, name) FROM stdin;\n{rows}\\.\nSELECT a FROM t;\n", encoding="utf-8")
+
+    statements = list(iter_file_statements(str(path)))
+    results = [validate_query(s.text, "postgres") for s in statements]
+
+    assert [r["status"] for r in results] == ["success", "success"]
+    assert results[0]["ast"][0].rows == 200000
+    assert statements[1].line == 200003
+
+
+def test_oversized_copy_block_is_streamed_not_cut():
+    rows = "".join(f"{i}\tname; 'it''s' {i}\t\\N\n" for i in range(1000))
+    dump = f"COPY public.users (id, name, note) FROM stdin;\n{rows}\\.\nSELECT a FROM t;\n"
+    bad = dump.replace("500\tname", "500name")
+
+    for text, status in ((dump, "success"), (bad, "error")):
+        splitter = StatementSplitter(max_pending=10000)
+        statements = []
+        for i in range(0, len(text), 4096):
+            statements.extend(splitter.feed(text[i:i + 4096]))
+        statements.extend(splitter.flush())
+
+        assert [s.line for s in statements] == [1, 1003]
+        assert statements[0].end == text.index("\\.") + 2
+        assert len(statements[0].text) < 200
+
+        result = validate_query(statements[0].text, "postgres")
+        assert result["status"] == status
+        if status == "success":
+            assert result["ast"][0].rows == 1000
+        else:
+            assert "row has 2 columns, expected 3" in result["message"]
+            assert "showing row 501" in statements[0].text
+
+
+def test_copy_words_stay_usable_as_names():
+    for dialect in ("postgres", "mysql", "plsql"):
+        result = validate_query("SELECT copy, stdin, stdout FROM t WHERE copy = 1;", dialect)
+        assert result["status"] == "success", result["message"]
+
+    assert validate_query("copy stdin (copy) FROM STDIN;\n1\n\\.\n", "postgres")["status"] == "success"
+    assert validate_query("COPY t FROM stdout;", "postgres")["status"] == "error"
+    assert 'Perhaps you meant "STDIN"' in validate_query("COPY t FROM stdn;", "postgres")["message"]
@@ -0,0 +1,34 @@
+import io
+import json
+
+from engine.validator import validate_query
+from reports.dedup import DedupReportWriter
+from reports.json_report import JsonLinesReportWriter
+from reports.records import build_record
+
+
+def test_repeated_errors_collapse_to_one_record():
+    queries = ["SELEC a FROM t WHERE id = %d;" % n for n in range(1, 1001)]
+    queries.insert(500, "SELECT a FROM t;")
+    queries.append("SELECT a FROM;")
+
+    out = io.StringIO()
+    writer = DedupReportWriter(JsonLinesReportWriter(out))
+    for idx, query in enumerate(queries, 1):
+        record = build_record(idx, query, validate_query(query, "postgres"), source="app.log", line=idx)
+        writer.write(record)
+    writer.close()
+
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert len(records) == 3
+
+    success, template, other = records
+    assert success["status"] == "success"
+
+    assert template["occurrences"] == 1000
+    assert template["first_seen"] == "app.log:1"
+    assert template["last_seen"] == "app.log:1001"
+    assert template["query"] == "SELEC a FROM t WHERE id = 1;"
+
+    assert other["occurrences"] == 1
+    assert other["expected"]
@@ -0,0 +1,39 @@
+import random
+
+from engine.lexer import Lexer
+from engine.splitter import iter_statements, split_statements
+from engine.tokens import TokenType
+from engine.validator import validate_query
+
+
+SCRIPT = (
+    "INSERT INTO t VALUES ($$a;'b$$, $fn$ x; $$ nested; $fn$);\n"
+    "SELECT a FROM t WHERE b = $q$it's;\nfine$q$;\n"
+    "SELECT c FROM t WHERE d = 'x$$y';\n"
+)
+
+
+def test_dollar_quoted_strings_are_single_tokens():
+    tokens = Lexer("SELECT a FROM t WHERE b = $q$it's;\n$$$q$ AND c = 1;").tokenize()
+    strings = [token for token in tokens if token.type == TokenType.STRING]
+
+    assert [token.value for token in strings] == ["it's;\n$$"]
+    assert (tokens[-3].value, tokens[-3].line, tokens[-3].column) == ("1", 2, 15)
+
+    result = validate_query("SELECT a FROM t WHERE b = $$x\ny$$ AND c = $$z;", "postgres")
+    assert "Unterminated dollar-quoted string" in result["message"]
+    assert "LINE 2: y$$ AND c = $$z;" in result["message"]
+
+    assert validate_query("SELECT a FROM t WHERE b = $$x$$;", "mysql")["status"] == "error"
+
+
+def test_splitter_keeps_dollar_quoted_semicolons_for_any_chunking():
+    expected = [(s.text, s.line, s.offset, s.end) for s in split_statements(SCRIPT)]
+    assert [line for _, line, _, _ in expected] == [1, 2, 4]
+    assert all(validate_query(text, "postgres")["status"] == "success" for text, *_ in expected)
+
+    rng = random.Random(50)
+    for _ in range(300):
+        cuts = sorted(rng.sample(range(1, len(SCRIPT)), rng.randint(1, 20)))
+        chunks = [SCRIPT[a:b] for a, b in zip([0] + cuts, cuts + [len(SCRIPT)])]
+        assert [(s.text, s.line, s.offset, s.end) for s in iter_statements(chunks)] == expected
@@ -0,0 +1,67 @@
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from engine.git_diff import changed_line_ranges, iter_validated_changes, parse_diff
+
+
+DIFF = """\
+diff --git a/db/a.sql b/db/a.sql
+--- a/db/a.sql
++++ b/db/a.sql
+@@ -2 +2 @@
+-SELECT b FROM t;
++SELEC b FROM t;
+@@ -10,2 +9,0 @@
+-SELECT x FROM t;
+-SELECT y FROM t;
+diff --git a/db/old.sql b/db/old.sql
+--- a/db/old.sql
++++ /dev/null
+@@ -1 +0,0 @@
+-SELECT 1;
+"""
+
+
+def test_parse_diff_new_side_ranges():
+    assert parse_diff(DIFF) == {"db/a.sql": [(2, 2), (9, 10)]}
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_only_touched_statements_are_validated(tmp_path):
+    def git(*args):
+        subprocess.run(
+            ["git", "-c", "user.email=t@example.com", "-c", "user.name=t"] + list(args),
+            cwd=tmp_path, check=True, capture_output=True
+        )
+
+    (tmp_path / "a.sql").write_text(
+        "SELECT a FROM t;\nSELECT b\nFROM t;\nSELECT c FROM t;\n", encoding="utf-8"
+    )
+    (tmp_path / "same.sql").write_text("SELECT z FROM t;\n", encoding="utf-8")
+    git("init", "-q")
+    git("add", ".")
+    git("commit", "-q", "-m", "base")
+
+    # Edit the second line of a two-line statement; add an untracked file
+    (tmp_path / "a.sql").write_text(
+        "SELECT a FROM t;\nSELECT b\nFROM;\nSELECT c FROM t;\n", encoding="utf-8"
+    )
+    (tmp_path / "new.sql").write_text("SELECT n FROM t;\n", encoding="utf-8")
+
+    ranges = changed_line_ranges("HEAD", cwd=str(tmp_path))
+    assert sorted(ranges) == ["a.sql", "new.sql"]
+
+    cwd = os.getcwd()
+    os.chdir(tmp_path)
+    try:
+        validated = [
+            (path, statement.line, result["status"])
+            for path, statement, result, _ in iter_validated_changes(ranges)
+        ]
+    finally:
+        os.chdir(cwd)
+
+    assert validated == [("a.sql", 2, "error"), ("new.sql", 1, "success")]
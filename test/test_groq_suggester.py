@@ -0,0 +1,188 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("dotenv")
+
+from ai import groq_suggester
+from ai.suggestion_cache import SuggestionCache
+
+failing_result = {
+    "status": "error",
+    "dialect": "postgres",
+    "type": "SyntaxError",
+    "message": 'syntax error at or near "@"'
+}
+
+
+class StubChatCompletions(BaseHTTPRequestHandler):
+    """
+    Minimal chat-completions endpoint: fails the first `fail_first`
+    requests with 503, then echoes the prompt length back.
+    """
+
+    fail_first = 0
+    requests_seen = 0
+    drop_ids = ()
+    lock = threading.Lock()
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+
+        with self.lock:
+            type(self).requests_seen += 1
+            should_fail = type(self).requests_seen <= type(self).fail_first
+
+        if should_fail:
+            self.send_response(503)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        prompt = body["messages"][0]["content"]
+
+        if "response_format" in body:
+            # Batched request: answer every id except the dropped ones
+            entries = json.loads(prompt.split("Queries:\n", 1)[1])
+            content = json.dumps({"results": [
+                {"id": e["id"], "corrected_query": "SELECT 1;", "explanation": "batched"}
+                for e in entries if e["id"] not in self.drop_ids
+            ]})
+        else:
+            content = f"fixed ({len(prompt)} chars)"
+        data = json.dumps({"choices": [{"message": {"content": content}}]}).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server(monkeypatch):
+    StubChatCompletions.fail_first = 0
+    StubChatCompletions.requests_seen = 0
+    StubChatCompletions.drop_ids = ()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubChatCompletions)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    monkeypatch.setattr(
+        groq_suggester,
+        "GROQ_API_URL",
+        f"http://127.0.0.1:{server.server_port}/openai/v1/chat/completions"
+    )
+    monkeypatch.setattr(groq_suggester, "get_default_cache", lambda: SuggestionCache(None, ttl=0))
+    groq_suggester.configure_ai_run()
+
+    yield StubChatCompletions
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_retries_on_server_error(stub_server):
+    stub_server.fail_first = 2
+
+    result = groq_suggester.get_ai_suggestion("SELECT @ FROM t;", failing_result)
+
+    assert result["ai_status"] == "success"
+    assert stub_server.requests_seen == 3
+
+
+def test_batch_keeps_input_order(stub_server):
+    queries = [f"SELECT @ FROM {'t' * n};" for n in range(1, 11)]
+
+    results = groq_suggester.get_ai_suggestions(
+        [(q, failing_result) for q in queries],
+        max_workers=4
+    )
+
+    assert stub_server.requests_seen == 10
+    lengths = [int(r["ai_message"].split("(")[1].split()[0]) for r in results]
+    assert lengths == sorted(lengths)
+
+
+def test_breaker_trips_after_consecutive_failures(stub_server):
+    stub_server.fail_first = 1000
+    groq_suggester.configure_ai_run(failure_threshold=2, reset_timeout=60)
+
+    results = [
+        groq_suggester.get_ai_suggestion(f"SELECT @ FROM t{n};", failing_result)
+        for n in range(4)
+    ]
+    stats = groq_suggester.get_ai_stats()
+
+    assert [r["ai_status"] for r in results] == ["error", "error", "skipped", "skipped"]
+    assert stats["breaker_state"] == "open"
+    assert stats["failures"] == 2
+    assert stats["rejected"] == 2
+
+
+def test_exhausted_budget_skips_network(stub_server):
+    groq_suggester.configure_ai_run(budget_seconds=0)
+
+    result = groq_suggester.get_ai_suggestion("SELECT @ FROM t;", failing_result)
+
+    assert result["ai_status"] == "skipped"
+    assert stub_server.requests_seen == 0
+    assert groq_suggester.get_ai_stats()["budget_rejected"] == 1
+
+
+def test_budget_counts_time_spent_in_ai_calls_only(stub_server):
+    groq_suggester.configure_ai_run(budget_seconds=5)
+
+    groq_suggester.get_ai_suggestion("SELECT @ FROM t1;", failing_result)
+    after_call = groq_suggester.get_ai_stats()["budget_remaining"]
+    time.sleep(0.2)  # validation work between AI calls
+
+    assert 4 < after_call < 5
+    assert groq_suggester.get_ai_stats()["budget_remaining"] == after_call
+
+
+def test_invalid_budget_setting_falls_back_to_no_limit(monkeypatch):
+    monkeypatch.setenv("SQLIDATOR_AI_BUDGET", "abc")
+
+    with pytest.warns(RuntimeWarning, match="SQLIDATOR_AI_BUDGET"):
+        groq_suggester.configure_ai_run()
+
+    assert groq_suggester.get_ai_stats()["budget_seconds"] is None
+
+
+def test_batched_mode_splits_answers_and_falls_back_per_item(stub_server):
+    stub_server.drop_ids = (3,)
+    queries = [f"SELECT @ FROM t{n};" for n in range(6)]
+
+    results = groq_suggester.get_ai_suggestions_batched(
+        [(q, failing_result) for q in queries],
+        mode="json"
+    )
+
+    # One batched request plus one single-query fallback for id 3
+    assert stub_server.requests_seen == 2
+    assert all(r["ai_status"] == "success" for r in results)
+    assert json.loads(results[0]["ai_message"])["explanation"] == "batched"
+    assert results[3]["ai_message"].startswith("fixed")
+
+
+def test_batches_respect_token_budget(stub_server):
+    queries = [f"SELECT @ FROM t{n};" for n in range(6)]
+    items = [(q, failing_result) for q in queries]
+
+    budget = groq_suggester.estimate_tokens(groq_suggester.build_batch_prompt([])) + 150
+    batches, singles = groq_suggester._pack_batches(items, range(6), budget)
+
+    assert singles == []
+    assert len(batches) > 1
+    assert sorted(i for batch in batches for i in batch) == list(range(6))
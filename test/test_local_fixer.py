@@ -0,0 +1,51 @@
+import json
+
+from engine.validator import validate_query
+from ai.local_fixer import get_local_fix, repair_query
+
+query = """
+CREATE TABLE users (
+    id INT
+    name VARCHAR(100)
+);
+"""
+
+
+def test_missing_comma_in_create_table():
+    result = validate_query(query, "postgres")
+    fix = get_local_fix(query, result, mode="json")
+
+    assert fix["ai_status"] == "success"
+    assert fix["ai_source"] == "local"
+
+    corrected = json.loads(fix["ai_message"])["corrected_query"]
+    assert "id INT," in corrected
+    assert validate_query(corrected, "postgres")["status"] == "success"
+
+
+def test_misspelled_keyword_and_missing_semicolon():
+    corrected, notes = repair_query("SELEC id FORM users")
+
+    assert corrected == "SELECT id FROM users;"
+    assert len(notes) == 3
+
+
+def test_valid_query_is_left_to_the_ai():
+    result = validate_query("SELECT id FROM users;", "postgres")
+
+    assert get_local_fix("SELECT id FROM users;", result) is None
+
+
+def test_candidates_are_checked_with_the_query_dialect():
+    # Dollar quotes only lex under postgres
+    query = "SELEC a FROM t WHERE b = $$x$$;"
+    assert repair_query(query, "postgres")[0] == "SELECT a FROM t WHERE b = $$x$$;"
+    assert repair_query(query, "mysql") is None
+
+
+def test_huge_statements_are_left_to_the_ai():
+    from ai import local_fixer
+
+    query = "SELEC a FROM t WHERE b IN (" + ", ".join(str(n) for n in range(3000)) + ");"
+    assert len(query) > local_fixer.MAX_QUERY_CHARS
+    assert repair_query(query) is None
@@ -0,0 +1,85 @@
+import os
+
+from engine.batch import expand_inputs
+from engine.manifest import Manifest, iter_incremental
+
+
+def _run(tmp_path):
+    manifest = Manifest(str(tmp_path / "manifest.json"))
+    files = expand_inputs([str(tmp_path / "sql")])
+    items = [
+        (os.path.basename(path), result["status"], bool(result.get("cached")))
+        for path, _, result, _ in iter_incremental(files, manifest)
+    ]
+    manifest.save()
+    return manifest, items
+
+
+def test_unchanged_files_are_not_revalidated(tmp_path):
+    (tmp_path / "sql").mkdir()
+    good = tmp_path / "sql" / "good.sql"
+    bad = tmp_path / "sql" / "bad.sql"
+    good.write_text("SELECT a FROM t;\nSELECT b FROM t;\n", encoding="utf-8")
+    bad.write_text("SELEC a FROM t;\n", encoding="utf-8")
+
+    manifest, items = _run(tmp_path)
+    assert manifest.validated_files == 2
+    assert items == [("bad.sql", "error", False), ("good.sql", "success", False), ("good.sql", "success", False)]
+
+    # Nothing changed: failures are replayed, passing statements skipped
+    manifest, items = _run(tmp_path)
+    assert (manifest.validated_files, manifest.reused_files, manifest.reused_statements) == (0, 2, 3)
+    assert items == [("bad.sql", "error", True)]
+
+    # Touched only: same hash, still reused
+    os.utime(good, ns=(0, 12345))
+    manifest, items = _run(tmp_path)
+    assert manifest.validated_files == 0
+
+    # Edited: only the new statement is validated, the rest comes from the manifest
+    good.write_text("SELECT a FROM t;\nSELECT b FROM t;\nSELECT c FROM;\n", encoding="utf-8")
+    manifest, items = _run(tmp_path)
+    assert manifest.validated_files == 1
+    assert items[1:] == [("good.sql", "success", True), ("good.sql", "success", True), ("good.sql", "error", False)]
+
+
+def test_dialect_change_invalidates_manifest(tmp_path):
+    (tmp_path / "sql").mkdir()
+    (tmp_path / "sql" / "a.sql").write_text("SELECT a FROM t;", encoding="utf-8")
+    _run(tmp_path)
+
+    manifest = Manifest(str(tmp_path / "manifest.json"), dialect="mysql")
+    assert manifest.files == {}
+
+
+def test_validator_change_invalidates_manifest(tmp_path, monkeypatch):
+    from engine import manifest as manifest_module
+
+    (tmp_path / "sql").mkdir()
+    (tmp_path / "sql" / "a.sql").write_text("SELECT a FROM t;", encoding="utf-8")
+    _run(tmp_path)
+    assert Manifest(str(tmp_path / "manifest.json")).files
+
+    # e.g. a grammar fix since the manifest was written
+    monkeypatch.setattr(manifest_module, "validator_version", lambda: "0" * 16)
+    assert Manifest(str(tmp_path / "manifest.json")).files == {}
+
+
+def test_passing_statements_of_unchanged_files_can_be_replayed(tmp_path):
+    (tmp_path / "sql").mkdir()
+    (tmp_path / "sql" / "a.sql").write_text("SELECT a FROM t;\nSELEC b FROM t;\nSELECT c FROM t", encoding="utf-8")
+    files = expand_inputs([str(tmp_path / "sql")])
+    manifest_path = str(tmp_path / "manifest.json")
+
+    manifest = Manifest(manifest_path)
+    fresh = [(s.text, s.line, r["status"]) for _, s, r, _ in iter_incremental(files, manifest)]
+    manifest.save()
+
+    manifest = Manifest(manifest_path)
+    replayed = [(s.text, s.line, r["status"]) for _, s, r, _ in iter_incremental(files, manifest, replay_passing=True)]
+    assert replayed == fresh
+    assert manifest.skipped_passing == 0
+
+    manifest = Manifest(manifest_path)
+    assert [r["status"] for _, _, r, _ in iter_incremental(files, manifest)] == ["error"]
+    assert manifest.skipped_passing == 2
@@ -0,0 +1,73 @@
+import threading
+import time
+
+from ai.pipeline import SuggestionPipeline
+
+ok = {"status": "success"}
+failed = {"status": "error"}
+
+
+def slow_fetch(query, result, mode):
+    time.sleep(0.05)
+    return {"ai_status": "success", "ai_message": f"{mode}:{query}"}
+
+
+def test_results_come_back_in_submission_order():
+    pipeline = SuggestionPipeline(slow_fetch, workers=4, max_pending=4)
+
+    delivered = []
+    for n in range(10):
+        pipeline.submit(f"q{n}", failed if n % 2 else ok)
+        delivered.extend(pipeline.ready())
+    delivered.extend(pipeline.drain())
+
+    assert [seq for seq, *_ in delivered] == list(range(10))
+    assert delivered[0][3] is None                       # valid query: no AI call
+    assert delivered[1][3]["ai_message"] == "cli:q1"
+
+
+def test_ai_calls_overlap_with_each_other():
+    pipeline = SuggestionPipeline(slow_fetch, workers=8)
+
+    start = time.perf_counter()
+    for n in range(8):
+        pipeline.submit(f"q{n}", failed)
+    list(pipeline.drain())
+
+    # Sequential would take 8 * 50 ms
+    assert time.perf_counter() - start < 0.3
+
+
+def test_batches_are_handed_to_fetch_batch():
+    gate = threading.Event()
+    sizes = []
+
+    def gated_fetch(query, result, mode):
+        gate.wait()
+        return {"ai_status": "success"}
+
+    def fetch_batch(items, mode):
+        sizes.append(len(items))
+        return [{"ai_status": "success"} for _ in items]
+
+    pipeline = SuggestionPipeline(gated_fetch, workers=1, fetch_batch=fetch_batch, batch_size=8)
+    for n in range(6):
+        pipeline.submit(f"q{n}", failed)
+    gate.set()
+
+    assert len(list(pipeline.drain())) == 6
+    # The first item may be picked up alone before the rest are queued
+    assert sum(sizes) in (5, 6) and len(sizes) == 1
+
+
+def test_unreadable_files_are_not_sent_to_the_ai():
+    calls = []
+    pipeline = SuggestionPipeline(lambda query, result, mode: calls.append(query), workers=1)
+
+    pipeline.submit("", {"status": "error", "type": "FileError", "message": "Cannot read a.sql.gz"})
+    pipeline.submit("   ", failed)
+    pipeline.submit("SELEC 1;", failed)
+    delivered = list(pipeline.drain())
+
+    assert calls == ["SELEC 1;"]
+    assert [ai_result for *_, ai_result in delivered][:2] == [None, None]
@@ -0,0 +1,52 @@
+import io
+import os
+import time
+
+from engine.batch import iter_file_statements
+from ui.cli import ProgressReporter
+
+
+def test_progress_tracks_bytes_across_files(tmp_path):
+    first = tmp_path / "a.sql"
+    second = tmp_path / "b.sql"
+    first.write_text("SELECT a FROM t;\nSELECT b FROM t;\n", encoding="utf-8")
+    second.write_text("SELEC c FROM t;\n", encoding="utf-8")
+    files = [str(first), str(second)]
+
+    stream = io.StringIO()
+    progress = ProgressReporter(files, stream=stream, interval=0.01)
+    total = os.path.getsize(first) + os.path.getsize(second)
+    assert progress.total_bytes == total
+
+    statements = list(iter_file_statements(str(first)))
+    progress.statement_done(str(first), statements[0], "success")
+    assert progress._finished_bytes == statements[0].byte_end
+
+    progress.statement_done(str(first), statements[1], "success")
+    progress.file_done(str(first), 2)
+    progress.statement_done(str(second), next(iter_file_statements(str(second))), "error")
+    assert progress._finished_bytes == total - 1          # all but the trailing newline
+    assert (progress.files, progress.statements, progress.failed) == (1, 3, 1)
+
+    progress.start()
+    time.sleep(0.05)
+    progress.finish()
+
+    output = stream.getvalue()
+    assert "ETA" in output
+    assert output.rstrip().split("\r")[-1].startswith("[1/2 files]  100.0% of")
+    assert "3 statements (1 failed)" in output
+
+
+def test_resumed_progress_starts_at_the_checkpoint_offset(tmp_path):
+    path = tmp_path / "a.sql"
+    path.write_text("".join(f"SELECT c{i} FROM t;\n" for i in range(10)), encoding="utf-8")
+    statements = list(iter_file_statements(str(path)))
+
+    progress = ProgressReporter([str(path)], stream=io.StringIO(), done_offset=statements[4].byte_end)
+    assert progress._finished_bytes == statements[4].byte_end
+
+    for statement in statements[5:]:
+        progress.statement_done(str(path), statement, "success")
+    assert progress._finished_bytes == statements[-1].byte_end
+    assert progress._finished_bytes - progress._start_bytes == statements[-1].byte_end - statements[4].byte_end
@@ -0,0 +1,71 @@
+from engine.validator import validate_query
+from ai.prompt_context import build_query_context, estimate_tokens, summarize_values
+
+rows = ",\n".join(f"({n}, 'user{n}')" for n in range(20000))
+query = f"INSERT INTO users (id, name) VALUES\n{rows};"
+broken = query.replace("(10000, 'user10000')", "(10000, 'user10000'@)")
+
+
+def test_small_queries_are_untouched():
+    assert build_query_context("SELECT 1;", 0) == "SELECT 1;"
+
+
+def test_bulk_values_are_summarized_around_the_error():
+    result = validate_query(broken, "postgres")
+    assert result["status"] == "error"
+
+    context = build_query_context(broken, result["position"])
+
+    assert estimate_tokens(context) <= 1500
+    assert "(1, 'user1')" in context
+    assert "(10000, 'user10000'@" in context
+    assert "(19999, 'user19999')" in context
+    assert "more rows" in context
+
+
+def test_error_position_follows_the_summary():
+    position = broken.index("(10000, 'user10000'@")
+    summary, new_position = summarize_values(broken, position)
+
+    assert summary[new_position:].startswith("(10000, 'user10000'@")
+
+
+def test_long_error_lines_are_cut_in_messages():
+    one_line = broken.replace("\n", " ")
+    message = validate_query(one_line, "postgres")["message"]
+
+    assert len(message) < 400
+
+
+def test_context_cache_does_not_keep_queries_alive():
+    from ai import prompt_context
+
+    position = broken.index("(10000, 'user10000'@")
+    first = build_query_context(broken, position)
+    assert build_query_context(broken, position) is first
+    assert all(broken not in key for key in prompt_context._context_cache)
+
+    for n in range(prompt_context.CONTEXT_CACHE_SIZE + 10):
+        build_query_context(broken + f" -- {n}", position)
+    assert len(prompt_context._context_cache) == prompt_context.CONTEXT_CACHE_SIZE
+
+
+def test_context_cache_is_thread_safe():
+    import random
+    import sys
+    from concurrent.futures import ThreadPoolExecutor
+
+    long_query = "SELECT " + ", ".join(f"c{n}" for n in range(400)) + " FROM @;"
+    rng = random.Random(33)
+    # A few more distinct queries than cache slots: hits and evictions interleave
+    queries = [long_query + f" -- {rng.randrange(280)}" for _ in range(20000)]
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)     # switch threads often enough to hit races
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            contexts = list(executor.map(lambda q: build_query_context(q, 100, max_tokens=100), queries))
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert all("omitted" in context for context in contexts)
@@ -0,0 +1,45 @@
+import csv
+import io
+import json
+
+from engine.splitter import split_statements
+from engine.validator import validate_query
+from reports.records import RECORD_FIELDS, build_record
+from reports.json_report import JsonLinesReportWriter
+from reports.csv_report import CsvReportWriter
+from reports.text_report import TextReportWriter
+
+
+SCRIPT = (
+    "SELECT a FROM t WHERE b = 'a;b';\n"
+    "/* block; */ SELEC x FROM t; -- trailing; comment\n"
+    "INSERT INTO t VALUES ('it''s');\n"
+    "SELECT c FROM t"
+)
+
+
+def _records():
+    for idx, statement in enumerate(split_statements(SCRIPT), 1):
+        result = validate_query(statement.text, "postgres")
+        yield build_record(idx, statement.text, result, line=statement.line)
+
+
+def test_writers_stream_one_record_per_statement():
+    jsonl, table, text = io.StringIO(), io.StringIO(), io.StringIO()
+    writers = [JsonLinesReportWriter(jsonl), CsvReportWriter(table), TextReportWriter(text)]
+
+    for record in _records():
+        for writer in writers:
+            writer.write(record)
+    for writer in writers:
+        writer.close({"breaker_state": "closed"})
+
+    lines = [json.loads(line) for line in jsonl.getvalue().splitlines()]
+    assert [r["status"] for r in lines[:-1]] == ["success", "error", "success", "error"]
+    assert lines[-1] == {"ai_service": {"breaker_state": "closed"}}
+
+    rows = list(csv.DictReader(io.StringIO(table.getvalue())))
+    assert list(rows[0]) == RECORD_FIELDS
+    assert [r["line"] for r in rows] == ["1", "2", "2", "4"]
+
+    assert "Statements : 4 (2 passed, 2 failed)" in text.getvalue()
@@ -0,0 +1,63 @@
+from engine.splitter import StatementSplitter, split_statements
+
+
+SCRIPT = (
+    "SELECT a FROM t WHERE b = 'a;b';\n"
+    "/* block; */ SELEC x FROM t; -- trailing; comment\n"
+    "INSERT INTO t VALUES ('it''s');\n"
+    "SELECT c FROM t"
+)
+
+
+def test_split_statements_ignores_quoted_and_commented_semicolons():
+    statements = split_statements(SCRIPT)
+
+    assert [s.line for s in statements] == [1, 2, 2, 4]
+    assert statements[0].text == "SELECT a FROM t WHERE b = 'a;b';"
+    assert statements[1].text == "/* block; */ SELEC x FROM t;"
+    assert statements[2].text.startswith("-- trailing; comment\nINSERT")
+    assert statements[3].text == "SELECT c FROM t"
+
+
+def test_splitter_is_chunk_size_independent():
+    # The second script ends in a comment-only fragment, which is dropped
+    for script in (SCRIPT, SCRIPT + ";\n/* tail; */\n"):
+        expected = [(s.text, s.offset, s.line) for s in split_statements(script)]
+
+        for size in (1, 2, 3, 7):
+            splitter = StatementSplitter()
+            got = []
+            for i in range(0, len(script), size):
+                got.extend(splitter.feed(script[i:i + size]))
+            got.extend(splitter.flush())
+            assert [(s.text, s.offset, s.line) for s in got] == expected
+
+    assert split_statements("SELECT a FROM t;/* x */")[-1].text == "SELECT a FROM t;"
+
+
+def test_splitter_bounds_unterminated_fragments():
+    splitter = StatementSplitter(max_pending=100)
+
+    emitted = splitter.feed("SELECT 'never closed " + "x" * 200)
+    assert len(emitted) == 1 and not splitter.pending
+
+    # The rest of the cut literal is skipped, then the stream recovers
+    assert splitter.feed("\nSELECT a; ''b;") == []
+    assert [s.text for s in splitter.feed("' AND c;\nSELECT a FROM t;")] == ["AND c;", "SELECT a FROM t;"]
+
+
+def test_splitter_keeps_quote_state_across_forced_cuts():
+    literal = "'" + "x;'' " * 1200 + "'"
+    script = f"INSERT INTO t VALUES ({literal});\nSELECT a FROM t;\nSELECT b FROM t;\n"
+
+    for size in (7, 64, 1000):
+        splitter = StatementSplitter(max_pending=1000)
+        statements = []
+        for i in range(0, len(script), size):
+            statements.extend(splitter.feed(script[i:i + size]))
+        statements.extend(splitter.flush())
+
+        texts = [s.text for s in statements]
+        assert texts[-3:] == [");", "SELECT a FROM t;", "SELECT b FROM t;"]
+        assert len(texts) == 4
+        assert statements[-1].line == 3
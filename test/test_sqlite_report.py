@@ -0,0 +1,85 @@
+import sqlite3
+
+from engine.validator import validate_query
+from reports.records import build_record
+from reports.sqlite_report import SqliteReportWriter
+
+
+QUERIES = [
+    "SELECT a FROM t WHERE id = 1;",
+    "SELEC a FROM t;",
+    "SELECT a FROM t WHERE id = 2;"
+]
+
+
+def _write_run(path, batch_size):
+    writer = SqliteReportWriter(path, batch_size=batch_size)
+    for idx, query in enumerate(QUERIES, 1):
+        writer.write(build_record(idx, query, validate_query(query, "postgres")))
+    writer.close({"breaker_state": "closed"})
+    return writer.run_id
+
+
+def test_sqlite_sink_batches_runs_and_indexes(tmp_path):
+    path = str(tmp_path / "audit.db")
+
+    first = _write_run(path, batch_size=2)
+    second = _write_run(path, batch_size=100)
+    assert second != first
+
+    conn = sqlite3.connect(path)
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+        rows = conn.execute(
+            'SELECT status, error_type, fingerprint FROM results WHERE run_id = ? ORDER BY "index"',
+            (first,)
+        ).fetchall()
+        assert [r[0] for r in rows] == ["success", "error", "success"]
+        assert rows[1][1] == "SyntaxError"
+        # Literal values don't change the fingerprint
+        assert rows[0][2] == rows[2][2]
+
+        statements, ai_stats = conn.execute(
+            "SELECT statements, ai_stats FROM runs WHERE id = ?", (first,)
+        ).fetchone()
+        assert statements == 3 and "closed" in ai_stats
+
+        indexes = {r[1] for r in conn.execute("PRAGMA index_list(results)")}
+        assert {
+            "idx_results_status",
+            "idx_results_error_type",
+            "idx_results_dialect",
+            "idx_results_fingerprint"
+        } <= indexes
+    finally:
+        conn.close()
+
+
+def test_fingerprint_comes_from_the_validator_and_runs_count_statements(tmp_path):
+    from engine.fingerprint import fingerprint_query
+    from reports.records import record_fingerprint
+    from reports.writers import open_report_writer
+
+    for query in QUERIES:
+        record = build_record(1, query, validate_query(query, "postgres"))
+        assert record["fingerprint"] == fingerprint_query(query)
+
+    # Not lexable: computed from the text on demand
+    record = build_record(1, "SELECT 'x FROM t;", validate_query("SELECT 'x FROM t;", "postgres"))
+    assert "fingerprint" not in record
+    assert record_fingerprint(record) == fingerprint_query("SELECT 'x FROM t;")
+
+    path = str(tmp_path / "audit.db")
+    writer = open_report_writer("sqlite", path, dedup=True)
+    queries = QUERIES + ["SELEC a FROM t;"] * 4
+    for idx, query in enumerate(queries, 1):
+        writer.write(build_record(idx, query, validate_query(query, "postgres")))
+    writer.close()
+
+    conn = sqlite3.connect(path)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM results").fetchone()[0] == 3
+        assert conn.execute("SELECT statements FROM runs").fetchone()[0] == len(queries)
+    finally:
+        conn.close()
@@ -0,0 +1,82 @@
+import os
+
+import pytest
+
+from ai import suggestion_cache
+from ai.suggestion_cache import DEFAULT_TTL, SuggestionCache
+from engine.fingerprint import fingerprint_query
+
+result = {"status": "error", "message": 'syntax error at or near "x"'}
+suggestion = {"ai_status": "success", "ai_message": "Corrected Version: ..."}
+
+
+def test_fingerprint_ignores_formatting_and_literals():
+    assert fingerprint_query("select id from t where a = 1;") == \
+        fingerprint_query("SELECT  id\nFROM t -- note\nWHERE a = 2;")
+    assert fingerprint_query("SELECT id FROM t WHERE a = 1;", keep_literals=True) != \
+        fingerprint_query("SELECT id FROM t WHERE a = 2;", keep_literals=True)
+
+
+def test_cache_roundtrip_through_disk(tmp_path):
+    key = SuggestionCache.make_key("SELECT x FROM t;", result, "cli", "model")
+
+    SuggestionCache(str(tmp_path)).set(key, suggestion)
+
+    # A fresh instance (new process) only has the disk copy
+    assert SuggestionCache(str(tmp_path)).get(key) == suggestion
+
+
+def test_expired_entries_are_ignored(tmp_path):
+    cache = SuggestionCache(str(tmp_path), ttl=-1)
+    key = cache.make_key("SELECT x FROM t;", result, "cli", "model")
+    cache.set(key, suggestion)
+
+    assert cache.get(key) is None
+
+
+def test_lru_evicts_oldest_entry():
+    cache = SuggestionCache(None, max_entries=2)
+    for name in ("a", "b", "c"):
+        cache.set(name, {"ai_message": name})
+
+    assert cache.get("a") is None
+    assert cache.get("c") == {"ai_message": "c"}
+
+
+def test_invalid_ttl_setting_falls_back_to_the_default(tmp_path, monkeypatch):
+    monkeypatch.setenv("SQLIDATOR_AI_CACHE_TTL", "7d")
+    monkeypatch.setenv("SQLIDATOR_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(suggestion_cache, "_default_cache", None)
+
+    with pytest.warns(RuntimeWarning, match="SQLIDATOR_AI_CACHE_TTL"):
+        cache = suggestion_cache.get_default_cache()
+
+    assert cache.ttl == DEFAULT_TTL
+
+
+def test_keys_use_the_exact_query_text():
+    assert SuggestionCache.make_key("SELECT x FROM t;", result, "cli", "model") != \
+        SuggestionCache.make_key("select x\nFROM t;", result, "cli", "model")
+
+
+def test_expired_disk_entries_are_pruned_on_open(tmp_path):
+    cache = SuggestionCache(str(tmp_path))
+    old_key = cache.make_key("SELECT old FROM t;", result, "cli", "model")
+    new_key = cache.make_key("SELECT new FROM t;", result, "cli", "model")
+    cache.set(old_key, suggestion)
+    cache.set(new_key, suggestion)
+
+    week_ago = os.path.getmtime(cache._path(old_key)) - DEFAULT_TTL - 60
+    os.utime(cache._path(old_key), (week_ago, week_ago))
+    os.utime(tmp_path / ".pruned", (week_ago, week_ago))
+
+    SuggestionCache(str(tmp_path))
+    assert not os.path.exists(cache._path(old_key))
+    assert os.path.exists(cache._path(new_key))
+
+
+def test_failed_disk_writes_leave_no_temp_files(tmp_path):
+    cache = SuggestionCache(str(tmp_path))
+    cache.set("ab" + "0" * 62, {"ai_message": object()})     # not JSON-serializable
+
+    assert not list(tmp_path.rglob("*.tmp"))
@@ -0,0 +1,28 @@
+from engine.validator import validate_query
+from engine.keyword_index import BKTree, suggest_keyword
+
+query = """
+DROP TABE users;
+"""
+
+
+def test_misspelled_keyword_gets_hint():
+    result = validate_query(query, "postgres")
+
+    assert result["status"] == "error"
+    assert result["expected"] == ["TABLE", "VIEW"]
+    assert result["suggestion"] == "TABLE"
+    assert 'HINT:  Perhaps you meant "TABLE".' in result["message"]
+
+
+def test_suggestion_is_limited_to_expected_set():
+    assert suggest_keyword("FORM", {",", "FROM"}) == "FROM"
+    assert suggest_keyword("FORM", {"identifier"}) is None
+    assert suggest_keyword("users", {"TABLE", "VIEW"}) is None
+
+
+def test_bk_tree_search():
+    tree = BKTree(["SELECT", "DELETE", "TABLE", "VIEW"])
+
+    assert tree.search("SELEC", 1) == [(1, "SELECT")]
+    assert tree.search("VIEW", 0) == [(0, "VIEW")]
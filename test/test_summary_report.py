@@ -0,0 +1,101 @@
+import io
+import random
+
+from engine.validator import validate_query
+from reports.aggregates import LogHistogram, TopK
+from reports.records import build_record
+from reports.summary_report import SummaryReportWriter
+
+
+def test_log_histogram_percentiles_are_close_and_fixed_size():
+    histogram = LogHistogram()
+    size = len(histogram.counts)
+    values = [random.uniform(0.001, 0.010) for _ in range(20000)]
+
+    for value in values:
+        histogram.add(value)
+
+    values.sort()
+    for p in (50, 90, 99):
+        exact = values[int(len(values) * p / 100) - 1]
+        assert abs(histogram.percentile(p) - exact) / exact < 0.06
+
+    assert len(histogram.counts) == size
+    assert histogram.percentile(100) <= histogram.max
+
+
+def test_topk_keeps_heavy_hitters_with_bounded_memory():
+    top = TopK(capacity=10)
+
+    for i in range(5000):
+        top.add("hot", payload="first")
+        top.add(f"cold-{i}")
+
+    assert len(top.entries) == 10
+    key, count, error, payload = top.most_common(1)[0]
+    assert key == "hot" and payload == "first"
+    assert count - error <= 5000 <= count
+
+
+def test_summary_report_single_pass():
+    queries = [
+        "SELECT a FROM t WHERE id = 1;",
+        "SELECT a FROM t WHERE id = 2;",
+        "CREATE TABLE x (id INT);",
+        "SELEC a FROM t WHERE id = 1;",
+        "SELEC a FROM t WHERE id = 2;"
+    ]
+
+    out = io.StringIO()
+    writer = SummaryReportWriter(out)
+    for idx, query in enumerate(queries, 1):
+        timings = {}
+        result = validate_query(query, "postgres", timings)
+        assert set(timings) <= {"lex", "parse"} and "lex" in timings
+        writer.write(build_record(idx, query, result, timings=timings))
+    writer.close()
+
+    text = out.getvalue()
+    assert "Statements   : 5 (3 passed, 2 failed)" in text
+    assert "SELECT" in text and "CREATE_TABLE" in text
+    # Both SELEC failures share one fingerprint group
+    assert '         2  ' in text and 'near "SELEC"' in text
+    assert "p99" in text and "(not measured)" not in text
+
+
+def test_topk_always_evicts_a_least_frequent_key():
+    rng = random.Random(36)
+    top = TopK(capacity=20)
+
+    for _ in range(20000):
+        key = f"k{int(rng.paretovariate(1.2)) % 500}"
+        floor = min(entry[0] for entry in top.entries.values()) if len(top.entries) == 20 else 0
+        new = key not in top.entries
+        entry = top.add(key)
+        if new:
+            assert entry[1] == floor
+
+    restored = TopK(capacity=20)
+    restored.restore(top.state())
+    restored.add("fresh")
+    assert len(restored.entries) == 20 and "fresh" in restored.entries
+
+
+def test_summary_throughput_counts_input_bytes():
+    from reports.summary_report import SummaryReport
+
+    summary = SummaryReport()
+    first, second = "SELECT 'é' FROM t;", "SELECT b FROM t;"
+    summary.add(build_record(1, first, validate_query(first), source="a.sql", byte_end=20))
+    summary.add(build_record(2, second, validate_query(second), source="a.sql", byte_end=40))
+    summary.add(build_record(3, second, validate_query(second), source="b.sql", byte_end=17))
+    assert summary.bytes == 57
+
+    # Without file offsets: the statement's UTF-8 size
+    summary.add(build_record(4, first, validate_query(first)))
+    assert summary.bytes == 57 + len(first.encode("utf-8"))
+
+    resumed = SummaryReport()
+    resumed.restore(summary.state())
+    resumed.add(build_record(5, second, validate_query(second), source="b.sql", byte_end=34))
+    assert resumed.bytes == summary.bytes + 17
@@ -0,0 +1,40 @@
+import os
+
+from engine.manifest import Manifest
+from engine.watch import Watcher
+
+
+def _summary(changes):
+    result = []
+    for change in changes:
+        added, fixed = change.failures()
+        result.append((
+            os.path.basename(change.path),
+            None if change.new is None else len(change.new),
+            [s["line"] for s in added],
+            [s["line"] for s in fixed]
+        ))
+    return result
+
+
+def test_watcher_reports_only_changed_files(tmp_path):
+    a = tmp_path / "a.sql"
+    b = tmp_path / "b.sql"
+    a.write_text("SELECT a FROM t;\n", encoding="utf-8")
+    b.write_text("SELEC b FROM t;\n", encoding="utf-8")
+
+    watcher = Watcher([str(tmp_path)], Manifest(None))
+
+    assert _summary(watcher.scan()) == [("a.sql", 1, [], []), ("b.sql", 1, [1], [])]
+    assert watcher.scan() == []
+
+    a.write_text("SELECT a FROM t;\nSELECT x FROM;\n", encoding="utf-8")
+    b.write_text("SELECT b FROM t;\n", encoding="utf-8")
+    assert _summary(watcher.scan()) == [("a.sql", 2, [2], []), ("b.sql", 1, [], [1])]
+
+    # Touch without editing: same hash, nothing to report
+    os.utime(a, ns=(0, 1))
+    assert watcher.scan() == []
+
+    a.unlink()
+    assert _summary(watcher.scan()) == [("a.sql", None, [], [2])]
@@ -731,12 +731,21 @@ if run:
             result = validate_query(query, dialect)
 
         ai_result = None
+        ai_stats = None
+        ai_pipeline = None
 
-        # ── AI Suggestions ──────────────────────────────────
+        # ── AI Suggestions (fetched while the result renders) ──
         if enable_ai:
-            from ai.groq_suggester import get_ai_suggestion
-            with st.spinner("Fetching AI suggestions via Groq..."):
-                ai_result = get_ai_suggestion(query, result)
+            from ai.groq_suggester import get_ai_suggestion, get_ai_stats
+            from ai.pipeline import SuggestionPipeline
+
+            # Passing queries get improvement suggestions too
+            ai_pipeline = SuggestionPipeline(
+                get_ai_suggestion,
+                workers=1,
+                needs_ai=lambda result: True
+            )
+            ai_pipeline.submit(query, result)
 
         st.markdown('<hr>', unsafe_allow_html=True)
 
@@ -794,6 +803,12 @@ if run:
                 st.code(str(ast), language="python")
 
         # ── AI Output ───────────────────────────────────────
+        if ai_pipeline is not None:
+            with st.spinner("Fetching AI suggestions via Groq..."):
+                for _, _, _, ai_result in ai_pipeline.drain():
+                    pass
+            ai_stats = get_ai_stats()
+
         if enable_ai and ai_result:
             st.markdown('<div class="section-heading">AI Suggestions</div>', unsafe_allow_html=True)
             ai_status = ai_result.get("ai_status")
@@ -801,15 +816,15 @@ if run:
 
             if ai_status == "success":
                 st.info(ai_msg)
-            elif ai_status == "disabled":
+            elif ai_status in ("disabled", "skipped"):
                 st.warning(ai_msg)
             else:
                 st.error(ai_msg)
 
         # ── Reports ─────────────────────────────────────────
-        text_report = generate_text_report(query, result, ai_result)
-        json_report = generate_json_report(query, result, ai_result)
-        csv_report  = generate_csv_report(query, result, ai_result)
+        text_report = generate_text_report(query, result, ai_result, ai_stats)
+        json_report = generate_json_report(query, result, ai_result, ai_stats)
+        csv_report  = generate_csv_report(query, result, ai_result, ai_stats)
 
         st.markdown('<div class="section-heading">Download Report</div>', unsafe_allow_html=True)
 
@@ -3,24 +3,42 @@ SQLidator CLI (Parser-Based Version)
 ------------------------------------
 Supports:
 - Direct query input
-- .sql file input (multiple statements)
+- .sql file input (multiple statements, streamed in chunks)
+- Directory / glob inputs validated in a process pool (--jobs)
+- Watch mode re-validating changed files (--watch)
+- Git-aware runs validating only changed statements (--changed-since)
+- Streaming stdin input, validated statement by statement (--stdin)
+- Checkpointed --file runs that can be continued after an interruption (--resume)
 - Dialect selection
-- Optional AI suggestions
-- Report generation (TXT / JSON / CSV)
+- Optional AI suggestions (fetched in the background, see ai.pipeline)
+- Report generation (TXT / JSON Lines / CSV / SQLite), written incrementally
+- Machine-readable stdout (--format jsonl | quiet | summary)
+- Run-to-run comparison of JSON Lines / SQLite reports (--compare)
 """
 
 import sys
 import os
+import json
+import time
 import argparse
+import threading
 
 # Add project root to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from engine.validator import validate_query
-from reports.text_report import generate_text_report
-from reports.json_report import generate_json_report
-from reports.csv_report import generate_csv_report
-from ai.groq_suggester import get_ai_suggestion
+from engine.copy_data import split_command
+from engine.splitter import Statement
+
+# Everything else (batch / manifest / git / watch engines, report writers,
+# the AI client with `requests` and dotenv) is imported where it is used,
+# so a plain --query run starts without paying for it.
+# See benchmarks/bench_startup.py.
+
+AI_WORKERS = 4
+AI_BATCH_SIZE = 32
+PROGRESS_INTERVAL = 0.5
+COMPARE_EXAMPLES = 10
 
 
 # ==========================================================
@@ -41,17 +59,409 @@ def show_banner():
     print(banner)
 
 
+# ==========================================================
+# PROGRESS
+# ==========================================================
+
+class ProgressReporter:
+    """
+    Progress line on stderr for file runs: files, bytes done against the
+    total input size, statements/s, MB/s and ETA.
+
+    The validation loop only bumps counters (statement_done / file_done);
+    a daemon thread renders them every `interval` seconds, so nothing
+    is timed or formatted per statement.
+    """
+
+    def __init__(self, files, stream=None, interval=PROGRESS_INTERVAL, done_files=0, done_offset=0):
+        """
+        done_files / done_offset: input already processed by an earlier
+            run (--resume): whole files, then the byte offset reached in
+            files[done_files]; rates only count this run
+        """
+
+        from engine.batch import is_compressed
+
+        self.stream = stream or sys.stderr
+        self.interval = interval
+        self.enabled = stream is not None or sys.stderr.isatty()
+
+        # Offsets inside compressed files count decompressed bytes, so
+        # those files only advance the total once finished
+        self.compressed = {path for path in files if is_compressed(path)}
+        self.sizes = {}
+        for path in files:
+            try:
+                self.sizes[path] = os.path.getsize(path)
+            except OSError:
+                self.sizes[path] = 0
+        self.total_files = len(files)
+        self.total_bytes = sum(self.sizes.values())
+
+        self.files = done_files
+        self.statements = 0
+        self.failed = 0
+
+        # Bytes of files left behind + byte offset in the current file
+        self._source = None
+        self._position = 0
+        done_bytes = sum(self.sizes[path] for path in files[:done_files])
+        if done_offset and done_files < len(files) and files[done_files] not in self.compressed:
+            self._source = files[done_files]
+            self._position = done_offset
+            done_bytes += done_offset
+
+        self._start_bytes = done_bytes
+        self._finished_bytes = done_bytes
+
+        self._started = time.monotonic()
+        self._width = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self.enabled:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    # ------------------------------------------------------
+    # Hot path: plain attribute updates only
+    # ------------------------------------------------------
+
+    def file_done(self, path, statement_count):
+        self.files += 1
+
+    def statement_done(self, source, statement, status):
+        self.statements += 1
+        if status == "error":
+            self.failed += 1
+
+        if source != self._source:
+            if self._source is not None:
+                self._finished_bytes += self.sizes.get(self._source, 0) - self._position
+            self._source = source
+            self._position = 0
+
+        if statement is not None and statement.byte_end is not None and source not in self.compressed:
+            self._finished_bytes += statement.byte_end - self._position
+            self._position = statement.byte_end
+
+    # ------------------------------------------------------
+    # Rendering (reporter thread)
+    # ------------------------------------------------------
+
+    def finish(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._render(final=True)
+            self.stream.write("\n")
+            self.stream.flush()
+            self._thread = None
+
+    def line(self, final=False):
+        elapsed = max(time.monotonic() - self._started, 1e-9)
+        done = self.total_bytes if final else min(self._finished_bytes, self.total_bytes)
+        rate = (done - self._start_bytes) / elapsed
+
+        parts = [f"[{self.files}/{self.total_files} files]"]
+        if self.total_bytes:
+            parts.append(
+                f"{done / self.total_bytes:.1%} of {_megabytes(self.total_bytes)}"
+            )
+        parts.append(f"{self.statements:,} statements ({self.failed:,} failed)")
+        parts.append(f"{self.statements / elapsed:,.0f} stmt/s")
+        parts.append(f"{rate / 1024 / 1024:,.2f} MB/s")
+
+        if final:
+            parts.append(f"in {_duration(elapsed)}")
+        elif rate > 0:
+            parts.append(f"ETA {_duration((self.total_bytes - done) / rate)}")
+
+        return "  ".join(parts)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._render()
+
+    def _render(self, final=False):
+        text = self.line(final)
+        padding = " " * max(0, self._width - len(text))
+        self._width = len(text)
+        self.stream.write(f"\r{text}{padding}")
+        self.stream.flush()
+
+
+def _megabytes(size):
+    return f"{size / 1024 / 1024:,.1f} MB"
+
+
+def _duration(seconds):
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds}s"
+
+
+# ==========================================================
+# RESULT OUTPUT
+# ==========================================================
+
+def print_result(idx, query, result, ai_result=None, show_ai=False, location=None):
+    print("\n" + "=" * 60)
+    print(f"QUERY {idx} ({location}):" if location else f"QUERY {idx}:")
+    print(split_command(query))
+    print("=" * 60)
+
+    # Print result
+    print("\nRESULT:")
+    print("-" * 60)
+    status = result.get("status")
+    print("Status  :", status.upper())
+    print("Dialect :", result.get("dialect"))
+    print("Message :", result.get("message"))
+    if status == "error":
+        print("Type    :", result.get("type"))
+
+    # Print AST if success
+    if status == "success" and result.get("cached"):
+        print("\nAST: (unchanged, result reused from manifest)")
+    elif status == "success":
+        print("\nAST:")
+        print("-" * 60)
+        ast = result.get("ast")
+        if isinstance(ast, list):
+            for j, stmt in enumerate(ast, 1):
+                print(f"\nStatement {j}:")
+                print(stmt)
+        else:
+            print(ast)
+
+    # AI suggestions
+    if show_ai:
+        print("\nAI SUGGESTIONS:")
+        print("-" * 60)
+        if ai_result and ai_result.get("ai_status") == "success":
+            print(format_ai_suggestion(query, ai_result))
+        elif ai_result is None and status == "success":
+            print("No suggestions needed.")
+        else:
+            print("No AI suggestions available.")
+
+
+def format_ai_suggestion(query, ai_result):
+    """
+    Terminal copy of a suggestion. With --report the AI answers in the
+    report's mode; JSON / CSV answers are shown in the cli layout.
+    """
+
+    from ai.local_fixer import format_suggestion
+    from reports.records import parse_ai_result
+
+    corrected, explanation = parse_ai_result(ai_result)
+    if corrected is None:
+        # Plain-text answers (cli / txt modes) print as they are
+        return ai_result.get("ai_message")
+
+    return format_suggestion(split_command(query), corrected, explanation or "", "cli")
+
+
+# ==========================================================
+# MACHINE-READABLE OUTPUT
+# ==========================================================
+
+class QuietWriter:
+    """
+    One "source:line: message" line per failing statement.
+    """
+
+    def __init__(self, fh, close_file=False, resume=None):
+        self.fh = fh
+        self.close_file = close_file
+
+    def write(self, record: dict):
+        if record.get("status") != "error":
+            return
+        location = f"{record['source']}:{record.get('line')}" if record.get("source") else f"query {record.get('index')}"
+        message = (record.get("message") or "").split("\n", 1)[0]
+        self.fh.write(f"{location}: {record.get('error_type')}: {message}\n")
+
+    def close(self, ai_stats: dict | None = None):
+        self.fh.flush()
+        if self.close_file:
+            self.fh.close()
+
+    def checkpoint(self) -> dict:
+        self.fh.flush()
+        return {}
+
+
+def open_stdout_writer(output_format, resume=None):
+    from reports.writers import WRITE_BUFFER_SIZE
+
+    if output_format == "jsonl":
+        from reports.json_report import JsonLinesReportWriter as writer_class
+    elif output_format == "summary":
+        from reports.summary_report import SummaryReportWriter as writer_class
+    else:
+        writer_class = QuietWriter
+
+    # Own buffered handle on fd 1: far fewer writes than print() per line
+    fh = open(
+        sys.stdout.fileno(),
+        "w",
+        encoding="utf-8",
+        buffering=WRITE_BUFFER_SIZE,
+        closefd=False
+    )
+    sys.stdout.flush()
+    return writer_class(fh, close_file=True, resume=resume)
+
+
+# ==========================================================
+# RUN COMPARISON
+# ==========================================================
+
+def run_compare(old_path, new_path, output=None):
+    from reports.compare import CHANGE_KINDS, change_record, compare_paths, format_compare_counts
+
+    for path in (old_path, new_path):
+        if not os.path.exists(path.rpartition("#")[0] if ".db#" in path else path):
+            print(f"❌ File not found: {path}")
+            sys.exit(1)
+
+    examples = {kind: [] for kind in CHANGE_KINDS}
+    diff_file = None
+    diff_filename = None
+
+    if output:
+        diff_filename = f"{output}.diff.jsonl"
+        diff_file = open(diff_filename, "w", encoding="utf-8")
+
+    def on_change(kind, old_row, new_row):
+        record = change_record(kind, old_row, new_row)
+        if len(examples[kind]) < COMPARE_EXAMPLES:
+            examples[kind].append(record)
+        if diff_file is not None:
+            diff_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    try:
+        counts = compare_paths(old_path, new_path, on_change=on_change)
+    finally:
+        if diff_file is not None:
+            diff_file.close()
+
+    print("\n" + "=" * 60)
+    print(f"COMPARE: {old_path} → {new_path}")
+    print("=" * 60)
+    for line in format_compare_counts(counts):
+        print(line)
+
+    for kind in ("newly_failing", "changed_error", "newly_passing"):
+        if not examples[kind]:
+            continue
+        print(f"\n{kind.upper().replace('_', ' ')}:")
+        print("-" * 60)
+        for record in examples[kind]:
+            print(f"{record['location']}: {record['query']}")
+            if record["old_message"]:
+                print(f"    was: {record['old_message']}")
+            if record["new_status"] == "error":
+                print(f"    now: {record['new_message']}")
+
+    if diff_filename:
+        print(f"\n📄 Diff saved: {os.path.abspath(diff_filename)}")
+
+
+# ==========================================================
+# WATCH MODE
+# ==========================================================
+
+def print_changes(changes):
+    stamp = time.strftime("%H:%M:%S")
+
+    for change in changes:
+        if change.new is None:
+            print(f"[{stamp}] {change.path}: deleted")
+            continue
+
+        added, fixed = change.failures()
+        print(
+            f"[{stamp}] {change.path}: {len(change.new)} statements, "
+            f"{change.failing} failing"
+        )
+        for stored in added:
+            message = (stored.get("message") or "").split("\n", 1)[0]
+            print(f"  + line {stored['line']}: {stored.get('type')}: {message}")
+        for stored in fixed:
+            print(f"  - line {stored['line']}: fixed ({stored.get('query', '').strip()[:60]})")
+
+    sys.stdout.flush()
+
+
+def run_watch(paths, dialect, manifest_path=None, interval=None, jobs=1):
+    from engine.manifest import Manifest
+    from engine.watch import POLL_INTERVAL, Watcher
+
+    interval = interval or POLL_INTERVAL
+    watcher = Watcher(paths, Manifest(manifest_path, dialect), jobs=jobs)
+    print(f"👀 Watching {', '.join(paths)} (every {interval:g}s, Ctrl-C to stop)")
+
+    try:
+        watcher.run(print_changes, interval=interval)
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+    finally:
+        watcher.manifest.save()
+
+
 # ==========================================================
 # MAIN FUNCTION
 # ==========================================================
 
 def main():
-    show_banner()
-
     parser = argparse.ArgumentParser(description="SQLidator CLI")
 
     parser.add_argument("--query", type=str, help="SQL query string")
-    parser.add_argument("--file", type=str, help="Path to .sql file")
+    parser.add_argument(
+        "--file",
+        nargs="+",
+        help="Path(s) to .sql files (.sql.gz / .bz2 / .xz are decompressed on the fly), "
+             "directories (searched recursively) or glob patterns"
+    )
+    parser.add_argument(
+        "--watch",
+        nargs="+",
+        metavar="PATH",
+        help="Keep running and re-validate files under PATH as they change, "
+             "printing new and fixed failures"
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        help="Seconds between --watch polls (default 1)"
+    )
+    parser.add_argument(
+        "--changed-since",
+        metavar="REV",
+        help="Validate only statements touched since git revision REV "
+             "(--file paths, if given, limit the diff)"
+    )
+    parser.add_argument(
+        "--stdin",
+        action="store_true",
+        help="Read SQL from stdin and validate each statement as soon as its ';' arrives "
+             "(e.g. tail -f queries.log | sqlidator --stdin)"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Validate files in N worker processes (results stay in input order)"
+    )
     parser.add_argument(
         "--dialect",
         type=str,
@@ -59,113 +469,469 @@ def main():
         choices=["postgres", "mysql", "plsql"],
         help="SQL dialect"
     )
+    parser.add_argument(
+        "--manifest",
+        nargs="?",
+        const=True,
+        metavar="PATH",
+        help="Only re-validate files changed since the last run recorded in PATH "
+             "(default .sqlidator-manifest.json); unchanged files replay stored failures"
+    )
+    parser.add_argument(
+        "--checkpoint",
+        nargs="?",
+        const=True,
+        metavar="PATH",
+        help="Periodically save the position of a --file run to PATH "
+             "(default .sqlidator-checkpoint.json) so it can be resumed"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted --file run from its checkpoint "
+             "(reports are appended to, not rewritten)"
+    )
     parser.add_argument("--ai", action="store_true", help="Enable AI suggestions")
-    parser.add_argument("--report", choices=["txt", "json", "csv"], help="Generate report file")
+    parser.add_argument(
+        "--ai-budget",
+        type=float,
+        default=300.0,
+        help="Total seconds the run may spend waiting on AI calls (0 = no limit)"
+    )
+    parser.add_argument(
+        "--ai-batch",
+        type=int,
+        metavar="TOKENS",
+        help="Pack report-mode AI requests into batched prompts of at most TOKENS tokens"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "jsonl", "quiet", "summary"],
+        default="text",
+        help="Stdout format: text (default, full per-query blocks), jsonl (one "
+             "compact record per statement), quiet (failures only, one line "
+             "each) or summary (aggregates at the end)"
+    )
+    parser.add_argument(
+        "--show-ast",
+        action="store_true",
+        help="Include the AST in --format jsonl records (off by default; "
+             "stringifying it costs more than validating)"
+    )
+    parser.add_argument(
+        "--report",
+        choices=["txt", "json", "csv", "sqlite", "summary"],
+        help="Generate report file (sqlite: append the run to a .db file, "
+             "summary: aggregate counts, error groups and latency percentiles)"
+    )
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="Report each distinct error once (grouped by query fingerprint, "
+             "error type and expected tokens) with its occurrence count"
+    )
     parser.add_argument("--output", type=str, help="Custom output filename (without extension)")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("OLD", "NEW"),
+        help="Diff two .jsonl / .db reports (audit.db#RUN_ID picks a run) "
+             "instead of validating"
+    )
 
     args = parser.parse_args()
 
+    # Machine-readable formats keep stdout for records only
+    text_output = args.format == "text"
+    info = sys.stdout if text_output else sys.stderr
+
+    if text_output:
+        show_banner()
+
+    if args.compare:
+        run_compare(*args.compare, output=args.output)
+        return
+
+    if args.manifest is True:
+        from engine.manifest import DEFAULT_MANIFEST
+        args.manifest = DEFAULT_MANIFEST
+
+    if args.watch:
+        run_watch(
+            args.watch,
+            args.dialect,
+            manifest_path=args.manifest,
+            interval=args.watch_interval,
+            jobs=args.jobs
+        )
+        return
+
     # ------------------------------------------------------
-    # Load Queries
+    # Load Queries (streamed, never held in memory as a whole)
     # ------------------------------------------------------
-    queries = []
+    collect_timings = "summary" in (args.report, args.format)
+    files = []
+
+    if args.changed_since:
+        from engine.git_diff import GitDiffError, changed_line_ranges, iter_validated_changes
+
+        try:
+            ranges = changed_line_ranges(args.changed_since, args.file)
+        except GitDiffError as e:
+            print(f"❌ {e}", file=info)
+            sys.exit(1)
+
+        files = list(ranges)
+        print(f"\n{len(files)} changed .sql files since {args.changed_since}", file=info)
+        validated = iter_validated_changes(ranges, args.dialect, collect_timings=collect_timings)
+
+    elif args.file:
+        from engine.batch import expand_inputs
+
+        try:
+            files = expand_inputs(args.file)
+        except FileNotFoundError as e:
+            print(f"❌ File not found: {e}", file=info)
+            sys.exit(1)
 
-    if args.file:
-        if not os.path.exists(args.file):
-            print("❌ File not found.")
+        if not files:
+            print("❌ No .sql files found.", file=info)
             sys.exit(1)
 
-        with open(args.file, "r", encoding="utf-8") as f:
-            content = f.read()
+        if len(files) > 1:
+            print(f"\nFound {len(files)} files", file=info)
+
+    elif args.stdin:
+        from engine.batch import iter_fd_chunks, iter_validated_stream
 
-        # Split queries by semicolon and strip whitespace
-        queries = [q.strip() + ';' for q in content.split(';') if q.strip()]
-        print(f"\nFound {len(queries)} queries in file")
+        validated = iter_validated_stream(
+            iter_fd_chunks(sys.stdin.fileno()),
+            args.dialect,
+            collect_timings=collect_timings
+        )
 
     elif args.query:
-        queries = [args.query.strip()]
+        query = args.query.strip()
+        statement = Statement(query, 0, 1, len(query))
+        timings = {} if collect_timings else None
+        validated = [(None, statement, validate_query(query, args.dialect, timings), timings)]
 
     else:
-        print("❌ Provide --query or --file")
+        print("❌ Provide --query, --file or --stdin", file=info)
         sys.exit(1)
 
-    all_results = []
+    # ------------------------------------------------------
+    # Checkpoint (resumable --file runs)
+    # ------------------------------------------------------
+    checkpoint = None
+    if args.checkpoint or args.resume:
+        from engine.checkpoint import DEFAULT_CHECKPOINT, Checkpoint, CheckpointError
+
+        if not args.file or args.changed_since or args.manifest:
+            print("❌ --checkpoint / --resume only apply to --file runs (without --manifest / --changed-since)", file=info)
+            sys.exit(1)
+
+        checkpoint = Checkpoint(
+            DEFAULT_CHECKPOINT if args.checkpoint in (None, True) else args.checkpoint,
+            files,
+            {
+                "dialect": args.dialect,
+                "format": args.format,
+                "report": args.report,
+                "output": args.output,
+                "dedup": args.dedup
+            }
+        )
+
+        if args.resume:
+            try:
+                checkpoint.load()
+            except CheckpointError as e:
+                print(f"❌ {e}", file=info)
+                sys.exit(1)
+            print(
+                f"Resuming after statement {checkpoint.index:,} "
+                f"({files[min(checkpoint.file, len(files) - 1)]})",
+                file=info
+            )
 
     # ------------------------------------------------------
-    # Process Each Query
+    # Progress (stderr, only on a terminal; per-query text output
+    # on the same terminal would scroll it away)
     # ------------------------------------------------------
-    for idx, query in enumerate(queries, 1):
-        print("\n" + "=" * 60)
-        print(f"QUERY {idx}:")
-        print(query)
-        print("=" * 60)
+    progress = None
+    if files and sys.stderr.isatty() and not (text_output and sys.stdout.isatty()):
+        progress = ProgressReporter(
+            files,
+            done_files=checkpoint.file if checkpoint is not None else 0,
+            done_offset=checkpoint.byte_offset if checkpoint is not None else 0
+        )
 
-        # Validate query
-        result = validate_query(query, args.dialect)
-        all_results.append(result)
+    manifest = None
+    if args.manifest and files and not args.changed_since:
+        from engine.manifest import Manifest, iter_incremental
 
-        # Print result
-        print("\nRESULT:")
-        print("-" * 60)
-        status = result.get("status")
-        print("Status  :", status.upper())
-        print("Dialect :", result.get("dialect"))
-        print("Message :", result.get("message"))
-        if status == "error":
-            print("Type    :", result.get("type"))
-
-        # Print AST if success
-        if status == "success":
-            print("\nAST:")
-            print("-" * 60)
-            ast = result.get("ast")
-            if isinstance(ast, list):
-                for j, stmt in enumerate(ast, 1):
-                    print(f"\nStatement {j}:")
-                    print(stmt)
-            else:
-                print(ast)
-
-        # AI suggestions
-        if args.ai:
-            print("\nAI SUGGESTIONS:")
-            print("-" * 60)
-            ai_result = get_ai_suggestion(query, result, mode="cli")
-            if ai_result and ai_result.get("ai_status") == "success":
-                print(ai_result.get("ai_message"))
-            else:
-                print("No AI suggestions available.")
-
-    # ------------------------------------------------------
-    # Report Generation
+        manifest = Manifest(args.manifest, args.dialect)
+
+    if manifest is not None:
+        validated = iter_incremental(
+            files,
+            manifest,
+            jobs=args.jobs,
+            collect_timings=collect_timings,
+            on_file_done=progress.file_done if progress else None,
+            # Records of every statement for reports; text output only
+            # shows the failures of unchanged files
+            replay_passing=bool(args.report) or not text_output
+        )
+
+    elif files and not args.changed_since:
+        from engine.batch import iter_validated_files
+
+        remaining, start = checkpoint.remaining() if checkpoint is not None else (files, None)
+        validated = iter_validated_files(
+            remaining,
+            args.dialect,
+            jobs=args.jobs,
+            collect_timings=collect_timings,
+            on_file_done=progress.file_done if progress else None,
+            start=start
+        )
+
+    # ------------------------------------------------------
+    # AI Pipeline (suggestions are fetched in the background)
+    # ------------------------------------------------------
+    pipeline = None
+
+    # Streaming input emits each result before reading on, so AI calls are
+    # made inline there (the pipe itself provides the buffering)
+    if args.ai:
+        from ai.groq_suggester import (
+            get_ai_suggestion,
+            get_ai_suggestions_batched,
+            configure_ai_run,
+            get_ai_stats
+        )
+        from ai.pipeline import needs_suggestion
+        from reports.writers import REPORT_AI_MODES
+
+        ai_mode = REPORT_AI_MODES.get(args.report, "cli")
+        configure_ai_run(budget_seconds=args.ai_budget or None)
+
+    if args.ai and not args.stdin:
+        from ai.pipeline import SuggestionPipeline
+
+        # One suggestion per query, in the report's format when reporting
+        fetch_batch = None
+        if args.ai_batch:
+            def fetch_batch(items, mode):
+                return get_ai_suggestions_batched(
+                    items,
+                    mode=mode,
+                    token_budget=args.ai_batch,
+                    max_workers=1
+                )
+
+        pipeline = SuggestionPipeline(
+            get_ai_suggestion,
+            mode=ai_mode,
+            workers=AI_WORKERS,
+            fetch_batch=fetch_batch,
+            batch_size=AI_BATCH_SIZE if args.ai_batch else 1
+        )
+
+    # ------------------------------------------------------
+    # Report Writer (records are written as they complete)
     # ------------------------------------------------------
+    writer = None
+    full_filename = None
+    resumed = checkpoint.reports if checkpoint is not None else {}
+
     if args.report:
-        report_ai_results = None
-        if args.ai:
-            # Generate AI suggestions for each query in report mode
-            report_ai_results = [
-                get_ai_suggestion(q, r, mode=args.report)
-                for q, r in zip(queries, all_results)
-            ]
-
-        # Generate report content
-        if args.report == "txt":
-            content = generate_text_report(queries, all_results, report_ai_results)
-            extension = "txt"
-        elif args.report == "json":
-            content = generate_json_report(queries, all_results, report_ai_results)
-            extension = "json"
-        elif args.report == "csv":
-            content = generate_csv_report(queries, all_results, report_ai_results)
-            extension = "csv"
-
-        filename = args.output if args.output else "sqlidator_report"
-        full_filename = f"{filename}.{extension}"
-
-        with open(full_filename, "w", encoding="utf-8") as f:
-            f.write(content)
-
-        print(f"\n📄 Report saved: {os.path.abspath(full_filename)}")
+        from reports.writers import open_report_writer, report_filename
+
+        full_filename = report_filename(args.report, args.output or "sqlidator_report")
+        writer = open_report_writer(args.report, full_filename, dedup=args.dedup, resume=resumed.get("report"))
+
+    # ------------------------------------------------------
+    # Stdout Writer (non-text formats, buffered)
+    # ------------------------------------------------------
+    stdout_writer = None
+    if not text_output:
+        stdout_writer = open_stdout_writer(args.format, resume=resumed.get("stdout"))
+
+    if writer is not None or stdout_writer is not None:
+        from reports.records import build_record
+
+    counts = {"success": 0, "error": 0}
+    first_index = 1
+    if checkpoint is not None:
+        counts.update(checkpoint.counts)
+        first_index = checkpoint.index + 1
+
+    locations = {}     # idx -> (source, statement, timings) until the result is emitted
+
+    def save_checkpoint():
+        # Writers flush first, so the report matches the saved position
+        reports = {}
+        if writer is not None:
+            reports["report"] = writer.checkpoint()
+        if stdout_writer is not None:
+            reports["stdout"] = stdout_writer.checkpoint()
+        checkpoint.save(reports)
+
+    def emit(idx, query, result, ai_result):
+        source, statement, timings = locations.pop(idx)
+        line = statement.line if statement else None
+        counts[result.get("status")] = counts.get(result.get("status"), 0) + 1
+        if progress is not None:
+            progress.statement_done(source, statement, result.get("status"))
+
+        if text_output:
+            location = f"{source}:{line}" if len(files) > 1 or args.stdin else None
+            print_result(idx, query, result, ai_result, show_ai=args.ai, location=location)
+
+        if writer is None and stdout_writer is None:
+            if checkpoint is not None:
+                advance_checkpoint(source, statement, idx)
+            return
+
+        record = build_record(
+            idx, query, result, ai_result,
+            source=source,
+            line=line,
+            timings=timings,
+            byte_end=statement.byte_end if collect_timings and statement else None
+        )
+        if writer is not None:
+            writer.write(record)
+        if stdout_writer is not None:
+            if args.show_ast and result.get("ast") is not None:
+                record = dict(record, ast=repr(result["ast"]))
+            stdout_writer.write(record)
+
+        if args.stdin:
+            # Tailing: show every result right away
+            (stdout_writer.fh if stdout_writer is not None else sys.stdout).flush()
+
+        if checkpoint is not None:
+            advance_checkpoint(source, statement, idx)
+
+    def advance_checkpoint(source, statement, idx):
+        # Only called once the statement's output is fully written
+        checkpoint.advance(source, statement, idx, counts)
+        if checkpoint.due():
+            save_checkpoint()
+
+    # Ctrl-C / SIGTERM stop a checkpointed run between two statements,
+    # never in the middle of writing a record
+    interrupted = []
+    if checkpoint is not None:
+        import signal
+
+        def request_stop(signum, frame):
+            interrupted.append(signum)
+
+        signal.signal(signal.SIGINT, request_stop)
+        signal.signal(signal.SIGTERM, request_stop)
+
+    if progress is not None:
+        progress.start()
+
+    # ------------------------------------------------------
+    # Process Each Query
+    # ------------------------------------------------------
+    stopped = False
+    try:
+        for idx, (source, statement, result, timings) in enumerate(validated, first_index):
+            if interrupted:
+                stopped = True
+                break
+
+            query = statement.text if statement else ""
+            locations[idx] = (source, statement, timings)
+
+            if pipeline is None:
+                ai_result = None
+                if args.ai and needs_suggestion(query, result):
+                    ai_result = get_ai_suggestion(query, result, ai_mode)
+                emit(idx, query, result, ai_result)
+                continue
+
+            pipeline.submit(query, result)
+            for seq, done_query, done_result, ai_result in pipeline.ready():
+                emit(seq + first_index, done_query, done_result, ai_result)
+
+        if pipeline is not None and not stopped:
+            for seq, done_query, done_result, ai_result in pipeline.drain():
+                if interrupted:
+                    stopped = True
+                    break
+                emit(seq + first_index, done_query, done_result, ai_result)
+    except Exception:
+        if checkpoint is not None:
+            # Everything emitted so far stays resumable
+            save_checkpoint()
+        raise
+
+    if progress is not None:
+        progress.finish()
+
+    if stopped:
+        save_checkpoint()
+        print(
+            f"\n⏸  Interrupted after statement {checkpoint.index:,}; "
+            f"checkpoint saved to {checkpoint.path} (continue with --resume)",
+            file=info
+        )
+        # Queued AI requests are dropped (daemon threads); their statements are redone on resume
+        sys.exit(130)
+
+    if manifest is not None:
+        # Passing statements of unchanged files that were not replayed
+        counts["success"] += manifest.skipped_passing
+
+    ai_stats = get_ai_stats() if args.ai else None
+
+    if stdout_writer is not None:
+        stdout_writer.close(ai_stats)
+
+    if args.format in ("text", "quiet"):
+        print(
+            f"\nValidated {counts['success'] + counts['error']} statements: "
+            f"{counts['success']} passed, {counts['error']} failed",
+            file=info
+        )
+
+    if manifest is not None:
+        manifest.save()
+        print(
+            f"Manifest: {manifest.validated_files} files validated, "
+            f"{manifest.reused_files} unchanged ({manifest.reused_statements} statements reused)",
+            file=info
+        )
+
+    # ------------------------------------------------------
+    # AI Service Summary
+    # ------------------------------------------------------
+    if args.ai and args.format != "summary":
+        print(
+            f"AI service: breaker {ai_stats['breaker_state']}, "
+            f"{ai_stats['successes']} ok / {ai_stats['failures']} failed / "
+            f"{ai_stats['rejected'] + ai_stats['budget_rejected']} skipped",
+            file=info
+        )
+
+    # ------------------------------------------------------
+    # Report Finalization
+    # ------------------------------------------------------
+    if writer is not None:
+        writer.close(ai_stats)
+        print(f"\n📄 Report saved: {os.path.abspath(full_filename)}", file=info)
+
+    if checkpoint is not None:
+        # The run completed: nothing left to resume
+        checkpoint.remove()
 
 
 if __name__ == "__main__":